@@ -31,7 +31,10 @@ except ImportError:
         return df
 
 from scripts.Phase2.context_analyzer import ContextAnalyzer
-from scripts.Phase2.context_analyzer import ContextAnalyzer
+from scripts.Phase2.yudor_fair_odds import (
+    MIN_LINE as YUDOR_MIN_LINE, MAX_LINE as YUDOR_MAX_LINE,
+    fair_odds_at_line as yudor_fair_odds_at_line, solve_optimal_line as solve_yudor_optimal_line
+)
 
 class AsianHandicapModel:
     """
@@ -128,41 +131,24 @@ class AsianHandicapModel:
             favorite = "away"
             fav_prob = norm_away
             
-        # 5. Moneyline Odds
-        moneyline = 100 / fav_prob if fav_prob > 0 else 999
-        
-        # 6. Scale by AH Line & Find Closest to 2.0
-        base_line = -0.5
-        lines_to_test = np.arange(-3.0, 3.25, 0.25)
-        
-        best_line = None
-        best_odds = None
-        min_diff = float('inf')
-        
-        all_lines = {}
+        # 5. Moneyline at -0.5 scaled ×1.15 / ×0.85 per 0.25 step (shared Yudor kernel)
+        lines_to_test = np.arange(YUDOR_MIN_LINE, YUDOR_MAX_LINE + 0.25, 0.25)
+        odds_per_line = yudor_fair_odds_at_line(fav_prob, lines_to_test)
+        suffix = "" if favorite == "home" else " (Away)"
+        all_lines = {f"AH {line}{suffix}": odds for line, odds in zip(lines_to_test, odds_per_line)}
+
+        # 6. Line Closest to 2.0 and its neighbours (closed form, no scan)
+        solution = solve_yudor_optimal_line(fav_prob)
+        neighbours = {
+            f"AH {solution[side + '_line']}{suffix}": float(solution[side + "_odds"])
+            for side in ("easier", "harder") if not np.isnan(solution[side + "_line"])
+        }
 
-        for line in lines_to_test:
-            # Steps calculation (same as before)
-            step_diff = (base_line - line) / 0.25 
-            
-            if step_diff > 0:
-                odds = moneyline * (1.15 ** step_diff)
-            else:
-                odds = moneyline * (0.85 ** abs(step_diff))
-            
-            line_key = f"AH {line}" if favorite == "home" else f"AH {line} (Away)"
-            all_lines[line_key] = odds
-            
-            diff = abs(odds - 2.0)
-            if diff < min_diff:
-                min_diff = diff
-                best_line = line
-                best_odds = odds
-                
         return {
             "fair_odds": all_lines,
-            "optimal_line": f"AH {best_line}" if favorite == "home" else f"AH {best_line} (Away)",
-            "optimal_odds": best_odds,
+            "optimal_line": f"AH {solution['line']}{suffix}",
+            "optimal_odds": float(solution["odds"]),
+            "neighbour_lines": neighbours,
             "favorite": favorite,
             "probabilities": {"home": norm_home, "draw": norm_draw, "away": norm_away}, # Standardized key
             "raw_probs": {"home": raw_home, "draw": raw_draw, "away": raw_away}
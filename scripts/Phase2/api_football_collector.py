@@ -1,9 +1,21 @@
-import requests
+import os
 import json
 import time
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 
+try:
+    from scripts.Phase2.http_client import get_http_client
+    from scripts.Phase2.quota_scheduler import QuotaScheduler, API_FOOTBALL_PRIORITIES
+    from scripts.Phase2.squad_cache import SquadCache
+    from scripts.Phase2.footystats_collector import normalize_team_name
+except ImportError:
+    from http_client import get_http_client
+    from quota_scheduler import QuotaScheduler, API_FOOTBALL_PRIORITIES
+    from squad_cache import SquadCache
+    from footystats_collector import normalize_team_name
+
 class APIFootballCollector:
     """
     Collector for API-Football (v3.football.api-sports.io).
@@ -29,6 +41,21 @@ class APIFootballCollector:
             'x-rapidapi-host': "v3.football.api-sports.io",
             'x-rapidapi-key': self.api_key
         }
+        self.http = get_http_client()
+        # Daily request budget (free plan: 100/day); low-value calls are skipped when it runs low
+        self.quota = QuotaScheduler(
+            "api_football",
+            daily_limit=int(os.getenv("API_FOOTBALL_DAILY_LIMIT", "100")),
+            priorities=API_FOOTBALL_PRIORITIES
+        )
+        # Ranked squads per (team, season), see get_key_players
+        self.squad_cache = SquadCache()
+        # (league, season, date) -> fixture list / normalized (home, away) index,
+        # shared by every match of a matchday (see resolve_fixtures)
+        self._fixture_lists: Dict[tuple, List[Dict]] = {}
+        self._fixture_index: Dict[tuple, Dict[tuple, Dict]] = {}
+        self._fixture_lock = threading.Lock()
+        self._fixture_key_locks: Dict[tuple, threading.Lock] = {}
 
     # Common Team Name Mappings (User Input -> API Name)
     TEAM_ALIASES = {
@@ -68,93 +95,186 @@ class APIFootballCollector:
             
         return False
 
-    def get_fixture_id(self, home_team: str, away_team: str, date: str, league_id: int = None, season: int = 2025) -> Optional[int]:
+    def _api_get(self, endpoint: str, params: Dict):
+        """
+        GET an API endpoint through the quota scheduler.
+        Returns None (without a request) when the call doesn't fit today's budget.
+        """
+        cassette = self.http.cassette
+        if cassette is not None and cassette.mode == "replay":
+            # Replayed responses cost nothing
+            return self.http.get(f"{self.BASE_URL}{endpoint}", headers=self.headers, params=params)
+
+        if not self.quota.allow(endpoint):
+            print(f"   ⏸️ Skipping {endpoint} (API-Football quota low: {self.quota.budget_left()} left)")
+            return None
+        response = self.http.get(f"{self.BASE_URL}{endpoint}", headers=self.headers, params=params)
+        self.quota.record(response.headers)
+        return response
+
+    @staticmethod
+    def _date_str(date: str) -> str:
+        """DD/MM/YYYY or YYYY-MM-DD -> YYYY-MM-DD"""
+        if "/" in date:
+            return datetime.strptime(date, "%d/%m/%Y").strftime("%Y-%m-%d")
+        return date
+
+    def _fetch_fixture_list(self, league_id: int, season: int, date_str: str) -> Optional[List[Dict]]:
+        """One /fixtures call for the league/season/date (date-only fallback). None on failure."""
+        try:
+            params = {"league": league_id, "season": season, "date": date_str}
+            resp = self._api_get("/fixtures", params)
+            if resp is None:
+                return None
+            d = resp.json()
+
+            # Fallback to date-only if needed
+            if resp.status_code != 200 or d.get("errors"):
+                params = {"date": date_str}
+                resp = self._api_get("/fixtures", params)
+                if resp is None:
+                    return None
+                d = resp.json()
+                if resp.status_code != 200 or d.get("errors"):
+                    return None
+
+            return d.get("response") or []
+        except Exception as e:
+            print(f"   ❌ Error fetching fixtures for {date_str}: {e}")
+            return None
+
+    def _fixtures_on(self, league_id: int, season: int, date_str: str) -> Dict[tuple, Dict]:
+        """
+        Normalized (home, away) -> fixture index for one date, fetched once per run.
+        Concurrent callers asking for the same date wait for a single request.
+        """
+        key = (league_id, season, date_str)
+        with self._fixture_lock:
+            if key in self._fixture_index:
+                return self._fixture_index[key]
+            key_lock = self._fixture_key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key in self._fixture_index:
+                return self._fixture_index[key]
+
+            print(f"   📅 Fetching API-Football fixtures for {date_str}...")
+            fixtures = self._fetch_fixture_list(league_id, season, date_str)
+            if fixtures is None:
+                # Not cached: a later match may retry
+                return {}
+
+            index = {}
+            for fixture in fixtures:
+                pair = (normalize_team_name(fixture["teams"]["home"]["name"]),
+                        normalize_team_name(fixture["teams"]["away"]["name"]))
+                index.setdefault(pair, fixture)
+            with self._fixture_lock:
+                self._fixture_lists[key] = fixtures
+                self._fixture_index[key] = index
+            return index
+
+    def _find_fixture(self, home_team: str, away_team: str, index: Dict[tuple, Dict]) -> Optional[Dict]:
+        """Exact normalized pair first, then the alias/substring matching of _match_teams."""
+        home, away = normalize_team_name(home_team), normalize_team_name(away_team)
+        fixture, swapped = index.get((home, away)), False
+        if fixture is None and (away, home) in index:
+            fixture, swapped = index[(away, home)], True
+
+        if fixture is None:
+            for candidate in index.values():
+                f_home = candidate["teams"]["home"]["name"]
+                f_away = candidate["teams"]["away"]["name"]
+                if self._match_teams(home_team, f_home) and self._match_teams(away_team, f_away):
+                    fixture = candidate
+                    break
+                if self._match_teams(home_team, f_away) and self._match_teams(away_team, f_home):
+                    fixture, swapped = candidate, True
+                    break
+
+        if fixture is None:
+            return None
+
+        fid = fixture["fixture"]["id"]
+        print(f"    -> Found Fixture ID: {fid}" + (" (Teams Swapped)" if swapped else ""))
+        return {"id": fid, "home_id": fixture["teams"]["home"]["id"], "away_id": fixture["teams"]["away"]["id"]}
+
+    def get_fixture_id(self, home_team: str, away_team: str, date: str, league_id: int = None, season: int = 2025) -> Optional[Dict]:
         """
         Search for a fixture ID by team names and date.
+
+        The requested date is tried first, then the next and previous day (timezone
+        differences). Each date's fixture list is fetched once and reused by every
+        other match on the same matchday.
         """
         try:
             # If league_id is not provided, try to infer or search broadly (but API requires parameters)
             # For now, default to Brasileirão (71) if not found or passed
             if not league_id:
-                league_id = 71 
-                
-            # Format date to YYYY-MM-DD
-            # Input might be DD/MM/YYYY or YYYY-MM-DD
-            if "/" in date:
-                dt = datetime.strptime(date, "%d/%m/%Y")
-                date_str = dt.strftime("%Y-%m-%d")
-            else:
-                date_str = date
-                
-            url = f"{self.BASE_URL}/fixtures"
-            
-            # Helper to search a specific date
-            def search_date(search_dt_str):
-                print(f"   🔎 Searching API-Football for {home_team} vs {away_team} on {search_dt_str}...")
-                params = {"league": league_id, "season": season, "date": search_dt_str}
-                resp = requests.get(url, headers=self.headers, params=params)
-                d = resp.json()
-                
-                # Fallback to date-only if needed
-                if resp.status_code != 200 or d.get("errors"):
-                    params = {"date": search_dt_str}
-                    resp = requests.get(url, headers=self.headers, params=params)
-                    d = resp.json()
-                    
-                if not d.get("response"):
-                    return None
-                    
-                for fixture in d["response"]:
-                    f_home = fixture["teams"]["home"]["name"]
-                    f_away = fixture["teams"]["away"]["name"]
-                    fid = fixture["fixture"]["id"]
-                    
-                    if self._match_teams(home_team, f_home) and self._match_teams(away_team, f_away):
-                        print(f"    -> Found Fixture ID: {fid}")
-                        return {"id": fid, "home_id": fixture["teams"]["home"]["id"], "away_id": fixture["teams"]["away"]["id"]}
-                    
-                    if self._match_teams(home_team, f_away) and self._match_teams(away_team, f_home):
-                        print(f"    -> Found Fixture ID: {fid} (Teams Swapped)")
-                        return {"id": fid, "home_id": fixture["teams"]["home"]["id"], "away_id": fixture["teams"]["away"]["id"]}
-                return None
+                league_id = 71
 
-            # 1. Try Requested Date
-            res = search_date(date_str)
-            if res: return res
-            
-            # 2. Try Next Day (Timezone +)
+            date_str = self._date_str(date)
             dt_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            next_day = (dt_obj + timedelta(days=1)).strftime("%Y-%m-%d")
-            print(f"   🔄 Checking next day ({next_day}) for timezone diff...")
-            res = search_date(next_day)
-            if res: return res
-            
-            # 3. Try Prev Day (Timezone -)
-            prev_day = (dt_obj - timedelta(days=1)).strftime("%Y-%m-%d")
-            print(f"   🔄 Checking prev day ({prev_day}) for timezone diff...")
-            res = search_date(prev_day)
-            if res: return res
-            
+            window = [
+                date_str,
+                (dt_obj + timedelta(days=1)).strftime("%Y-%m-%d"),  # Timezone +
+                (dt_obj - timedelta(days=1)).strftime("%Y-%m-%d"),  # Timezone -
+            ]
+
+            print(f"   🔎 Searching API-Football for {home_team} vs {away_team} on {date_str}...")
+            for search_dt_str in window:
+                res = self._find_fixture(home_team, away_team, self._fixtures_on(league_id, season, search_dt_str))
+                if res:
+                    return res
+
             print("   ⚠️ Match not found in +/- 1 day window.")
             return None
-            
+
         except Exception as e:
             print(f"   ❌ Error searching fixture: {e}")
             return None
 
+    def resolve_fixtures(self, matches: List[Dict], league_id: int = None, season: int = 2025) -> List[Optional[Dict]]:
+        """
+        Resolve the fixture of every match in a matchday.
+
+        Each distinct requested date is fetched once up front (one /fixtures call per
+        date instead of up to six per match); neighbouring days are only fetched for
+        matches not found on their own date.
+
+        Args:
+            matches: [{"home", "away", "date"}, ...]
+
+        Returns:
+            Fixture info ({"id", "home_id", "away_id"} or None) per match, in order
+        """
+        league_id = league_id or 71
+        dates = []
+        for m in matches:
+            try:
+                date_str = self._date_str(m["date"])
+            except ValueError:
+                continue
+            if date_str not in dates:
+                dates.append(date_str)
+        for date_str in dates:
+            self._fixtures_on(league_id, season, date_str)
+
+        return [self.get_fixture_id(m["home"], m["away"], m["date"], league_id=league_id, season=season)
+                for m in matches]
+
     def get_team_stats(self, team_id: int, league_id: int, season: int) -> Dict:
         """
         Get team statistics for the season (Form, Goals, etc.)
         """
-        url = f"{self.BASE_URL}/teams/statistics"
         params = {
             "team": team_id,
             "league": league_id,
             "season": season
         }
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            if response.status_code == 200:
+            response = self._api_get("/teams/statistics", params)
+            if response is not None and response.status_code == 200:
                 return response.json().get("response", {})
             return {}
         except Exception as e:
@@ -168,27 +288,22 @@ class APIFootballCollector:
         - Injuries (if available in lineups/events)
         - Predictions (API-Football specific)
         - Odds (Pre-match)
+
+        Calls run in priority order (predictions, injuries, then lineups) so the
+        most valuable ones still go out when the daily quota is nearly spent.
         """
         details = {}
+        calls = {
+            "lineups": "/fixtures/lineups",
+            "predictions": "/predictions",  # Stats/Advice
+            "injuries": "/injuries",
+        }
         
         try:
-            # 1. Lineups
-            url = f"{self.BASE_URL}/fixtures/lineups"
-            response = requests.get(url, headers=self.headers, params={"fixture": fixture_id})
-            if response.status_code == 200:
-                details["lineups"] = response.json().get("response", [])
-                
-            # 2. Predictions (Stats/Advice)
-            url = f"{self.BASE_URL}/predictions"
-            response = requests.get(url, headers=self.headers, params={"fixture": fixture_id})
-            if response.status_code == 200:
-                details["predictions"] = response.json().get("response", [])
-                
-            # 3. Injuries
-            url = f"{self.BASE_URL}/injuries"
-            response = requests.get(url, headers=self.headers, params={"fixture": fixture_id})
-            if response.status_code == 200:
-                details["injuries"] = response.json().get("response", [])
+            for key, endpoint in sorted(calls.items(), key=lambda item: self.quota.priority(item[1])):
+                response = self._api_get(endpoint, {"fixture": fixture_id})
+                if response is not None and response.status_code == 200:
+                    details[key] = response.json().get("response", [])
                 
             return details
             
@@ -196,34 +311,59 @@ class APIFootballCollector:
             print(f"   ❌ Error fetching details: {e}")
             return {}
 
-if __name__ == "__main__":
-    # Test
-    collector = APIFootballCollector()
-    fid = collector.get_fixture_id("Atletico Mineiro", "Flamengo", "2025-11-25", league_id=71, season=2025)
-    if fid:
-        print(f"Found Fixture ID: {fid}")
-        details = collector.get_fixture_details(fid)
-        print(f"Details keys: {details.keys()}")
-        if details.get("predictions"):
-            print(f"Prediction: {details['predictions'][0]['predictions']}")
-    else:
-        print("Fixture not found (expected for future/mock dates if not in API).")
-    def get_key_players(self, team_id: int, season: int = 2025) -> List[Dict]:
+    def get_key_players(self, team_id: int, season: int = 2025, top_n: Optional[int] = 5, refresh: bool = False) -> List[Dict]:
         """
         Fetches top players for a team based on rating/goals.
+
+        The ranked squad is kept in the squad cache, so after the first fetch (per
+        team/season, until the entry ages out) this is a slice of a cached list.
+        refresh=True forces a new /players download.
+        """
+        entry = self.squad_cache.get_entry(team_id, season)
+        if entry is not None and not refresh and self.squad_cache.is_fresh(entry):
+            return entry["players"][:top_n]
+
+        players = self._fetch_squad(team_id, season)
+        if not players:
+            # Request failed, skipped for quota or came back empty: a stale squad
+            # beats no squad, and an empty one is never cached
+            return entry["players"][:top_n] if entry else []
+
+        self.squad_cache.set(team_id, season, players)
+        return players[:top_n]
+
+    def refresh_squads(self, team_ids: List[int], season: int = 2025) -> Dict[int, int]:
+        """
+        Re-download the squads of team_ids (e.g. once a week before a round).
+        Returns team_id -> number of players cached.
+        """
+        refreshed = {}
+        for team_id in team_ids:
+            refreshed[team_id] = len(self.get_key_players(team_id, season, top_n=None, refresh=True))
+        return refreshed
+
+    def _fetch_squad(self, team_id: int, season: int) -> Optional[List[Dict]]:
+        """
+        Every player of the squad, ranked by Rating (desc) then Minutes (desc).
+        None on failure, including API errors reported with HTTP 200 (rate limit,
+        auth, plan) and empty responses.
         """
-        url = f"{self.BASE_URL}/players"
         params = {
             "team": team_id,
             "season": season
         }
         
         try:
-            resp = requests.get(url, headers=self.headers, params=params)
+            resp = self._api_get("/players", params)
+            if resp is None or resp.status_code != 200:
+                return None
             data = resp.json()
-            
+
+            if data.get("errors"):
+                print(f"    ⚠️ API-Football error fetching squad {team_id}: {data['errors']}")
+                return None
             if not data.get("response"):
-                return []
+                return None
                 
             players = []
             for item in data["response"]:
@@ -254,10 +394,21 @@ if __name__ == "__main__":
                 
             # Sort by Rating (desc) then Minutes (desc)
             players.sort(key=lambda x: (x["rating"], x["minutes"]), reverse=True)
-            
-            # Return top 5
-            return players[:5]
+            return players
             
         except Exception as e:
             print(f"    ⚠️ Error fetching key players: {e}")
-            return []
+            return None
+
+if __name__ == "__main__":
+    # Test
+    collector = APIFootballCollector()
+    fid = collector.get_fixture_id("Atletico Mineiro", "Flamengo", "2025-11-25", league_id=71, season=2025)
+    if fid:
+        print(f"Found Fixture ID: {fid}")
+        details = collector.get_fixture_details(fid)
+        print(f"Details keys: {details.keys()}")
+        if details.get("predictions"):
+            print(f"Prediction: {details['predictions'][0]['predictions']}")
+    else:
+        print("Fixture not found (expected for future/mock dates if not in API).")
@@ -0,0 +1,58 @@
+import time
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def run_message_batch(client, requests: List[Dict], poll_seconds: float = 30,
+                      max_wait: float = 24 * 3600,
+                      on_poll: Optional[Callable] = None) -> Dict[str, Dict]:
+    """
+    Submit Claude requests as one Message Batch, wait for it to end and collect the results.
+
+    Args:
+        client: Anthropic client (point base_url / ANTHROPIC_BASE_URL at a stub server to test)
+        requests: [{"custom_id": "...", "params": {model, max_tokens, system, messages}}]
+        poll_seconds: Seconds between status checks
+        max_wait: Give up (and cancel the batch) after this many seconds
+        on_poll: Optional callback receiving the batch object after each status check
+
+    Returns:
+        custom_id -> {"message": Message} for succeeded requests,
+        custom_id -> {"error": "..."} for errored / canceled / expired / missing ones
+    """
+    if not requests:
+        return {}
+
+    batch = client.messages.batches.create(requests=requests)
+    logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+
+    started = time.time()
+    while batch.processing_status != "ended":
+        if time.time() - started > max_wait:
+            logger.warning(f"Message batch {batch.id} still running after {max_wait}s - cancelling")
+            client.messages.batches.cancel(batch.id)
+            return {
+                req["custom_id"]: {"error": f"Batch {batch.id} timed out after {max_wait}s"}
+                for req in requests
+            }
+
+        time.sleep(poll_seconds)
+        batch = client.messages.batches.retrieve(batch.id)
+        if on_poll:
+            on_poll(batch)
+
+    results: Dict[str, Dict] = {}
+    for item in client.messages.batches.results(batch.id):
+        if item.result.type == "succeeded":
+            results[item.custom_id] = {"message": item.result.message}
+        elif item.result.type == "errored":
+            results[item.custom_id] = {"error": f"errored: {item.result.error}"}
+        else:
+            results[item.custom_id] = {"error": item.result.type}
+
+    for req in requests:
+        results.setdefault(req["custom_id"], {"error": "missing from batch results"})
+
+    return results
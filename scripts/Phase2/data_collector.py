@@ -1,4 +1,3 @@
-import requests
 import json
 import os
 import time
@@ -7,6 +6,11 @@ from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    from scripts.Phase2.http_client import get_http_client
+except ImportError:
+    from http_client import get_http_client
+
 class DataCollector:
     """
     Phase 2 Advanced Data Collector.
@@ -21,6 +25,7 @@ class DataCollector:
         }
         # Use the key from scraper.py or env
         self.serper_key = os.getenv("SERPER_API_KEY", "9fd24b439c206f3773506ab8eb39fabbd445c70a")
+        self.http = get_http_client()
 
     def serper_search(self, query: str, count: int = 5) -> List[str]:
         """Executes a Google Search via Serper API."""
@@ -29,7 +34,7 @@ class DataCollector:
         headers = {'X-API-KEY': self.serper_key, 'Content-Type': 'application/json'}
 
         try:
-            response = requests.post(url, headers=headers, data=payload, timeout=10)
+            response = self.http.post(url, headers=headers, data=payload, timeout=10)
             if response.status_code == 200:
                 results = response.json().get("organic", [])
                 return [r["link"] for r in results]
@@ -43,7 +48,7 @@ class DataCollector:
     def fetch_url_content(self, url: str) -> str:
         """Generic fetcher."""
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.http.get(url, headers=self.headers, timeout=15)
             if response.status_code == 200:
                 return response.text
         except Exception:
@@ -0,0 +1,127 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+
+class FootyStatsCache:
+    """
+    Season-scoped cache for FootyStats API responses.
+
+    FootyStats payloads (league-matches, league-tables, league-list) are the same
+    for every match of a season, so each (endpoint, params) pair is fetched once
+    and then served from memory, backed by JSON files on disk with a TTL.
+    The API key is never part of the cache key or the stored file.
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int = 6 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._memory: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_key(self, endpoint: str, params: Dict) -> str:
+        """Stable key from endpoint + params (excluding the API key)."""
+        clean = {k: v for k, v in sorted(params.items()) if k != "key"}
+        digest = hashlib.sha1(json.dumps(clean, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
+        season = clean.get("season_id", "all")
+        return f"{endpoint}_{season}_{digest}"
+
+    def _cache_path(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}.json"
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return (time.time() - fetched_at) < self.ttl_seconds
+
+    def get(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """Return cached payload or None (counts a hit or a miss)."""
+        cache_key = self._cache_key(endpoint, params)
+
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry and self._is_fresh(entry["fetched_at"]):
+                self.hits += 1
+                return entry["payload"]
+
+            path = self._cache_path(cache_key)
+            if path.exists():
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        entry = json.load(f)
+                    if self._is_fresh(entry.get("fetched_at", 0)):
+                        self._memory[cache_key] = entry
+                        self.hits += 1
+                        return entry["payload"]
+                except (json.JSONDecodeError, OSError, KeyError):
+                    pass
+
+            self.misses += 1
+            return None
+
+    def set(self, endpoint: str, params: Dict, payload: Dict):
+        """Store a successful payload in memory and on disk."""
+        cache_key = self._cache_key(endpoint, params)
+        entry = {
+            "endpoint": endpoint,
+            "params": {k: v for k, v in params.items() if k != "key"},
+            "fetched_at": time.time(),
+            "payload": payload
+        }
+
+        with self._lock:
+            self._memory[cache_key] = entry
+            tmp_path = self._cache_path(cache_key).with_suffix(".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, self._cache_path(cache_key))
+            except OSError:
+                # Disk store is best-effort; the in-memory copy still serves this run
+                pass
+
+    def get_or_fetch(self, endpoint: str, params: Dict, fetch: Callable[[], Dict]) -> Dict:
+        """
+        Return the cached payload, or call fetch() and cache its result.
+        Error payloads ("error" key, or "success": false) are returned but never cached.
+        Concurrent callers asking for the same key wait for a single fetch.
+        """
+        cache_key = self._cache_key(endpoint, params)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        with key_lock:
+            cached = self.get(endpoint, params)
+            if cached is not None:
+                return cached
+
+            payload = fetch()
+            if isinstance(payload, dict) and "error" not in payload and payload.get("success") is not False:
+                self.set(endpoint, params, payload)
+            return payload
+
+    def clear(self):
+        """Drop all cached payloads (memory and disk)."""
+        with self._lock:
+            self._memory.clear()
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for reporting."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": len(self._memory)
+        }
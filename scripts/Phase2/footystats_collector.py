@@ -1,9 +1,28 @@
-import requests
 import logging
+import threading
+import unicodedata
+from pathlib import Path
 from typing import Dict, Optional, List
 
+try:
+    from scripts.Phase2.http_client import get_http_client
+    from scripts.Phase2.footystats_cache import FootyStatsCache
+except ImportError:
+    from http_client import get_http_client
+    from footystats_cache import FootyStatsCache
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "footystats_cache"
+CACHE_TTL_SECONDS = 6 * 3600
+
+
+def normalize_team_name(name: str) -> str:
+    """Lowercase, strip accents and collapse whitespace ("São Paulo " -> "sao paulo")."""
+    name = unicodedata.normalize('NFKD', name or "").encode('ASCII', 'ignore').decode('ASCII')
+    return " ".join(name.lower().split())
+
+
 class FootyStatsCollector:
     """
     Collector for FootyStats API.
@@ -14,36 +33,63 @@ class FootyStatsCollector:
     # Mapping common league names to FootyStats names or IDs if needed
     # But dynamic search is better.
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_dir: Path = DEFAULT_CACHE_DIR,
+                 cache_ttl: int = CACHE_TTL_SECONDS):
         self.api_key = api_key
+        self.http = get_http_client()
+        # Season-scoped lookups (league list, season ids, league teams/matches) don't
+        # change within a run: served from memory, then disk, then the API
+        self.cache = FootyStatsCache(cache_dir, ttl_seconds=cache_ttl)
+        # season_id -> {normalized team name -> stats} / {(home, away) -> match}
+        self._team_index: Dict[int, Dict[str, Dict]] = {}
+        self._match_index: Dict[int, Dict[tuple, Dict]] = {}
+        # season_id -> substring-fallback hits; kept apart so the published
+        # indexes are never written to while other threads iterate them
+        self._team_aliases: Dict[int, Dict[str, Dict]] = {}
+        self._index_lock = threading.Lock()
         
     def get_season_id(self, league_name: str, season_year: int) -> Optional[int]:
         """
         Find the Season ID for a given league and year.
         Example: "Brazil Serie A", 2025 -> 14231
         """
+        params = {"league": league_name, "year": season_year}
+        result = self.cache.get_or_fetch(
+            "season-id", params, lambda: self._fetch_season_id(league_name, season_year)
+        )
+        return result.get("season_id")
+
+    def _fetch_season_id(self, league_name: str, season_year: int) -> Dict:
+        data = self.cache.get_or_fetch("league-list", {}, self._fetch_league_list)
+        if "error" in data:
+            return data
+
+        # Fuzzy match league name
+        # e.g. "Brasileirão" -> "Brazil Serie A"
+        target_name = league_name
+        if "Brasileirão" in league_name:
+            target_name = "Brazil Serie A"
+
+        for league in data['data']:
+            if target_name.lower() in league['name'].lower():
+                # Find season
+                for season in league['season']:
+                    if season['year'] == season_year:
+                        return {"season_id": season['id']}
+        return {"error": f"No season {season_year} for {league_name}"}
+
+    def _fetch_league_list(self) -> Dict:
         url = f"{self.BASE_URL}/league-list?key={self.api_key}"
         try:
-            response = requests.get(url)
+            response = self.http.get(url)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("success"):
-                    # Fuzzy match league name
-                    # e.g. "Brasileirão" -> "Brazil Serie A"
-                    target_name = league_name
-                    if "Brasileirão" in league_name:
-                        target_name = "Brazil Serie A"
-                        
-                    for league in data['data']:
-                        if target_name.lower() in league['name'].lower():
-                            # Find season
-                            for season in league['season']:
-                                if season['year'] == season_year:
-                                    return season['id']
-            return None
+                    return {"data": data['data']}
+            return {"error": f"HTTP {response.status_code}"}
         except Exception as e:
             logger.error(f"Error fetching season ID: {e}")
-            return None
+            return {"error": str(e)}
 
     def get_team_stats(self, season_id: int) -> Dict[str, Dict]:
         """
@@ -52,9 +98,15 @@ class FootyStatsCollector:
         This is more efficient than fetching per team if the API supports it.
         FootyStats has 'league-teams?key=X&season_id=Y&include=stats'
         """
+        result = self.cache.get_or_fetch(
+            "league-teams", {"season_id": season_id}, lambda: self._fetch_team_stats(season_id)
+        )
+        return result.get("teams", {})
+
+    def _fetch_team_stats(self, season_id: int) -> Dict:
         url = f"{self.BASE_URL}/league-teams?key={self.api_key}&season_id={season_id}&include=stats"
         try:
-            response = requests.get(url)
+            response = self.http.get(url)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("success"):
@@ -72,11 +124,41 @@ class FootyStatsCollector:
                             "failed_to_score": team.get('stats', {}).get('failed_to_score_percentage_overall'),
                             "btts": team.get('stats', {}).get('btts_percentage_overall')
                         }
-                    return teams_map
-            return {}
+                    return {"teams": teams_map}
+            return {"error": f"HTTP {response.status_code}"}
         except Exception as e:
             logger.error(f"Error fetching team stats: {e}")
-            return {}
+            return {"error": str(e)}
+
+    def find_team_stats(self, season_id: int, team_name: str) -> Optional[Dict]:
+        """
+        Stats entry for one team, via a normalized-name index built once per season.
+        Falls back to a substring match ("Atletico-MG" vs "Atlético Mineiro" style
+        differences) when there is no exact normalized hit.
+        """
+        index = self._team_index.get(season_id)
+        if index is None:
+            teams = self.get_team_stats(season_id)
+            index = {normalize_team_name(name): stats for name, stats in teams.items()}
+            if index:
+                with self._index_lock:
+                    self._team_index[season_id] = index
+
+        target = normalize_team_name(team_name)
+        if not target:
+            return None
+        stats = index.get(target)
+        if stats is not None:
+            return stats
+
+        with self._index_lock:
+            stats = self._team_aliases.get(season_id, {}).get(target)
+        if stats is None:
+            stats = next((s for name, s in index.items() if target in name or name in target), None)
+            if stats is not None:
+                with self._index_lock:
+                    self._team_aliases.setdefault(season_id, {})[target] = stats
+        return stats
 
     def get_league_tables(self, season_id: int) -> Dict:
         """
@@ -84,7 +166,7 @@ class FootyStatsCollector:
         """
         url = f"{self.BASE_URL}/league-tables?key={self.api_key}&season_id={season_id}"
         try:
-            response = requests.get(url)
+            response = self.http.get(url)
             if response.status_code == 200:
                 return response.json().get("data", {})
             return {}
@@ -109,14 +191,43 @@ class FootyStatsCollector:
 
     def get_matches_for_season(self, season_id: int) -> List[Dict]:
         """Get all matches for a season."""
+        result = self.cache.get_or_fetch(
+            "league-matches", {"season_id": season_id}, lambda: self._fetch_matches_for_season(season_id)
+        )
+        return result.get("data", [])
+
+    def _fetch_matches_for_season(self, season_id: int) -> Dict:
         url = f"{self.BASE_URL}/league-matches?key={self.api_key}&season_id={season_id}"
         try:
-            response = requests.get(url)
+            response = self.http.get(url)
             if response.status_code == 200:
-                return response.json().get("data", [])
-        except Exception:
-            pass
-        return []
+                return {"data": response.json().get("data", [])}
+            return {"error": f"HTTP {response.status_code}"}
+        except Exception as e:
+            return {"error": str(e)}
+
+    def find_match(self, season_id: int, home_team: str, away_team: str) -> Optional[Dict]:
+        """
+        Season match for a home/away pair, via a normalized (home, away) index built
+        once per season. Falls back to a substring match on both names.
+        """
+        index = self._match_index.get(season_id)
+        if index is None:
+            index = {}
+            for match in self.get_matches_for_season(season_id):
+                pair = (normalize_team_name(match.get("home_name", "")),
+                        normalize_team_name(match.get("away_name", "")))
+                index.setdefault(pair, match)
+            if index:
+                with self._index_lock:
+                    self._match_index[season_id] = index
+
+        home, away = normalize_team_name(home_team), normalize_team_name(away_team)
+        match = index.get((home, away))
+        if match is None:
+            match = next((m for (m_home, m_away), m in index.items()
+                          if (home in m_home or m_home in home) and (away in m_away or m_away in away)), None)
+        return match
 
     def get_match_lineups(self, match_id: int) -> Dict:
         """
@@ -125,7 +236,7 @@ class FootyStatsCollector:
         """
         url = f"{self.BASE_URL}/match?key={self.api_key}&match_id={match_id}"
         try:
-            response = requests.get(url)
+            response = self.http.get(url)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("success"):
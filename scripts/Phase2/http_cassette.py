@@ -0,0 +1,144 @@
+import os
+import re
+import json
+import base64
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Query/body fields that carry credentials - never part of the key or the stored file
+SECRET_PARAMS = {"key", "api_key", "apikey", "token", "access_token"}
+
+# Response headers worth keeping (content handling + API quota bookkeeping)
+KEPT_HEADERS = ("content-type", "content-encoding", "retry-after")
+KEPT_HEADER_PREFIXES = ("x-ratelimit", "x-requests")
+
+MODES = ("record", "replay")
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """Replay mode found no recorded response for a request (treated like being offline)."""
+
+
+class HTTPCassette:
+    """
+    Record/replay store for HTTP responses.
+
+    Every request is reduced to a normalized key (method, scheme://host/path,
+    sorted query params, body) with credentials stripped, and its response is
+    saved as one JSON file per request under <directory>/<host>/.
+
+    - record: requests go to the network and each response is written out
+    - replay: responses come only from the files; a missing one raises CassetteMiss
+    """
+
+    def __init__(self, directory, mode: str = "replay"):
+        if mode not in MODES:
+            raise ValueError(f"Cassette mode must be one of {MODES}, got {mode!r}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.replayed = 0
+        self.missed = 0
+
+    @staticmethod
+    def normalize_request(method: str, url: str, params=None, data=None, json_body=None) -> Dict:
+        """Canonical, credential-free description of a request."""
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        if params:
+            items = params.items() if isinstance(params, dict) else params
+            query.extend((str(k), str(v)) for k, v in items if v is not None)
+        query = sorted((k, v) for k, v in query if k.lower() not in SECRET_PARAMS)
+
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body, sort_keys=True, ensure_ascii=False)
+        elif data is not None:
+            body = data.decode("utf-8", "replace") if isinstance(data, bytes) else str(data)
+            try:
+                body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False)
+            except ValueError:
+                pass
+
+        return {
+            "method": method.upper(),
+            "url": f"{parts.scheme}://{(parts.hostname or '').lower()}{parts.path or '/'}",
+            "query": query,
+            "body": body,
+        }
+
+    def _path_for(self, request: Dict) -> Path:
+        digest = hashlib.sha1(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        parts = urlsplit(request["url"])
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", parts.path).strip("_")[:60] or "root"
+        return self.directory / (parts.hostname or "unknown") / f"{request['method']}_{slug}_{digest}.json"
+
+    def load(self, request: Dict) -> requests.Response:
+        """Rebuild the recorded response for a normalized request."""
+        path = self._path_for(request)
+        if not path.exists():
+            with self._lock:
+                self.missed += 1
+            logger.warning(f"Cassette miss: {request['method']} {request['url']} {request['query']}")
+            raise CassetteMiss(f"No recorded response for {request['method']} {request['url']} ({path.name})")
+
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.url = entry.get("url", request["url"])
+        response.encoding = entry.get("encoding") or "utf-8"
+        if entry.get("body_base64") is not None:
+            response._content = base64.b64decode(entry["body_base64"])
+        else:
+            response._content = entry.get("body", "").encode(response.encoding)
+
+        with self._lock:
+            self.replayed += 1
+        return response
+
+    def save(self, request: Dict, response: requests.Response):
+        """Store a live response (best-effort, atomic per file)."""
+        headers = {
+            k: v for k, v in response.headers.items()
+            if k.lower() in KEPT_HEADERS or k.lower().startswith(KEPT_HEADER_PREFIXES)
+        }
+        entry = {
+            "request": request,
+            "status_code": response.status_code,
+            "url": request["url"],
+            "headers": headers,
+            "encoding": response.encoding,
+        }
+        try:
+            entry["body"] = response.content.decode(response.encoding or "utf-8")
+        except (UnicodeDecodeError, LookupError):
+            entry["body_base64"] = base64.b64encode(response.content).decode("ascii")
+
+        path = self._path_for(request)
+        with self._lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, indent=1, ensure_ascii=False)
+                os.replace(tmp_path, path)
+                self.recorded += 1
+            except OSError as e:
+                logger.warning(f"Could not record {request['url']}: {e}")
+
+    def stats(self) -> Dict:
+        return {"mode": self.mode, "recorded": self.recorded, "replayed": self.replayed, "missed": self.missed}
@@ -0,0 +1,185 @@
+import os
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from scripts.Phase2.http_cassette import HTTPCassette
+except ImportError:
+    from http_cassette import HTTPCassette
+
+logger = logging.getLogger(__name__)
+
+# Default timeout (seconds) per host; anything not listed uses DEFAULT_TIMEOUT
+HOST_TIMEOUTS = {
+    "api.footystats.org": 30,
+    "api.football-data-api.com": 30,
+    "v3.football.api-sports.io": 20,
+    "google.serper.dev": 20,
+}
+
+# Max requests per second per host (hosts not listed are not throttled)
+HOST_RATE_LIMITS = {
+    "api.footystats.org": 2.0,
+    "api.football-data-api.com": 2.0,
+    "v3.football.api-sports.io": 5.0,
+    "google.serper.dev": 5.0,
+}
+
+DEFAULT_TIMEOUT = 15
+DEFAULT_CASSETTE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "cassettes"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Longest Retry-After (seconds) honoured before a retry; larger values are clamped
+MAX_RETRY_AFTER = 60
+
+
+class CappedRetry(Retry):
+    """urllib3 Retry that honours Retry-After, but never sleeps longer than max_retry_after."""
+
+    def __init__(self, *args, max_retry_after: float = MAX_RETRY_AFTER, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+class HTTPClient:
+    """
+    Shared HTTP client for all collectors.
+
+    - One keep-alive requests.Session (and connection pool) per host
+    - Retries with exponential backoff on 429 / 5xx and connection errors,
+      honouring Retry-After up to max_retry_after seconds
+    - Per-host rate limit (minimum spacing between requests)
+    - Per-host default timeout (a timeout= argument still wins)
+
+    After the retries run out the last response is returned as-is, so callers keep
+    their own status_code checks.
+
+    With a cassette attached (see use_cassette / YUDOR_HTTP_CASSETTE) responses are
+    recorded to, or replayed from, disk instead of hitting the network.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 1.0, pool_size: int = 10,
+                 host_timeouts: Optional[Dict[str, float]] = None,
+                 host_rate_limits: Optional[Dict[str, float]] = None,
+                 default_timeout: float = DEFAULT_TIMEOUT,
+                 max_retry_after: float = MAX_RETRY_AFTER):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_retry_after = max_retry_after
+        self.pool_size = pool_size
+        self.host_timeouts = dict(HOST_TIMEOUTS if host_timeouts is None else host_timeouts)
+        self.host_rate_limits = dict(HOST_RATE_LIMITS if host_rate_limits is None else host_rate_limits)
+        self.default_timeout = default_timeout
+        self._sessions: Dict[str, requests.Session] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.cassette: Optional[HTTPCassette] = None
+
+    def _session(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                retry = CappedRetry(
+                    total=self.max_retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=frozenset(["GET", "POST", "HEAD"]),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                    max_retry_after=self.max_retry_after
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _throttle(self, host: str):
+        """Wait until this host's next request slot."""
+        rate = self.host_rate_limits.get(host)
+        if not rate:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + 1.0 / rate
+        if slot > now:
+            time.sleep(slot - now)
+
+    def use_cassette(self, directory, mode: str = "replay") -> HTTPCassette:
+        """Record every response to directory, or replay them from it (offline)."""
+        self.cassette = HTTPCassette(directory, mode)
+        return self.cassette
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        cassette = self.cassette
+        if cassette is not None:
+            recorded_request = cassette.normalize_request(
+                method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+            )
+            if cassette.mode == "replay":
+                return cassette.load(recorded_request)
+
+        host = urlsplit(url).hostname or ""
+        kwargs.setdefault("timeout", self.host_timeouts.get(host, self.default_timeout))
+        self._throttle(host)
+        response = self._session(host).request(method, url, **kwargs)
+
+        if cassette is not None:
+            cassette.save(recorded_request, response)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_shared_client: Optional[HTTPClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """
+    Process-wide HTTPClient shared by every collector.
+
+    YUDOR_HTTP_CASSETTE=record|replay (with YUDOR_CASSETTE_DIR, default
+    data/cassettes) attaches a cassette when the client is first created.
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HTTPClient()
+            mode = os.getenv("YUDOR_HTTP_CASSETTE", "").strip().lower()
+            if mode:
+                directory = os.getenv("YUDOR_CASSETTE_DIR", str(DEFAULT_CASSETTE_DIR))
+                _shared_client.use_cassette(directory, mode)
+                logger.info(f"HTTP cassette: {mode} ({directory})")
+        return _shared_client
@@ -4,7 +4,6 @@ FotMob Scraper - Formation and Lineup Data
 Provides Q6 (formations) data for Yudor v5.3 system
 """
 
-import requests
 import json
 import time
 from datetime import datetime
@@ -13,6 +12,11 @@ import logging
 import re
 from bs4 import BeautifulSoup
 
+try:
+    from scripts.Phase2.http_client import get_http_client
+except ImportError:
+    from http_client import get_http_client
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -52,8 +56,7 @@ class FotMobScraper:
             delay: Delay between requests in seconds (default: 2.0)
         """
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
+        self.http = get_http_client()
 
     def search_match(self, home_team: str, away_team: str, date: str, league: str = None) -> Optional[Dict]:
         """
@@ -73,7 +76,7 @@ class FotMobScraper:
             search_url = f"{self.BASE_URL}/search/suggest"
             params = {'term': home_team, 'lang': 'en'}
 
-            response = self.session.get(search_url, params=params, timeout=10)
+            response = self.http.get(search_url, params=params, headers=self.HEADERS, timeout=10)
 
             if response.status_code != 200:
                 logger.warning(f"FotMob search failed: {response.status_code}")
@@ -130,7 +133,7 @@ class FotMobScraper:
         """
         try:
             url = f"https://www.fotmob.com/teams/{team_id}/overview"
-            response = self.session.get(url, timeout=10)
+            response = self.http.get(url, headers=self.HEADERS, timeout=10)
             
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch team page {url}: {response.status_code}")
@@ -222,7 +225,7 @@ class FotMobScraper:
                     url = f"https://www.fotmob.com/matches/match/{match_id}"
                 logger.warning(f"Using fallback URL (likely to fail): {url}")
             
-            response = self.session.get(url, timeout=10)
+            response = self.http.get(url, headers=self.HEADERS, timeout=10)
 
             if response.status_code != 200:
                 logger.warning(f"FotMob match page failed: {response.status_code}")
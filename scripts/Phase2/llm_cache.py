@@ -0,0 +1,174 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def fingerprint_prompts(prompts_dir: Path) -> str:
+    """
+    Hash of every file under prompts_dir (path + content).
+    Editing, adding or removing a prompt file changes the fingerprint.
+    """
+    prompts_dir = Path(prompts_dir)
+    digest = hashlib.sha256()
+    if prompts_dir.exists():
+        for path in sorted(p for p in prompts_dir.rglob("*") if p.is_file()):
+            digest.update(str(path.relative_to(prompts_dir)).encode("utf-8"))
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                continue
+    return digest.hexdigest()[:16]
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache for Claude responses.
+
+    Each response is stored under sha256(model, system prompt, user message,
+    max_tokens), so an interrupted batch re-run, or a game that appears twice in a
+    slate, is answered from disk instead of paying for the same call again.
+    Callers only store responses they could use (see YudorOrchestrator.call_claude),
+    so a truncated or unparsable answer is asked again instead of replayed.
+    Entries are tagged with the prompts/ fingerprint; when a prompt file changes,
+    entries written under the old fingerprint are dropped. The store is bounded by
+    max_bytes and evicts least recently used entries first.
+    """
+
+    def __init__(self, cache_dir: Path, prompts_fingerprint: str = "",
+                 max_bytes: int = 200 * 1024 * 1024, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.prompts_fingerprint = prompts_fingerprint
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = {}  # key -> {"size": bytes, "used": last access}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load_index()
+
+    def _cache_key(self, model: str, system: str, user: str, max_tokens: int) -> str:
+        payload = json.dumps([model, system, user, max_tokens], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}.json"
+
+    def _load_index(self):
+        """Scan the disk store, dropping entries written under another prompts fingerprint."""
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+                if entry.get("prompts_fingerprint") != self.prompts_fingerprint:
+                    path.unlink()
+                    continue
+                stat = path.stat()
+                self._index[path.stem] = {"size": stat.st_size, "used": stat.st_mtime}
+            except (json.JSONDecodeError, OSError):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the store fits in max_bytes."""
+        total = sum(meta["size"] for meta in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for cache_key, meta in sorted(self._index.items(), key=lambda item: item[1]["used"]):
+            if total <= self.max_bytes:
+                break
+            try:
+                self._cache_path(cache_key).unlink()
+            except OSError:
+                pass
+            total -= meta["size"]
+            del self._index[cache_key]
+            self.evictions += 1
+
+    def get(self, model: str, system: str, user: str, max_tokens: int) -> Optional[str]:
+        """Return the cached response text or None (counts a hit or a miss)."""
+        if not self.enabled:
+            return None
+
+        cache_key = self._cache_key(model, system, user, max_tokens)
+        with self._lock:
+            if cache_key in self._index:
+                path = self._cache_path(cache_key)
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        entry = json.load(f)
+                    now = time.time()
+                    os.utime(path, (now, now))
+                    self._index[cache_key]["used"] = now
+                    self.hits += 1
+                    return entry["response"]
+                except (json.JSONDecodeError, OSError, KeyError):
+                    self._index.pop(cache_key, None)
+
+            self.misses += 1
+            return None
+
+    def set(self, model: str, system: str, user: str, max_tokens: int, response: str):
+        """Store a response text on disk (best-effort)."""
+        if not self.enabled:
+            return
+
+        cache_key = self._cache_key(model, system, user, max_tokens)
+        entry = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "prompts_fingerprint": self.prompts_fingerprint,
+            "created_at": time.time(),
+            "response": response
+        }
+
+        with self._lock:
+            path = self._cache_path(cache_key)
+            tmp_path = path.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+                self._index[cache_key] = {"size": path.stat().st_size, "used": time.time()}
+                self._evict()
+            except OSError:
+                pass
+
+    def delete(self, model: str, system: str, user: str, max_tokens: int):
+        """Drop one cached response (e.g. one its caller could not use)."""
+        cache_key = self._cache_key(model, system, user, max_tokens)
+        with self._lock:
+            if self._index.pop(cache_key, None) is not None:
+                try:
+                    self._cache_path(cache_key).unlink()
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock:
+            for cache_key in list(self._index):
+                try:
+                    self._cache_path(cache_key).unlink()
+                except OSError:
+                    pass
+            self._index.clear()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for reporting."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": len(self._index),
+            "evictions": self.evictions
+        }
@@ -3,6 +3,7 @@ import os
 import json
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from pathlib import Path
 
@@ -23,6 +24,7 @@ from scripts.Phase2.ah_value_finder import AsianHandicapModel
 from scripts.Phase2.q_scorers import get_all_q_scores
 from scripts.Phase2.medallion_score_engine import MedallionScoreEngine
 from scripts.Phase2.poisson_ah_model import PoissonAHModel, create_team_metrics_from_data
+from scripts.Phase2.http_client import get_http_client
 
 class Phase2Orchestrator:
     """
@@ -37,7 +39,11 @@ class Phase2Orchestrator:
     7. Context Analysis -> Sentiment Score
     8. Modeling -> AH Value Finder (Poisson + Adjustments)
     """
-    
+
+    MATCH_WORKERS = 4  # Matches collected concurrently (--workers)
+    # Default to Brasileirão (71) and 2025 (or 2024 if 2025 fails in API logic)
+    API_FOOTBALL_LEAGUE_ID = 71
+
     def __init__(self, league: str = "Brasileirão", season: str = "2025"):
         print(f"🚀 Initializing Phase 2 Orchestrator ({league} {season})...")
         self.league = league
@@ -141,436 +147,518 @@ class Phase2Orchestrator:
             "reasons": reasons
         }
 
-    def process_matches(self, matches: List[Dict]):
+    def process_matches(self, matches: List[Dict], workers: int = None):
+        """
+        Run the pipeline for every match.
+
+        The I/O stages (news, hard stats, formations, API-Football, FootyStats) run
+        concurrently per match, and up to `workers` matches are collected ahead of
+        the one being analyzed. Analysis (Q-scores, Medallion, Poisson, confidence,
+        model, ledger/JSON writes) stays sequential and in input order.
+        """
         results = []
         print(f"DEBUG: Received matches: {matches}")
         print(f"\n📋 Processing {len(matches)} matches...")
-        
-        for i, m in enumerate(matches):
-            home = m["home"]
-            away = m["away"]
-            date = m["date"]
-            
-            print(f"\n{'='*60}")
-            print(f"⚽ Match {i+1}/{len(matches)}: {home} vs {away}")
-            print(f"{'='*60}")
-            
-            match_result = {
-                "match_info": m,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "data": {},
-                "analysis": {},
-                "value_bets": []
-            }
-            
-            # --- STEP 1: Qualitative Data (News) ---
-            print("\n[1] Collecting News & Context...")
-            news_data = self.data_collector.collect_data(home, away, date)
-            match_result["data"]["news"] = news_data
-            
-            # Analyze Sentiment
-            full_text = ""
-            for team in ["home", "away"]:
-                for item in news_data["news"].get(team, []):
-                    full_text += item.get("title", "") + ". "
-            for item in news_data["news"].get("match", []):
-                full_text += item.get("title", "") + ". " + item.get("content", "") + ". "
-                
-            sentiment_score = self.context_analyzer.analyze_text(full_text)
-            match_result["analysis"]["sentiment_score"] = sentiment_score
-            print(f"    -> Sentiment Score: {sentiment_score:.2f}")
-            
-            # --- STEP 2: Quantitative Data (Hard Stats) ---
-            if self.has_hard_stats:
-                print("\n[2] Collecting Hard Stats (FBref/FotMob)...")
-                try:
-                    home_stats = self.stats_collector.get_all_team_stats(home)
-                    away_stats = self.stats_collector.get_all_team_stats(away)
-                    match_result["data"]["home_stats"] = home_stats
-                    match_result["data"]["away_stats"] = away_stats
-                except Exception as e:
-                    print(f"    ⚠️ Error fetching team stats: {e}")
-                
+
+        # Resolve every API-Football fixture from one fixture list per matchday date
+        fixtures = self.api_football.resolve_fixtures(
+            matches, league_id=self.API_FOOTBALL_LEAGUE_ID, season=self._season_year()
+        )
+
+        workers = max(1, workers or self.MATCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            collecting = [pool.submit(self._collect_match, m, fixture) for m, fixture in zip(matches, fixtures)]
+
+            for i, (m, future) in enumerate(zip(matches, collecting)):
+                results.append(self._analyze_match(i, len(matches), m, future.result()))
+
+        return results
+
+    def _season_year(self) -> int:
+        return int(self.season) if self.season.isdigit() else 2025
+
+    def _collect_match(self, m: Dict, fixture_info: Dict = None) -> Dict:
+        """
+        Run the independent data collection stages of one match concurrently.
+
+        Dependencies inside a stage stay sequential (fixture id before fixture
+        details / team stats, season id before FootyStats team stats).
+        fixture_info is the already-resolved API-Football fixture (or None).
+
+        Returns:
+            stage name -> result, or the exception the stage raised
+        """
+        home, away, date = m["home"], m["away"], m["date"]
+        season_year = self._season_year()
+
+        stages = {
+            "news": lambda: self.data_collector.collect_data(home, away, date),
+            "api_football": lambda: self._collect_api_football(fixture_info, season_year),
+            "footystats": lambda: self._collect_footystats(home, away, season_year),
+        }
+        if self.has_hard_stats:
+            stages["hard_stats"] = lambda: (self.stats_collector.get_all_team_stats(home),
+                                            self.stats_collector.get_all_team_stats(away))
+            stages["formations"] = lambda: self.lineup_collector.get_formations(home, away, date, self.league)
+
+        collected = {}
+        with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+            futures = {name: pool.submit(stage) for name, stage in stages.items()}
+            for name, future in futures.items():
                 try:
-                    formations = self.lineup_collector.get_formations(home, away, date, self.league)
-                    match_result["data"]["lineups"] = formations
-                    print(f"    -> Formations: {formations.get('home_formation')} vs {formations.get('away_formation')}")
+                    collected[name] = future.result()
                 except Exception as e:
-                    print(f"    ⚠️ Error fetching lineups: {e}")
-            
-            # --- STEP 3: API-Football Data ---
-            print("\n[3] Fetching API-Football Data...")
-            # Default to Brasileirão (71) and 2025 (or 2024 if 2025 fails in API logic)
-            league_id = 71 
-            season_year = int(self.season) if self.season.isdigit() else 2025
-            api_details = {}
-            
-            fixture_info = self.api_football.get_fixture_id(home, away, date, league_id=league_id, season=season_year)
+                    collected[name] = e
+        return collected
+
+    def _collect_api_football(self, fixture_info: Dict, season_year: int) -> Dict:
+        """Fixture details and both teams' stats in parallel."""
+        league_id = self.API_FOOTBALL_LEAGUE_ID
+        if not fixture_info:
+            return {"fixture": None}
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            details = pool.submit(self.api_football.get_fixture_details, fixture_info["id"])
+            home_stats = pool.submit(self.api_football.get_team_stats, fixture_info["home_id"], league_id, season_year)
+            away_stats = pool.submit(self.api_football.get_team_stats, fixture_info["away_id"], league_id, season_year)
+            return {
+                "fixture": fixture_info,
+                "details": details.result(),
+                "home_stats": home_stats.result(),
+                "away_stats": away_stats.result()
+            }
+
+    def _collect_footystats(self, home: str, away: str, season_year: int) -> Dict:
+        """Season id, then both teams' stats (season lookups are cached by the collector)."""
+        season_id = self.footystats.get_season_id(self.league, season_year)
+        if not season_id:
+            return {"season_id": None}
+        return {
+            "season_id": season_id,
+            "home": self.footystats.find_team_stats(season_id, home),
+            "away": self.footystats.find_team_stats(season_id, away)
+        }
+
+    @staticmethod
+    def _stage_result(collected: Dict, name: str):
+        """Return a collected stage result, re-raising the stage's exception."""
+        result = collected[name]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _analyze_match(self, i: int, total: int, m: Dict, collected: Dict) -> Dict:
+        """Merge the collected data for one match and run the analysis steps."""
+        home = m["home"]
+        away = m["away"]
+        date = m["date"]
+        
+        print(f"\n{'='*60}")
+        print(f"⚽ Match {i+1}/{total}: {home} vs {away}")
+        print(f"{'='*60}")
+        
+        match_result = {
+            "match_info": m,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "data": {},
+            "analysis": {},
+            "value_bets": []
+        }
+        
+        # --- STEP 1: Qualitative Data (News) ---
+        print("\n[1] Collecting News & Context...")
+        news_data = self._stage_result(collected, "news")
+        match_result["data"]["news"] = news_data
+        
+        # Analyze Sentiment
+        full_text = ""
+        for team in ["home", "away"]:
+            for item in news_data["news"].get(team, []):
+                full_text += item.get("title", "") + ". "
+        for item in news_data["news"].get("match", []):
+            full_text += item.get("title", "") + ". " + item.get("content", "") + ". "
+            
+        sentiment_score = self.context_analyzer.analyze_text(full_text)
+        match_result["analysis"]["sentiment_score"] = sentiment_score
+        print(f"    -> Sentiment Score: {sentiment_score:.2f}")
+        
+        # --- STEP 2: Quantitative Data (Hard Stats) ---
+        if self.has_hard_stats:
+            print("\n[2] Collecting Hard Stats (FBref/FotMob)...")
+            try:
+                home_stats, away_stats = self._stage_result(collected, "hard_stats")
+                match_result["data"]["home_stats"] = home_stats
+                match_result["data"]["away_stats"] = away_stats
+            except Exception as e:
+                print(f"    ⚠️ Error fetching team stats: {e}")
             
-            if fixture_info:
-                fid = fixture_info["id"]
-                home_id = fixture_info["home_id"]
-                away_id = fixture_info["away_id"]
-                
-                print(f"    -> Found Fixture ID: {fid}")
-                api_details = self.api_football.get_fixture_details(fid)
-                match_result["data"]["api_football"] = api_details
-                
-                # Fetch Team Stats from API (Replacement for missing FBref)
-                print("    -> Fetching Team Stats from API...")
-                api_home_stats = self.api_football.get_team_stats(home_id, league_id, season_year)
-                api_away_stats = self.api_football.get_team_stats(away_id, league_id, season_year)
-                
-                if api_home_stats:
-                    match_result["data"]["home_stats"] = match_result["data"].get("home_stats") or {}
-                    match_result["data"]["home_stats"]["api_football"] = api_home_stats
-                    print("       ✅ Home Stats Fetched")
-                if api_away_stats:
-                    match_result["data"]["away_stats"] = match_result["data"].get("away_stats") or {}
-                    match_result["data"]["away_stats"]["api_football"] = api_away_stats
-                    print("       ✅ Away Stats Fetched")
-                
-                if api_details.get("predictions"):
-                    pred = api_details["predictions"][0].get("predictions", {})
-                    print(f"    -> API Prediction: {pred.get('winner', {}).get('name')} (Advice: {pred.get('advice')})")
-                
-                # --- LINEUP FALLBACK LOGIC (Projected/Confirmed) ---
-            # If FotMob failed (formations 0 vs 0) but API has lineups, use API.
-            # API-Football often provides "Projected" lineups 24-48h before match in the same endpoint.
-            current_lineups = match_result["data"].get("lineups", {})
-            if current_lineups.get("home_formation") == "0" and api_details.get("lineups"):
-                print("    🔄 Using API-Football Lineups (Projected/Confirmed)...")
-                try:
-                    # API Lineups format is a list of 2 dicts (one for each team)
-                    api_lineups = api_details["lineups"]
-                    new_lineups = {
-                        "home_formation": "0",
-                        "away_formation": "0",
-                        "home_lineup": [],
-                        "away_lineup": [],
-                        "source": "api_football (Projected/Confirmed)"
-                    }
-                    
-                    for team_data in api_lineups:
-                        # Check if this is a confirmed lineup or projected
-                        # API-Football doesn't always explicitly say, but if it's early, it's projected.
-                        
-                        formation = team_data.get("formation")
-                        start_xi = team_data.get("startXI", [])
-                        
-                        # Identify Home/Away
-                        if team_data["team"]["id"] == home_id:
-                            new_lineups["home_formation"] = formation or "Projected"
-                            new_lineups["home_lineup"] = [{"name": p["player"]["name"], "number": p["player"]["number"], "pos": p["player"]["pos"]} for p in start_xi]
-                        elif team_data["team"]["id"] == away_id:
-                            new_lineups["away_formation"] = formation or "Projected"
-                            new_lineups["away_lineup"] = [{"name": p["player"]["name"], "number": p["player"]["number"], "pos": p["player"]["pos"]} for p in start_xi]
-                            
-                    match_result["data"]["lineups"] = new_lineups
-                    print(f"    -> API Formations: {new_lineups['home_formation']} vs {new_lineups['away_formation']}")
-                    
-                except Exception as e:
-                    print(f"    ⚠️ Error parsing API lineups: {e}")
-
-            elif current_lineups.get("home_formation") == "0":
-                print("    ℹ️ Lineups not found in API-Football (yet).")
-                match_result["data"]["api_football"] = {}
-
-            # --- STEP 3.5: FootyStats Data (New Layer) ---
-            print("\n[3.5] Fetching FootyStats Data...")
-            fs_season_id = self.footystats.get_season_id(self.league, season_year)
-            if fs_season_id:
-                print(f"    -> Found Season ID: {fs_season_id}")
-                # Fetch all teams stats for the season (efficient)
-                fs_teams_data = self.footystats.get_team_stats(fs_season_id)
-                
-                # Find Home/Away in FootyStats data
-                fs_home = next((stats for name, stats in fs_teams_data.items() if home.lower() in name.lower() or name.lower() in home.lower()), None)
-                fs_away = next((stats for name, stats in fs_teams_data.items() if away.lower() in name.lower() or name.lower() in away.lower()), None)
+            try:
+                formations = self._stage_result(collected, "formations")
+                match_result["data"]["lineups"] = formations
+                print(f"    -> Formations: {formations.get('home_formation')} vs {formations.get('away_formation')}")
+            except Exception as e:
+                print(f"    ⚠️ Error fetching lineups: {e}")
+        
+        # --- STEP 3: API-Football Data ---
+        print("\n[3] Fetching API-Football Data...")
+        # Default to Brasileirão (71) and 2025 (or 2024 if 2025 fails in API logic)
+        season_year = self._season_year()
+        api_details = {}
+
+        api_football = self._stage_result(collected, "api_football")
+        fixture_info = api_football.get("fixture")
+        
+        if fixture_info:
+            fid = fixture_info["id"]
+            home_id = fixture_info["home_id"]
+            away_id = fixture_info["away_id"]
+            
+            print(f"    -> Found Fixture ID: {fid}")
+            api_details = api_football["details"]
+            match_result["data"]["api_football"] = api_details
+            
+            # Fetch Team Stats from API (Replacement for missing FBref)
+            print("    -> Fetching Team Stats from API...")
+            api_home_stats = api_football["home_stats"]
+            api_away_stats = api_football["away_stats"]
+            
+            if api_home_stats:
+                match_result["data"]["home_stats"] = match_result["data"].get("home_stats") or {}
+                match_result["data"]["home_stats"]["api_football"] = api_home_stats
+                print("       ✅ Home Stats Fetched")
+            if api_away_stats:
+                match_result["data"]["away_stats"] = match_result["data"].get("away_stats") or {}
+                match_result["data"]["away_stats"]["api_football"] = api_away_stats
+                print("       ✅ Away Stats Fetched")
+            
+            if api_details.get("predictions"):
+                pred = api_details["predictions"][0].get("predictions", {})
+                print(f"    -> API Prediction: {pred.get('winner', {}).get('name')} (Advice: {pred.get('advice')})")
+            
+            # --- LINEUP FALLBACK LOGIC (Projected/Confirmed) ---
+        # If FotMob failed (formations 0 vs 0) but API has lineups, use API.
+        # API-Football often provides "Projected" lineups 24-48h before match in the same endpoint.
+        current_lineups = match_result["data"].get("lineups", {})
+        if current_lineups.get("home_formation") == "0" and api_details.get("lineups"):
+            print("    🔄 Using API-Football Lineups (Projected/Confirmed)...")
+            try:
+                # API Lineups format is a list of 2 dicts (one for each team)
+                api_lineups = api_details["lineups"]
+                new_lineups = {
+                    "home_formation": "0",
+                    "away_formation": "0",
+                    "home_lineup": [],
+                    "away_lineup": [],
+                    "source": "api_football (Projected/Confirmed)"
+                }
                 
-                if fs_home:
-                    match_result["data"]["home_stats"] = match_result["data"].get("home_stats") or {}
-                    match_result["data"]["home_stats"]["footystats"] = fs_home
-                    print(f"       ✅ FootyStats: {home} (xG: {fs_home.get('xg_for', 'N/A')})")
-                if fs_away:
-                    match_result["data"]["away_stats"] = match_result["data"].get("away_stats") or {}
-                    match_result["data"]["away_stats"]["footystats"] = fs_away
-                    print(f"       ✅ FootyStats: {away} (xG: {fs_away.get('xg_for', 'N/A')})")
-                    
-                # --- FOOTYSTATS LINEUP FALLBACK ---
-                # If still no lineups, try FootyStats
-                current_lineups = match_result["data"].get("lineups", {})
-                if current_lineups.get("home_formation") == "0":
-                    print("    🔄 Checking FootyStats for Lineups...")
-                    # We need to find the specific match ID in FootyStats
-                    # This requires fetching all matches for the season
-                    fs_matches = self.footystats.get_matches_for_season(fs_season_id)
+                for team_data in api_lineups:
+                    # Check if this is a confirmed lineup or projected
+                    # API-Football doesn't always explicitly say, but if it's early, it's projected.
                     
-                    # Filter for our match
-                    # FootyStats match objects usually have 'homeTeam' and 'awayTeam' names
-                    # and 'date_unix' or 'date_iso'
-                    target_fs_match = None
-                    for m in fs_matches:
-                        # Simple name check
-                        m_home = m.get("home_name", "")
-                        m_away = m.get("away_name", "")
-                        if (home in m_home or m_home in home) and (away in m_away or m_away in away):
-                            target_fs_match = m
-                            break
+                    formation = team_data.get("formation")
+                    start_xi = team_data.get("startXI", [])
                     
-                    if target_fs_match:
-                        fs_match_id = target_fs_match.get("id")
-                        print(f"       -> Found FootyStats Match ID: {fs_match_id}")
-                        fs_lineups = self.footystats.get_match_lineups(fs_match_id)
+                    # Identify Home/Away
+                    if team_data["team"]["id"] == home_id:
+                        new_lineups["home_formation"] = formation or "Projected"
+                        new_lineups["home_lineup"] = [{"name": p["player"]["name"], "number": p["player"]["number"], "pos": p["player"]["pos"]} for p in start_xi]
+                    elif team_data["team"]["id"] == away_id:
+                        new_lineups["away_formation"] = formation or "Projected"
+                        new_lineups["away_lineup"] = [{"name": p["player"]["name"], "number": p["player"]["number"], "pos": p["player"]["pos"]} for p in start_xi]
                         
-                        if fs_lineups:
-                            print("       ✅ Found FootyStats Lineups!")
-                            # Parse and use them (Simplified mapping)
-                            # FootyStats format needs inspection, but assuming standard dict
-                            match_result["data"]["lineups"]["source"] = "footystats"
-                            match_result["data"]["lineups"]["raw_footystats"] = fs_lineups
-                            # We might not parse fully to formation string yet, but we save the data
-                            match_result["data"]["lineups"]["home_formation"] = "Available (FS)"
-                            match_result["data"]["lineups"]["away_formation"] = "Available (FS)"
-                    else:
-                        print("       ⚠️ Match not found in FootyStats list.")
-
-            else:
-                print("    ⚠️ Season not found in FootyStats.")
-                
-            # Fallback for Form Analysis if FootyStats missing
-            if "footystats" not in match_result["data"].get("home_stats", {}):
-                print("    -> Using API Stats for Form Analysis")
-
-            # --- STEP 4: Feature Engineering (Q-Scores) ---
-            print("\n[4] Calculating Q-Scores (Advanced Metrics)...")
-            try:
-                q_scores = get_all_q_scores(match_result)
-                
-                print(f"    -> Home Q-Score: {q_scores['home']:.1f}")
-                print(f"    -> Away Q-Score: {q_scores['away']:.1f}")
-                
-                # Print Breakdown
-                details = q_scores.get("details", {})
-                print(f"       Attack (Q2): H {details['Q2_Attack']['home']} vs A {details['Q2_Attack']['away']}")
-                print(f"       Defense (Q4): H {details['Q4_Defense']['home']} vs A {details['Q4_Defense']['away']}")
-                print(f"       Tactics (Q6): H {details['Q6_Tactics']['home']} vs A {details['Q6_Tactics']['away']}")
-                print(f"       H2H (Q17): H {details['Q17_H2H']['home']} vs A {details['Q17_H2H']['away']}")
+                match_result["data"]["lineups"] = new_lineups
+                print(f"    -> API Formations: {new_lineups['home_formation']} vs {new_lineups['away_formation']}")
                 
             except Exception as e:
-                print(f"    ⚠️ Error calculating Q-Scores: {e}")
-                q_scores = {"home": 50.0, "away": 50.0} # Fallback
-                
-            match_result["analysis"]["q_scores"] = q_scores
-            
+                print(f"    ⚠️ Error parsing API lineups: {e}")
 
+        elif current_lineups.get("home_formation") == "0":
+            print("    ℹ️ Lineups not found in API-Football (yet).")
+            match_result["data"]["api_football"] = {}
 
-            # --- MEDALLION ENGINE (Ultra-Advanced AH Analysis) ---
-            print("\n[4.6] Running Medallion Score Engine (Quantitative AH Analysis)...")
-            try:
-                # Extract injuries by team from API-Football
-                all_injuries = match_result["data"].get("api_football", {}).get("injuries", [])
-                home_injuries = [inj for inj in all_injuries if inj.get("team", {}).get("name", "").lower() in home.lower() or home.lower() in inj.get("team", {}).get("name", "").lower()]
-                away_injuries = [inj for inj in all_injuries if inj.get("team", {}).get("name", "").lower() in away.lower() or away.lower() in inj.get("team", {}).get("name", "").lower()]
-
-                # Fetch Key Players (Refinement)
-                home_id = match_result["data"].get("api_football", {}).get("fixture", {}).get("teams", {}).get("home", {}).get("id")
-                away_id = match_result["data"].get("api_football", {}).get("fixture", {}).get("teams", {}).get("away", {}).get("id")
+        # --- STEP 3.5: FootyStats Data (New Layer) ---
+        print("\n[3.5] Fetching FootyStats Data...")
+        try:
+            footystats = self._stage_result(collected, "footystats")
+        except Exception as e:
+            print(f"    ⚠️ Error fetching FootyStats data: {e}")
+            footystats = {}
+        fs_season_id = footystats.get("season_id")
+        if fs_season_id:
+            print(f"    -> Found Season ID: {fs_season_id}")
+            # Home/Away from the season's team index
+            fs_home = footystats["home"]
+            fs_away = footystats["away"]
+            
+            if fs_home:
+                match_result["data"]["home_stats"] = match_result["data"].get("home_stats") or {}
+                match_result["data"]["home_stats"]["footystats"] = fs_home
+                print(f"       ✅ FootyStats: {home} (xG: {fs_home.get('xg_for', 'N/A')})")
+            if fs_away:
+                match_result["data"]["away_stats"] = match_result["data"].get("away_stats") or {}
+                match_result["data"]["away_stats"]["footystats"] = fs_away
+                print(f"       ✅ FootyStats: {away} (xG: {fs_away.get('xg_for', 'N/A')})")
                 
-                home_key_players = []
-                away_key_players = []
+            # --- FOOTYSTATS LINEUP FALLBACK ---
+            # If still no lineups, try FootyStats
+            current_lineups = match_result["data"].get("lineups", {})
+            if current_lineups.get("home_formation") == "0":
+                print("    🔄 Checking FootyStats for Lineups...")
+                # We need to find the specific match ID in FootyStats
+                # (season match list is fetched once and indexed by team pair)
+                target_fs_match = self.footystats.find_match(fs_season_id, home, away)
                 
-                if home_id:
-                    print(f"    🔎 Fetching Key Players for Home Team (ID: {home_id})...")
-                    home_key_players = self.api_football.get_key_players(home_id, season=2025)
-                if away_id:
-                    print(f"    🔎 Fetching Key Players for Away Team (ID: {away_id})...")
-                    away_key_players = self.api_football.get_key_players(away_id, season=2025)
-
-                # Extract form strings from API-Football predictions data
-                home_form_str = ""
-                away_form_str = ""
-                api_predictions = match_result["data"].get("api_football", {}).get("predictions", [])
-                if api_predictions:
-                    pred_data = api_predictions[0] if isinstance(api_predictions, list) else api_predictions
-                    home_form_str = pred_data.get("teams", {}).get("home", {}).get("league", {}).get("form", "")
-                    away_form_str = pred_data.get("teams", {}).get("away", {}).get("league", {}).get("form", "")
-
-                # Extract formations
-                lineups = match_result["data"].get("lineups", {})
-                home_formation = lineups.get("home_formation", "4-3-3")
-                away_formation = lineups.get("away_formation", "4-3-3")
-
-                # Build match context
-                match_context = {
-                    "home_team": home,
-                    "away_team": away,
-                    "date": date,
-                    "total_teams": 20,  # Brasileirão
-                    "match_type": "league"
-                }
+                if target_fs_match:
+                    fs_match_id = target_fs_match.get("id")
+                    print(f"       -> Found FootyStats Match ID: {fs_match_id}")
+                    fs_lineups = self.footystats.get_match_lineups(fs_match_id)
+                    
+                    if fs_lineups:
+                        print("       ✅ Found FootyStats Lineups!")
+                        # Parse and use them (Simplified mapping)
+                        # FootyStats format needs inspection, but assuming standard dict
+                        match_result["data"]["lineups"]["source"] = "footystats"
+                        match_result["data"]["lineups"]["raw_footystats"] = fs_lineups
+                        # We might not parse fully to formation string yet, but we save the data
+                        match_result["data"]["lineups"]["home_formation"] = "Available (FS)"
+                        match_result["data"]["lineups"]["away_formation"] = "Available (FS)"
+                else:
+                    print("       ⚠️ Match not found in FootyStats list.")
 
-                # Run Medallion analysis
-                medallion_result = self.medallion_engine.analyze_match(
-                    home_stats=match_result["data"].get("home_stats", {}),
-                    away_stats=match_result["data"].get("away_stats", {}),
-                    match_context=match_context,
-                    home_injuries=home_injuries,
-                    away_injuries=away_injuries,
-                    home_formation=home_formation,
-                    away_formation=away_formation,
-                    home_form=home_form_str[-6:] if home_form_str else None,
-                    away_form=away_form_str[-6:] if away_form_str else None,
-                    home_key_players=home_key_players,
-                    away_key_players=away_key_players
-                )
-
-                match_result["analysis"]["medallion"] = medallion_result
-
-                # Print Summary
-                print(f"\n{medallion_result['summary']}")
+        else:
+            print("    ⚠️ Season not found in FootyStats.")
+            
+        # Fallback for Form Analysis if FootyStats missing
+        if "footystats" not in match_result["data"].get("home_stats", {}):
+            print("    -> Using API Stats for Form Analysis")
 
-            except Exception as e:
-                print(f"    ⚠️ Error in Medallion Engine: {e}")
-                import traceback
-                traceback.print_exc()
+        # --- STEP 4: Feature Engineering (Q-Scores) ---
+        print("\n[4] Calculating Q-Scores (Advanced Metrics)...")
+        try:
+            q_scores = get_all_q_scores(match_result)
+            
+            print(f"    -> Home Q-Score: {q_scores['home']:.1f}")
+            print(f"    -> Away Q-Score: {q_scores['away']:.1f}")
+            
+            # Print Breakdown
+            details = q_scores.get("details", {})
+            print(f"       Attack (Q2): H {details['Q2_Attack']['home']} vs A {details['Q2_Attack']['away']}")
+            print(f"       Defense (Q4): H {details['Q4_Defense']['home']} vs A {details['Q4_Defense']['away']}")
+            print(f"       Tactics (Q6): H {details['Q6_Tactics']['home']} vs A {details['Q6_Tactics']['away']}")
+            print(f"       H2H (Q17): H {details['Q17_H2H']['home']} vs A {details['Q17_H2H']['away']}")
+            
+        except Exception as e:
+            print(f"    ⚠️ Error calculating Q-Scores: {e}")
+            q_scores = {"home": 50.0, "away": 50.0} # Fallback
+            
+        match_result["analysis"]["q_scores"] = q_scores
+        
 
-            # --- POISSON MODEL (Mathematically Rigorous AH Analysis) ---
-            print("\n[4.7] Running Poisson AH Model (Mathematical Foundation)...")
-            try:
-                # Create TeamMetrics from our data sources
-                home_metrics = create_team_metrics_from_data(
-                    name=home,
-                    footystats=match_result["data"].get("home_stats", {}).get("footystats"),
-                    api_football=match_result["data"].get("home_stats", {}).get("api_football")
-                )
-                away_metrics = create_team_metrics_from_data(
-                    name=away,
-                    footystats=match_result["data"].get("away_stats", {}).get("footystats"),
-                    api_football=match_result["data"].get("away_stats", {}).get("api_football")
-                )
-
-                # Run Poisson analysis
-                poisson_result = self.poisson_ah_model.analyze_match(
-                    home_metrics=home_metrics,
-                    away_metrics=away_metrics
-                )
-
-                match_result["analysis"]["poisson"] = poisson_result
-
-                # Print Summary
-                print(f"\n{poisson_result['summary']}")
-
-                # Compare with Medallion for consensus check
-                medallion_line = match_result["analysis"].get("medallion", {}).get("ah_line", {}).get("recommended_line", 0)
-                poisson_line = poisson_result.get("fair_ah_line", {}).get("home_perspective", 0)
-                
-                consensus_status = "UNCERTAIN"
-                veto_status = False
-                veto_reason = ""
 
-                if medallion_line is not None and poisson_line is not None:
-                    line_diff = abs(medallion_line - poisson_line)
-                    
-                    if line_diff <= 0.25:
-                        consensus_status = "✅ MODEL CONSENSUS"
-                        print(f"    {consensus_status}: Both models agree on line ~{medallion_line}")
-                    elif line_diff <= 0.5:
-                        consensus_status = "⚠️ MINOR DIVERGENCE"
-                        print(f"    {consensus_status}: Models differ by 0.5 (Med: {medallion_line}, Poi: {poisson_line})")
-                    else:
-                        consensus_status = "❌ MAJOR DIVERGENCE"
-                        veto_status = True
-                        veto_reason = f"Models disagree significantly (Med: {medallion_line}, Poi: {poisson_line})"
-                        print(f"    {consensus_status}: {veto_reason} -> VETOED")
-                        
-                # Check for Insignificant Matches (Low Score)
-                med_home_score = match_result["analysis"].get("medallion", {}).get("home_score", 0)
-                med_away_score = match_result["analysis"].get("medallion", {}).get("away_score", 0)
-                
-                if abs(med_home_score) < 10 and abs(med_away_score) < 10:
-                    veto_status = True
-                    veto_reason = "Insignificant Match (Scores < 10%)"
-                    print(f"    ❌ VETOED: {veto_reason}")
-
-                match_result["analysis"]["consensus"] = {
-                    "status": consensus_status,
-                    "medallion_line": medallion_line,
-                    "poisson_line": poisson_line,
-                    "veto": veto_status,
-                    "veto_reason": veto_reason
-                }
-                
-                # --- WORKFLOW: Save to Ledger ---
-                print(f"    [DEBUG] Veto: {veto_status}, Status: {consensus_status}")
-                if not veto_status and consensus_status != "UNCERTAIN":
-                    self.save_to_ledger(match_result, medallion_line, poisson_line, consensus_status)
+        # --- MEDALLION ENGINE (Ultra-Advanced AH Analysis) ---
+        print("\n[4.6] Running Medallion Score Engine (Quantitative AH Analysis)...")
+        try:
+            # Extract injuries by team from API-Football
+            all_injuries = match_result["data"].get("api_football", {}).get("injuries", [])
+            home_injuries = [inj for inj in all_injuries if inj.get("team", {}).get("name", "").lower() in home.lower() or home.lower() in inj.get("team", {}).get("name", "").lower()]
+            away_injuries = [inj for inj in all_injuries if inj.get("team", {}).get("name", "").lower() in away.lower() or away.lower() in inj.get("team", {}).get("name", "").lower()]
+
+            # Fetch Key Players (Refinement) - served from the squad cache after the first fetch
+            home_id = (fixture_info or {}).get("home_id")
+            away_id = (fixture_info or {}).get("away_id")
+            
+            home_key_players = []
+            away_key_players = []
+            
+            if home_id:
+                print(f"    🔎 Fetching Key Players for Home Team (ID: {home_id})...")
+                home_key_players = self.api_football.get_key_players(home_id, season=self._season_year())
+            if away_id:
+                print(f"    🔎 Fetching Key Players for Away Team (ID: {away_id})...")
+                away_key_players = self.api_football.get_key_players(away_id, season=self._season_year())
+
+            # Extract form strings from API-Football predictions data
+            home_form_str = ""
+            away_form_str = ""
+            api_predictions = match_result["data"].get("api_football", {}).get("predictions", [])
+            if api_predictions:
+                pred_data = api_predictions[0] if isinstance(api_predictions, list) else api_predictions
+                home_form_str = pred_data.get("teams", {}).get("home", {}).get("league", {}).get("form", "")
+                away_form_str = pred_data.get("teams", {}).get("away", {}).get("league", {}).get("form", "")
+
+            # Extract formations
+            lineups = match_result["data"].get("lineups", {})
+            home_formation = lineups.get("home_formation", "4-3-3")
+            away_formation = lineups.get("away_formation", "4-3-3")
+
+            # Build match context
+            match_context = {
+                "home_team": home,
+                "away_team": away,
+                "date": date,
+                "total_teams": 20,  # Brasileirão
+                "match_type": "league"
+            }
 
-            except Exception as e:
-                print(f"    ⚠️ Error in Poisson Model: {e}")
-                import traceback
-                traceback.print_exc()
-
-            # --- STEP 5: Confidence Check & Veto ---
-            print("\n[4] Running Confidence Check...")
-            confidence = self.calculate_confidence(match_result)
-            match_result["analysis"]["confidence"] = confidence
-            
-            print(f"    -> Confidence Score: {confidence['score']}%")
-            for reason in confidence['reasons']:
-                print(f"       {reason}")
-                
-            if confidence['veto']:
-                print(f"    ⛔ MATCH VETOED: Skipping Model Analysis.")
-                match_result["veto_status"] = "VETOED"
-                self.save_match_data_json(match_result) # Save data even if vetoed
-                results.append(match_result)
-                continue 
-            
-            # --- STEP 6: Model & Value Calculation ---
-            print("\n[5] Running Yudor Model...")
-            
-            # 1. Get True Probabilities & Optimal Line
-            yudor_data = self.ah_model.calculate_yudor_fair_odds(home, away)
-            # Calculate True Odds & Line regardless of "Value"
-            probs = self.ah_model.calculate_yudor_fair_odds(
-                home_team=home,
-                away_team=away,
+            # Run Medallion analysis
+            medallion_result = self.medallion_engine.analyze_match(
                 home_stats=match_result["data"].get("home_stats", {}),
                 away_stats=match_result["data"].get("away_stats", {}),
-                sentiment_score=sentiment_score,
-                q_scores=q_scores
+                match_context=match_context,
+                home_injuries=home_injuries,
+                away_injuries=away_injuries,
+                home_formation=home_formation,
+                away_formation=away_formation,
+                home_form=home_form_str[-6:] if home_form_str else None,
+                away_form=away_form_str[-6:] if away_form_str else None,
+                home_key_players=home_key_players,
+                away_key_players=away_key_players
             )
-            
-            # Store the math in the result
-            match_result["analysis"]["true_probabilities"] = probs["probabilities"]
-            match_result["analysis"]["fair_odds"] = probs["fair_odds"]
-            match_result["analysis"]["optimal_line"] = probs["optimal_line"]
-            
-            print(f"    -> True Prob: Home {probs['probabilities']['home']:.2%} | Draw {probs['probabilities']['draw']:.2%} | Away {probs['probabilities']['away']:.2%}")
-            print(f"    -> Optimal Line: {probs['optimal_line']}")
-            print(f"    -> Fair Odds: {probs['fair_odds']}")
-
-            # Check for Value
-            value_bets = self.ah_model.get_value_bets(
-                home_team=home,
-                away_team=away,
-                true_probs=probs,
-                market_odds={} # We don't have live market odds in this flow yet, user inputs them in Dashboard
+
+            match_result["analysis"]["medallion"] = medallion_result
+
+            # Print Summary
+            print(f"\n{medallion_result['summary']}")
+
+        except Exception as e:
+            print(f"    ⚠️ Error in Medallion Engine: {e}")
+            import traceback
+            traceback.print_exc()
+
+        # --- POISSON MODEL (Mathematically Rigorous AH Analysis) ---
+        print("\n[4.7] Running Poisson AH Model (Mathematical Foundation)...")
+        try:
+            # Create TeamMetrics from our data sources
+            home_metrics = create_team_metrics_from_data(
+                name=home,
+                footystats=match_result["data"].get("home_stats", {}).get("footystats"),
+                api_football=match_result["data"].get("home_stats", {}).get("api_football")
+            )
+            away_metrics = create_team_metrics_from_data(
+                name=away,
+                footystats=match_result["data"].get("away_stats", {}).get("footystats"),
+                api_football=match_result["data"].get("away_stats", {}).get("api_football")
             )
+
+            # Run Poisson analysis
+            poisson_result = self.poisson_ah_model.analyze_match(
+                home_metrics=home_metrics,
+                away_metrics=away_metrics
+            )
+
+            match_result["analysis"]["poisson"] = poisson_result
+
+            # Print Summary
+            print(f"\n{poisson_result['summary']}")
+
+            # Compare with Medallion for consensus check
+            medallion_line = match_result["analysis"].get("medallion", {}).get("ah_line", {}).get("recommended_line", 0)
+            poisson_line = poisson_result.get("fair_ah_line", {}).get("home_perspective", 0)
             
-            if value_bets:
-                print(f"    💰 VALUE FOUND: {len(value_bets)} bets")
-                match_result["analysis"]["value_bets"] = value_bets
-            else:
-                print("    ❌ No Value Found (Model might need training or odds don't match)")
+            consensus_status = "UNCERTAIN"
+            veto_status = False
+            veto_reason = ""
+
+            if medallion_line is not None and poisson_line is not None:
+                line_diff = abs(medallion_line - poisson_line)
                 
-            # --- STEP 7: Save Granular Data for ML ---
-            self.save_match_data_json(match_result)
+                if line_diff <= 0.25:
+                    consensus_status = "✅ MODEL CONSENSUS"
+                    print(f"    {consensus_status}: Both models agree on line ~{medallion_line}")
+                elif line_diff <= 0.5:
+                    consensus_status = "⚠️ MINOR DIVERGENCE"
+                    print(f"    {consensus_status}: Models differ by 0.5 (Med: {medallion_line}, Poi: {poisson_line})")
+                else:
+                    consensus_status = "❌ MAJOR DIVERGENCE"
+                    veto_status = True
+                    veto_reason = f"Models disagree significantly (Med: {medallion_line}, Poi: {poisson_line})"
+                    print(f"    {consensus_status}: {veto_reason} -> VETOED")
+                    
+            # Check for Insignificant Matches (Low Score)
+            med_home_score = match_result["analysis"].get("medallion", {}).get("home_score", 0)
+            med_away_score = match_result["analysis"].get("medallion", {}).get("away_score", 0)
+            
+            if abs(med_home_score) < 10 and abs(med_away_score) < 10:
+                veto_status = True
+                veto_reason = "Insignificant Match (Scores < 10%)"
+                print(f"    ❌ VETOED: {veto_reason}")
+
+            match_result["analysis"]["consensus"] = {
+                "status": consensus_status,
+                "medallion_line": medallion_line,
+                "poisson_line": poisson_line,
+                "veto": veto_status,
+                "veto_reason": veto_reason
+            }
+            
+            # --- WORKFLOW: Save to Ledger ---
+            print(f"    [DEBUG] Veto: {veto_status}, Status: {consensus_status}")
+            if not veto_status and consensus_status != "UNCERTAIN":
+                self.save_to_ledger(match_result, medallion_line, poisson_line, consensus_status)
 
-            results.append(match_result)
+        except Exception as e:
+            print(f"    ⚠️ Error in Poisson Model: {e}")
+            import traceback
+            traceback.print_exc()
+
+        # --- STEP 5: Confidence Check & Veto ---
+        print("\n[4] Running Confidence Check...")
+        confidence = self.calculate_confidence(match_result)
+        match_result["analysis"]["confidence"] = confidence
+        
+        print(f"    -> Confidence Score: {confidence['score']}%")
+        for reason in confidence['reasons']:
+            print(f"       {reason}")
+            
+        if confidence['veto']:
+            print(f"    ⛔ MATCH VETOED: Skipping Model Analysis.")
+            match_result["veto_status"] = "VETOED"
+            self.save_match_data_json(match_result) # Save data even if vetoed
+            return match_result
+        
+        # --- STEP 6: Model & Value Calculation ---
+        print("\n[5] Running Yudor Model...")
+        
+        # 1. Get True Probabilities & Optimal Line
+        yudor_data = self.ah_model.calculate_yudor_fair_odds(home, away)
+        # Calculate True Odds & Line regardless of "Value"
+        probs = self.ah_model.calculate_yudor_fair_odds(
+            home_team=home,
+            away_team=away,
+            home_stats=match_result["data"].get("home_stats", {}),
+            away_stats=match_result["data"].get("away_stats", {}),
+            sentiment_score=sentiment_score,
+            q_scores=q_scores
+        )
+        
+        # Store the math in the result
+        match_result["analysis"]["true_probabilities"] = probs["probabilities"]
+        match_result["analysis"]["fair_odds"] = probs["fair_odds"]
+        match_result["analysis"]["optimal_line"] = probs["optimal_line"]
+        
+        print(f"    -> True Prob: Home {probs['probabilities']['home']:.2%} | Draw {probs['probabilities']['draw']:.2%} | Away {probs['probabilities']['away']:.2%}")
+        print(f"    -> Optimal Line: {probs['optimal_line']}")
+        print(f"    -> Fair Odds: {probs['fair_odds']}")
+
+        # Check for Value
+        value_bets = self.ah_model.get_value_bets(
+            home_team=home,
+            away_team=away,
+            true_probs=probs,
+            market_odds={} # We don't have live market odds in this flow yet, user inputs them in Dashboard
+        )
+        
+        if value_bets:
+            print(f"    💰 VALUE FOUND: {len(value_bets)} bets")
+            match_result["analysis"]["value_bets"] = value_bets
+        else:
+            print("    ❌ No Value Found (Model might need training or odds don't match)")
             
-        return results
+        # --- STEP 7: Save Granular Data for ML ---
+        self.save_match_data_json(match_result)
+
+        return match_result
 
     def save_match_data_json(self, match_result):
         """
@@ -737,7 +825,19 @@ if __name__ == "__main__":
     parser.add_argument("--input", help="Path to matches file (csv or txt)")
     parser.add_argument("--league", default="Brasileirão", help="League name")
     parser.add_argument("--season", default="2025", help="Season (e.g. 2425 or 2025)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Matches collected concurrently (default: {Phase2Orchestrator.MATCH_WORKERS})")
+    parser.add_argument("--record", metavar="DIR", help="Record every HTTP response to DIR (cassette)")
+    parser.add_argument("--replay", metavar="DIR", help="Run offline from responses recorded in DIR")
     args = parser.parse_args()
+
+    # Record/replay HTTP cassette (FootyStats, API-Football, Serper, FotMob, news pages)
+    if args.record and args.replay:
+        parser.error("--record and --replay are mutually exclusive")
+    if args.record or args.replay:
+        cassette = get_http_client().use_cassette(args.record or args.replay,
+                                                  mode="record" if args.record else "replay")
+        print(f"📼 HTTP cassette: {cassette.mode} ({cassette.directory})")
     
     matches = []
     if args.input:
@@ -750,5 +850,9 @@ if __name__ == "__main__":
         matches = [{"home": "Internacional", "away": "Santos", "league": "Brasileirão", "date": "25/11/2025"}]
         
     orchestrator = Phase2Orchestrator(league=args.league, season=args.season)
-    results = orchestrator.process_matches(matches)
+    results = orchestrator.process_matches(matches, workers=args.workers)
     orchestrator.save_results(results)
+    print(f"📊 API-Football quota: {orchestrator.api_football.quota.stats()}")
+
+    if get_http_client().cassette:
+        print(f"📼 Cassette: {get_http_client().cassette.stats()}")
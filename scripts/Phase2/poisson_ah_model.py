@@ -3,6 +3,10 @@ from scipy.stats import poisson
 from typing import Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 
+# Asian Handicap lines (home perspective) and goal totals priced by the ladder engine
+AH_LINES = np.arange(-3.5, 3.5 + 1e-9, 0.25)
+TOTAL_LINES = np.arange(0.5, 6.5 + 1e-9, 0.25)
+
 @dataclass
 class TeamMetrics:
     name: str
@@ -53,10 +57,11 @@ class PoissonAHModel:
     and Asian Handicap line calculation.
     """
     
-    def __init__(self, league_avg_home_goals=1.50, league_avg_away_goals=1.15):
+    def __init__(self, league_avg_home_goals=1.50, league_avg_away_goals=1.15, max_goals: int = 10):
         self.league_avg_home_goals = league_avg_home_goals
         self.league_avg_away_goals = league_avg_away_goals
         self.rho = -0.13  # Dixon-Coles correlation parameter
+        self.max_goals = max_goals  # Scoreline matrix covers 0..max_goals-1 goals per side
 
     def calculate_xg(self, home: TeamMetrics, away: TeamMetrics) -> Tuple[float, float]:
         """
@@ -85,6 +90,169 @@ class PoissonAHModel:
         else:
             return prob
 
+    def score_matrix(self, home_xg, away_xg, max_goals: Optional[int] = None) -> np.ndarray:
+        """
+        Normalized Dixon-Coles scoreline matrix, P(home goals = i, away goals = j).
+
+        Built as the outer product of the two Poisson pmf vectors, with the four
+        low-score corrections (0-0, 0-1, 1-0, 1-1) applied as a 2x2 patch.
+        home_xg / away_xg may be scalars or same-shaped arrays (a slate, a grid of
+        scenarios): the result then has shape xg.shape + (max_goals, max_goals).
+        Cell values match the per-cell _dixon_coles_adjustment loop exactly.
+        """
+        max_goals = max_goals or self.max_goals
+        h_xg, a_xg = np.broadcast_arrays(np.asarray(home_xg, dtype=float), np.asarray(away_xg, dtype=float))
+        goals = np.arange(max_goals)
+
+        # pmf vectors, shape (..., max_goals)
+        h_pmf = poisson.pmf(goals, h_xg[..., None])
+        a_pmf = poisson.pmf(goals, a_xg[..., None])
+        matrix = h_pmf[..., :, None] * a_pmf[..., None, :]
+
+        # Dixon-Coles low-score correction
+        matrix[..., 0, 0] *= 1.0 - (h_xg * a_xg * self.rho)
+        matrix[..., 0, 1] *= 1.0 + (h_xg * self.rho)
+        matrix[..., 1, 0] *= 1.0 + (a_xg * self.rho)
+        matrix[..., 1, 1] *= 1.0 - self.rho
+
+        # Normalize each matrix
+        flat = matrix.reshape(matrix.shape[:-2] + (-1,))
+        matrix /= flat.sum(axis=-1)[..., None, None]
+        return matrix
+
+    @staticmethod
+    def match_odds_probabilities(matrix: np.ndarray) -> Dict[str, Any]:
+        """1X2 probabilities of one matrix or a stack of them (last two axes)."""
+        return {
+            "home": np.sum(np.tril(matrix, -1), axis=(-2, -1)),
+            "draw": np.sum(np.diagonal(matrix, axis1=-2, axis2=-1), axis=-1),
+            "away": np.sum(np.triu(matrix, 1), axis=(-2, -1))
+        }
+
+    @staticmethod
+    def goal_difference_distribution(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        P(home goals - away goals = d) from the matrix diagonals.
+
+        Returns:
+            (d values, probabilities with shape matrix.shape[:-2] + (len(d),))
+        """
+        n = matrix.shape[-1]
+        diffs = np.arange(-(n - 1), n)
+        # Diagonal offset k holds the cells j - i = k, i.e. d = -k
+        probs = np.stack([np.trace(matrix, offset=-d, axis1=-2, axis2=-1) for d in diffs], axis=-1)
+        return diffs, probs
+
+    @staticmethod
+    def total_goals_distribution(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """P(home goals + away goals = t) from the matrix anti-diagonals."""
+        n = matrix.shape[-1]
+        totals = np.arange(2 * n - 1)
+        flipped = matrix[..., ::-1]
+        # Anti-diagonal i + j = t is offset (n - 1 - t) of the column-flipped matrix
+        probs = np.stack([np.trace(flipped, offset=n - 1 - t, axis1=-2, axis2=-1) for t in totals], axis=-1)
+        return totals, probs
+
+    @staticmethod
+    def _price_lines(values: np.ndarray, probs: np.ndarray, lines: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Settle a bet that wins when value + line > 0, for every line at once.
+
+        Quarter lines are split stakes on line -/+ 0.25, so each line is priced as
+        the average of two half/whole-line components. A component wins, pushes
+        (margin exactly 0) or loses; two components give win, half win, push,
+        half loss or loss.
+
+        Returns:
+            win / half_win / push / half_loss / loss probabilities and fair_odds,
+            each with shape probs.shape[:-1] + (len(lines),)
+        """
+        lines = np.asarray(lines, dtype=float)
+        is_quarter = np.isclose(np.abs(lines * 4) % 2, 1)
+        low = np.where(is_quarter, lines - 0.25, lines)
+        high = np.where(is_quarter, lines + 0.25, lines)
+
+        # Outcome per (line, value): +1 win, 0 push, -1 loss for each component
+        low_result = np.sign(np.round((values[None, :] + low[:, None]) * 4))
+        high_result = np.sign(np.round((values[None, :] + high[:, None]) * 4))
+        combined = low_result + high_result  # 2 win, 1 half win, 0 push, -1 half loss, -2 loss
+
+        outcome = {name: probs @ (combined == score).T.astype(float)
+                   for name, score in (("win", 2), ("half_win", 1), ("push", 0), ("half_loss", -1), ("loss", -2))}
+
+        # Fair decimal odds: EV = (o - 1) * (win + half_win / 2) - (loss + half_loss / 2) = 0
+        returns = outcome["win"] + outcome["half_win"] / 2
+        stakes_lost = outcome["loss"] + outcome["half_loss"] / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            outcome["fair_odds"] = np.where(returns > 0, 1.0 + stakes_lost / returns, np.inf)
+        outcome["edge"] = returns - stakes_lost  # 0 at the true 50% line
+        return outcome
+
+    @staticmethod
+    def _mirror(side: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """The other side of the same bets (its wins are our losses)."""
+        other = {
+            "win": side["loss"], "half_win": side["half_loss"], "push": side["push"],
+            "half_loss": side["half_win"], "loss": side["win"]
+        }
+        returns = other["win"] + other["half_win"] / 2
+        stakes_lost = other["loss"] + other["half_loss"] / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            other["fair_odds"] = np.where(returns > 0, 1.0 + stakes_lost / returns, np.inf)
+        other["edge"] = -side["edge"]
+        return other
+
+    def price_asian_handicap(self, matrix: np.ndarray, lines=AH_LINES) -> Dict[str, Any]:
+        """
+        Price the whole AH ladder (default -3.5..+3.5 in quarter steps) from the
+        goal-difference distribution, for one matrix or a stack of them.
+
+        Returns:
+            lines (home perspective; away line = -line), home / away outcome
+            probabilities and fair odds per line, and fair_line: the line whose
+            home bet is closest to an even (50%) proposition
+        """
+        lines = np.asarray(lines, dtype=float)
+        diffs, probs = self.goal_difference_distribution(matrix)
+        home = self._price_lines(diffs, probs, lines)
+        return {
+            "lines": lines,
+            "home": home,
+            "away": self._mirror(home),
+            "fair_line": lines[np.argmin(np.abs(home["edge"]), axis=-1)]
+        }
+
+    def price_totals(self, matrix: np.ndarray, lines=TOTAL_LINES) -> Dict[str, Any]:
+        """
+        Price over/under goal lines (default 0.5..6.5 in quarter steps) from the
+        total-goals distribution; fair_line is the most even total.
+        """
+        lines = np.asarray(lines, dtype=float)
+        totals, probs = self.total_goals_distribution(matrix)
+        over = self._price_lines(totals, probs, -lines)  # over wins when total - line > 0
+        return {
+            "lines": lines,
+            "over": over,
+            "under": self._mirror(over),
+            "fair_line": lines[np.argmin(np.abs(over["edge"]), axis=-1)]
+        }
+
+    def analyze_slate(self, home_xg, away_xg) -> Dict[str, np.ndarray]:
+        """
+        Price many matches (or xG scenarios) in one call.
+
+        Returns:
+            home_xg, away_xg, matrices and 1X2 probability arrays, one entry per pair
+        """
+        h_xg, a_xg = np.broadcast_arrays(np.asarray(home_xg, dtype=float), np.asarray(away_xg, dtype=float))
+        matrices = self.score_matrix(h_xg, a_xg)
+        return {
+            "home_xg": h_xg,
+            "away_xg": a_xg,
+            "matrices": matrices,
+            "probabilities": self.match_odds_probabilities(matrices)
+        }
+
     def analyze_match(self, home_metrics: TeamMetrics, away_metrics: TeamMetrics) -> Dict[str, Any]:
         """
         Runs the full analysis: xG -> Probabilities -> AH Line -> EV.
@@ -92,27 +260,21 @@ class PoissonAHModel:
         # 1. Calculate xG
         h_xg, a_xg = self.calculate_xg(home_metrics, away_metrics)
         
-        # 2. Generate Probability Matrix (10x10 goals)
-        max_goals = 10
-        matrix = np.zeros((max_goals, max_goals))
-        
-        for i in range(max_goals):
-            for j in range(max_goals):
-                matrix[i][j] = self._dixon_coles_adjustment(i, j, h_xg, a_xg)
-        
-        # Normalize
-        matrix /= np.sum(matrix)
+        # 2. Generate Probability Matrix (max_goals x max_goals, normalized)
+        matrix = self.score_matrix(h_xg, a_xg)
         
         # 3. Calculate 1X2 Probabilities
-        prob_home = np.sum(np.tril(matrix, -1))
-        prob_draw = np.sum(np.diag(matrix))
-        prob_away = np.sum(np.triu(matrix, 1))
+        probs = self.match_odds_probabilities(matrix)
+        prob_home = probs["home"]
+        prob_draw = probs["draw"]
+        prob_away = probs["away"]
         
         # 4. Calculate Fair Asian Handicap Line
-        # We find the line where Prob(Home Win by > Line) is closest to 50%
-        # Simplified: Based on xG difference
-        xg_diff = h_xg - a_xg
-        fair_line = -round(xg_diff * 4) / 4  # Negative for Home Favorite (e.g. -0.5)
+        # We find the line where Prob(Home Win by > Line) is closest to 50%,
+        # pricing the whole ladder from the goal-difference distribution
+        ah = self.price_asian_handicap(matrix)
+        fair_line = float(ah["fair_line"])  # Negative for Home Favorite (e.g. -0.5)
+        totals = self.price_totals(matrix)
         
         # 5. Kelly Criterion (assuming odds ~ 1.90 for the fair line for simplicity, 
         # in real usage we would compare against bookie odds)
@@ -137,5 +299,22 @@ class PoissonAHModel:
                 "home_perspective": fair_line,
                 "away_perspective": -fair_line
             },
+            "ah_ladder": self._ladder_rows(ah, "home", "away"),
+            "fair_total_line": float(totals["fair_line"]),
+            "totals_ladder": self._ladder_rows(totals, "over", "under"),
             "summary": summary
         }
+
+    @staticmethod
+    def _ladder_rows(priced: Dict[str, Any], side: str, other: str) -> list:
+        """One JSON-friendly row per line of a single match's ladder."""
+        rows = []
+        for k, line in enumerate(priced["lines"]):
+            rows.append({
+                "line": float(line),
+                f"{side}_fair_odds": float(priced[side]["fair_odds"][k]),
+                f"{other}_fair_odds": float(priced[other]["fair_odds"][k]),
+                **{f"{side}_{name}": float(priced[side][name][k])
+                   for name in ("win", "half_win", "push", "half_loss", "loss")}
+            })
+        return rows
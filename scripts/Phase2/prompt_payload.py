@@ -0,0 +1,154 @@
+import json
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+# Rough chars-per-token ratio for mixed English/Portuguese text and compact JSON
+CHARS_PER_TOKEN = 4
+
+TRUNCATION_MARKER = "\n...[truncated]"
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (no tokenizer call)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def prune_empty(data: Any) -> Any:
+    """
+    Recursively drop None, empty strings, empty lists and empty dicts.
+    Zeros and False are kept (they are real values, e.g. 0 goals).
+    """
+    if isinstance(data, dict):
+        pruned = {k: prune_empty(v) for k, v in data.items()}
+        return {k: v for k, v in pruned.items() if v not in (None, "", [], {})}
+    if isinstance(data, list):
+        pruned = [prune_empty(v) for v in data]
+        return [v for v in pruned if v not in (None, "", [], {})]
+    if isinstance(data, str):
+        return data.strip()
+    return data
+
+
+def compact_json(data: Any) -> str:
+    """Serialize without indentation or empty fields."""
+    return json.dumps(prune_empty(data), separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def dedupe_news(news: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+    """
+    Drop headlines already listed (same title or URL), e.g. a derby story that
+    appears on both the home and the away team's news page.
+    """
+    seen = set()
+    deduped = {}
+    for side, items in (news or {}).items():
+        kept = []
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            title_key = " ".join(str(item.get("title", "")).lower().split())
+            url_key = item.get("url") or item.get("link")
+            if title_key in seen or (url_key and url_key in seen):
+                continue
+            seen.add(title_key)
+            if url_key:
+                seen.add(url_key)
+            kept.append(item)
+        deduped[side] = kept
+    return deduped
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = max(0, max_chars - len(TRUNCATION_MARKER))
+    return text[:cut] + TRUNCATION_MARKER
+
+
+class PromptPayloadBuilder:
+    """
+    Assemble the data part of a Claude prompt within a token budget.
+
+    Sections are rendered in priority order (lowest number first). Each section is
+    capped at its own budget, and the overall budget is handed out in that same
+    order, so when the payload is too big the low-priority sources (news) are cut
+    before FootyStats or SportsMole. Page text lines already emitted by an earlier
+    section are not repeated.
+
+    Usage:
+        builder = PromptPayloadBuilder(total_budget=12000)
+        builder.add_section("FOOTYSTATS", footystats_dict, priority=0, budget=3000)
+        builder.add_section("SPORTSMOLE", page_text, priority=1, budget=3000)
+        text, report = builder.build()
+    """
+
+    def __init__(self, total_budget: Optional[int] = None, dedupe_min_chars: int = 40):
+        self.total_budget = total_budget
+        self.dedupe_min_chars = dedupe_min_chars
+        self._sections: List[Dict] = []
+
+    def add_section(self, title: str, content: Any, priority: int = 100,
+                    budget: Optional[int] = None) -> "PromptPayloadBuilder":
+        """Add a section; dicts/lists are compacted, empty content is skipped."""
+        if not isinstance(content, str):
+            content = compact_json(content) if prune_empty(content) not in (None, "", [], {}) else ""
+        content = content.strip()
+        if content:
+            self._sections.append({
+                "title": title,
+                "content": content,
+                "priority": priority,
+                "budget": budget,
+                "order": len(self._sections)
+            })
+        return self
+
+    def _dedupe_lines(self, text: str, seen: set) -> str:
+        kept = []
+        for line in text.splitlines():
+            key = " ".join(line.lower().split())
+            if len(key) >= self.dedupe_min_chars:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(line)
+        return "\n".join(kept)
+
+    def build(self) -> Tuple[str, Dict]:
+        """
+        Returns:
+            (payload text, report) where report has the estimated tokens per
+            section, the total, and which sections were truncated or dropped
+        """
+        remaining = self.total_budget
+        seen_lines: set = set()
+        parts = []
+        report = {"sections": {}, "truncated": [], "dropped": []}
+
+        for section in sorted(self._sections, key=lambda s: (s["priority"], s["order"])):
+            text = self._dedupe_lines(section["content"], seen_lines)
+            original_tokens = estimate_tokens(text)
+
+            limit = section["budget"]
+            if remaining is not None:
+                limit = remaining if limit is None else min(limit, remaining)
+
+            if limit is not None and limit <= 0:
+                report["dropped"].append(section["title"])
+                continue
+            if limit is not None and original_tokens > limit:
+                text = _truncate(text, limit)
+                report["truncated"].append(section["title"])
+
+            block = f"=== {section['title']} ===\n{text}"
+            tokens = estimate_tokens(block)
+            if remaining is not None:
+                remaining -= tokens
+
+            parts.append(block)
+            report["sections"][section["title"]] = tokens
+
+        payload = "\n\n".join(parts)
+        report["estimated_tokens"] = estimate_tokens(payload)
+        return payload, report
@@ -4,7 +4,7 @@ Each function takes raw match and team data as input and returns a score.
 The logic is based on the reasoning discovered in the project's consolidated data files.
 """
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 # --- Scorer Classes ---
 
@@ -79,35 +79,39 @@ class Q9_LeaguePosition:
 class Q17_H2HDominance:
     """Q17: Head-to-Head Dominance."""
     @staticmethod
-    def calculate(h2h_list: list, team_name: str) -> int:
+    def calculate(h2h_list: Union[list, Dict[str, Any]], team_name: str) -> int:
         if not h2h_list: return 5
         
-        wins = 0
-        total = 0
-        for m in h2h_list:
-            # Check if team won
-            # Check if team won
-            try:
-                # FotMob Structure
-                if "status" in m and "scoreStr" in m["status"]:
-                    score = m["status"]["scoreStr"].split(" - ")
-                    h_score = int(score[0])
-                    a_score = int(score[1])
-                    h_name = m["home"]["name"]
-                    a_name = m["away"]["name"]
-                    
-                    if h_name == team_name:
-                        if h_score > a_score: wins += 1
-                    elif a_name == team_name:
-                        if a_score > h_score: wins += 1
-                    total += 1
-                    
-                # API-Football Structure
-                elif "teams" in m:
-                    if m["teams"]["home"]["name"] == team_name and m["teams"]["home"]["winner"]: wins += 1
-                    elif m["teams"]["away"]["name"] == team_name and m["teams"]["away"]["winner"]: wins += 1
-                    total += 1
-            except: pass
+        if isinstance(h2h_list, dict):
+            # H2H index record (scripts/analysis/h2h_index.py): wins already counted per team
+            wins = h2h_list.get("wins", {}).get(team_name, 0)
+            total = len(h2h_list.get("matches", []))
+        else:
+            wins = 0
+            total = 0
+            for m in h2h_list:
+                # Check if team won
+                try:
+                    # FotMob Structure
+                    if "status" in m and "scoreStr" in m["status"]:
+                        score = m["status"]["scoreStr"].split(" - ")
+                        h_score = int(score[0])
+                        a_score = int(score[1])
+                        h_name = m["home"]["name"]
+                        a_name = m["away"]["name"]
+                        
+                        if h_name == team_name:
+                            if h_score > a_score: wins += 1
+                        elif a_name == team_name:
+                            if a_score > h_score: wins += 1
+                        total += 1
+                        
+                    # API-Football Structure
+                    elif "teams" in m:
+                        if m["teams"]["home"]["name"] == team_name and m["teams"]["home"]["winner"]: wins += 1
+                        elif m["teams"]["away"]["name"] == team_name and m["teams"]["away"]["winner"]: wins += 1
+                        total += 1
+                except: pass
             
         if total == 0: return 5
         win_pct = wins / total
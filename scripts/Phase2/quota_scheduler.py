@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Call value (lower = more valuable). Anything not listed is treated as PRIORITY_LOW.
+PRIORITY_CRITICAL = 0   # without it nothing else can run (fixture lookup)
+PRIORITY_HIGH = 1       # feeds the model directly (predictions, injuries)
+PRIORITY_MEDIUM = 2     # useful context (lineups, season team stats)
+PRIORITY_LOW = 3        # nice to have (squad key players)
+
+API_FOOTBALL_PRIORITIES = {
+    "/fixtures": PRIORITY_CRITICAL,
+    "/predictions": PRIORITY_HIGH,
+    "/injuries": PRIORITY_HIGH,
+    "/fixtures/lineups": PRIORITY_MEDIUM,
+    "/teams/statistics": PRIORITY_MEDIUM,
+    "/players": PRIORITY_LOW,
+}
+
+# Share of the daily budget that must still be left for a call of each priority
+RESERVE_FRACTIONS = {
+    PRIORITY_CRITICAL: 0.0,
+    PRIORITY_HIGH: 0.05,
+    PRIORITY_MEDIUM: 0.15,
+    PRIORITY_LOW: 0.30,
+}
+
+DEFAULT_STATE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "api_quota"
+
+
+class QuotaScheduler:
+    """
+    Daily request budget for a metered API.
+
+    - Remaining quota is read from the rate-limit response headers when the API
+      sends them (x-ratelimit-requests-remaining / -limit for the daily quota,
+      x-ratelimit-remaining for the per-minute window), otherwise counted locally
+    - The count is persisted per UTC day, so separate runs share one budget
+    - Each call has a priority; low-value calls are skipped once the remaining
+      budget drops below their reserve, keeping the rest for the calls that matter
+      instead of running dry midway through a round
+    """
+
+    def __init__(self, name: str, daily_limit: int, priorities: Optional[Dict[str, int]] = None,
+                 state_dir: Path = DEFAULT_STATE_DIR, reserve_fractions: Optional[Dict[int, float]] = None):
+        self.name = name
+        self.daily_limit = daily_limit
+        self.priorities = dict(priorities or {})
+        self.reserve_fractions = dict(RESERVE_FRACTIONS if reserve_fractions is None else reserve_fractions)
+        self.state_path = Path(state_dir) / f"{name}.json" if state_dir else None
+        self._lock = threading.Lock()
+        self.day = self._today()
+        self.used = 0
+        self.remaining: Optional[int] = None  # last value reported by the API
+        self.minute_remaining: Optional[int] = None
+        self.minute_reset_at = 0.0
+        self.skipped: Dict[str, int] = {}
+        self._load()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _load(self):
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        if state.get("day") == self.day:
+            self.used = state.get("used", 0)
+            self.remaining = state.get("remaining")
+            self.daily_limit = state.get("daily_limit", self.daily_limit)
+
+    def _save(self):
+        if not self.state_path:
+            return
+        state = {"day": self.day, "used": self.used, "remaining": self.remaining,
+                 "daily_limit": self.daily_limit}
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save {self.name} quota state: {e}")
+
+    def _roll_day(self):
+        """Start a fresh budget when the UTC day changes (caller holds the lock)."""
+        today = self._today()
+        if today != self.day:
+            self.day, self.used, self.remaining = today, 0, None
+
+    def priority(self, endpoint: str) -> int:
+        return self.priorities.get(endpoint, PRIORITY_LOW)
+
+    def budget_left(self) -> int:
+        """Requests left today: the API's own figure when known, else limit - used."""
+        with self._lock:
+            self._roll_day()
+            if self.remaining is not None:
+                return self.remaining
+            return max(0, self.daily_limit - self.used)
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Whether a call to endpoint fits the budget. A refused call is counted as
+        skipped; callers treat it like an empty response.
+        """
+        priority = self.priority(endpoint)
+        left = self.budget_left()
+        reserve = int(self.daily_limit * self.reserve_fractions.get(priority, 0.0))
+        if left > reserve or (priority == PRIORITY_CRITICAL and left > 0):
+            self._wait_for_minute_window()
+            return True
+
+        with self._lock:
+            self.skipped[endpoint] = self.skipped.get(endpoint, 0) + 1
+        logger.warning(f"{self.name}: skipping {endpoint} ({left} requests left today, reserve {reserve})")
+        return False
+
+    def _wait_for_minute_window(self):
+        """Sleep out the per-minute window when the API said it is exhausted."""
+        with self._lock:
+            wait = self.minute_reset_at - time.monotonic() if self.minute_remaining == 0 else 0
+            if wait > 0:
+                self.minute_remaining = None
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, headers=None):
+        """Account for one request that was sent, using its response headers when present."""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        with self._lock:
+            self._roll_day()
+            self.used += 1
+
+            limit = _int_header(headers, "x-ratelimit-requests-limit")
+            remaining = _int_header(headers, "x-ratelimit-requests-remaining")
+            if limit:
+                self.daily_limit = limit
+            if remaining is not None:
+                self.remaining = remaining
+            elif self.remaining is not None:
+                self.remaining = max(0, self.remaining - 1)
+
+            minute_remaining = _int_header(headers, "x-ratelimit-remaining")
+            if minute_remaining is not None:
+                self.minute_remaining = minute_remaining
+                self.minute_reset_at = time.monotonic() + 60
+
+            self._save()
+
+    def stats(self) -> Dict:
+        return {
+            "day": self.day,
+            "used": self.used,
+            "remaining": self.budget_left(),
+            "daily_limit": self.daily_limit,
+            "skipped": dict(self.skipped),
+        }
+
+
+def _int_header(headers: Dict, name: str) -> Optional[int]:
+    try:
+        return int(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,82 @@
+import numpy as np
+from typing import Any, Dict, Optional
+
+try:
+    from scripts.Phase2.poisson_ah_model import PoissonAHModel
+    from scripts.Phase2.yudor_fair_odds import MAX_LINE, MIN_LINE, TARGET_ODDS, fair_odds_at_line
+except ImportError:
+    from poisson_ah_model import PoissonAHModel
+    from yudor_fair_odds import MAX_LINE, MIN_LINE, TARGET_ODDS, fair_odds_at_line
+
+# AH lines from the favorite's perspective (the Yudor fair-line range)
+SLATE_LINES = np.arange(MIN_LINE, MAX_LINE + 1e-9, 0.25)
+
+
+class SlatePricer:
+    """
+    Fair AH odds for a whole slate in one array call.
+
+    Every method returns a (matches x lines) fair-odds matrix for the favorite
+    of each match, plus the optimal line (odds closest to 2.0) per match:
+    - "yudor": moneyline x 1.15 / 0.85 per quarter step, from home/away probabilities (%)
+    - "poisson": Dixon-Coles score matrix settled line by line, from home/away xG
+    """
+
+    METHODS = ("yudor", "poisson")
+
+    def __init__(self, lines=SLATE_LINES, poisson_model: Optional[PoissonAHModel] = None):
+        self.lines = np.asarray(lines, dtype=float)
+        self.poisson_model = poisson_model or PoissonAHModel()
+
+    def price(self, method: str, home, away) -> Dict[str, Any]:
+        """
+        Args:
+            method: "yudor" (home / away = win probabilities in %) or
+                    "poisson" (home / away = expected goals)
+            home, away: scalars or 1-D arrays, one entry per match
+
+        Returns:
+            lines, fair_odds (matches x lines), favorite ("home"/"away" per match),
+            optimal_line and optimal_odds per match
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown pricing method '{method}' (expected one of {self.METHODS})")
+
+        home = np.atleast_1d(np.asarray(home, dtype=float))
+        away = np.atleast_1d(np.asarray(away, dtype=float))
+        if method == "yudor":
+            fair_odds, favorite = self._price_yudor(home, away)
+        else:
+            fair_odds, favorite = self._price_poisson(home, away)
+
+        best = np.argmin(np.abs(fair_odds - TARGET_ODDS), axis=1)
+        rows = np.arange(len(best))
+        return {
+            "method": method,
+            "lines": self.lines,
+            "fair_odds": fair_odds,
+            "favorite": favorite,
+            "optimal_line": self.lines[best],
+            "optimal_odds": fair_odds[rows, best]
+        }
+
+    def _price_yudor(self, home_pct: np.ndarray, away_pct: np.ndarray):
+        fav_pct = np.maximum(home_pct, away_pct)
+        favorite = np.where(home_pct > away_pct, "home", "away")
+        return fair_odds_at_line(fav_pct[:, None], self.lines[None, :]), favorite
+
+    def _price_poisson(self, home_xg: np.ndarray, away_xg: np.ndarray):
+        model = self.poisson_model
+        matrices = model.score_matrix(home_xg, away_xg)
+        outcomes = model.match_odds_probabilities(matrices)
+        favorite = np.where(outcomes["home"] > outcomes["away"], "home", "away")
+
+        # Home odds at line L, and away odds at its own line L (home line -L)
+        home_odds = model.price_asian_handicap(matrices, self.lines)["home"]["fair_odds"]
+        away_odds = model.price_asian_handicap(matrices, -self.lines)["away"]["fair_odds"]
+        return np.where((favorite == "home")[:, None], home_odds, away_odds), favorite
+
+
+def price_slate(method: str, home, away, lines=SLATE_LINES) -> Dict[str, Any]:
+    """Convenience wrapper: SlatePricer(lines).price(method, home, away)"""
+    return SlatePricer(lines).price(method, home, away)
@@ -0,0 +1,78 @@
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "squad_cache"
+
+
+class SquadCache:
+    """
+    Persistent per-(team, season) squad store.
+
+    Holds every parsed player record of a squad already ranked by importance
+    (rating, then minutes), so the key players of a team are a list slice instead
+    of a /players download + parse + sort per match. Squads barely change week to
+    week: an entry is served until it is older than max_age_seconds, and refresh
+    can also be forced on demand (APIFootballCollector.refresh_squads).
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_age_seconds: int = 7 * 24 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.max_age_seconds = max_age_seconds
+        self._memory: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(team_id: int, season: int) -> str:
+        return f"{team_id}_{season}"
+
+    def _cache_path(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}.json"
+
+    def get_entry(self, team_id: int, season: int) -> Optional[Dict]:
+        """Cached entry ({"players", "fetched_at"}) whether fresh or not, or None."""
+        cache_key = self._cache_key(team_id, season)
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                return entry
+
+            path = self._cache_path(cache_key)
+            if not path.exists():
+                return None
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+                entry["players"]
+            except (json.JSONDecodeError, OSError, KeyError):
+                return None
+            self._memory[cache_key] = entry
+            return entry
+
+    def is_fresh(self, entry: Optional[Dict]) -> bool:
+        return bool(entry) and (time.time() - entry.get("fetched_at", 0)) < self.max_age_seconds
+
+    def get(self, team_id: int, season: int) -> Optional[List[Dict]]:
+        """Ranked squad if cached and fresh, else None."""
+        entry = self.get_entry(team_id, season)
+        return entry["players"] if self.is_fresh(entry) else None
+
+    def set(self, team_id: int, season: int, players: List[Dict]):
+        """Store a ranked squad in memory and on disk."""
+        cache_key = self._cache_key(team_id, season)
+        entry = {"team_id": team_id, "season": season, "fetched_at": time.time(), "players": players}
+
+        with self._lock:
+            self._memory[cache_key] = entry
+            tmp_path = self._cache_path(cache_key).with_suffix(".tmp")
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, self._cache_path(cache_key))
+            except OSError:
+                # Disk store is best-effort; the in-memory copy still serves this run
+                pass
@@ -9,8 +9,10 @@ Strategy: Use multiple sources, provide fallbacks, document data quality
 
 import sys
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 
 # Try to import soccerdata
@@ -50,6 +52,9 @@ class ComprehensiveStatsScraper:
         'Brasileirão': 'BRA-Serie A',
     }
 
+    # Match tables (schedules, games) are indexed under both home_team and away_team
+    MATCH_TABLE = ('home_team', 'away_team')
+
     def __init__(self, league: str = 'La Liga', season: str = '2425'):
         """Initialize all available data sources"""
         if not SOCCERDATA_AVAILABLE:
@@ -128,6 +133,127 @@ class ComprehensiveStatsScraper:
             logger.warning(f"⚠️  match_history failed: {e}")
             self.match_history = None
 
+        # League-wide tables, each loaded once and indexed by team (see _team_rows)
+        self._tables: Dict[tuple, Dict] = {}
+        self._tables_lock = threading.Lock()
+        self._table_key_locks: Dict[tuple, threading.Lock] = {}
+
+    def _load_table(self, source: str, stat_type: str, reader, team_key='team') -> Dict:
+        """
+        Read one (source, stat_type) table and index its rows by team, once per
+        instance. Every later team is served from the index instead of another
+        league-wide read/parse. A failed read is raised and not stored, so the
+        next caller retries it (a timeout doesn't disable the table for the batch).
+        """
+        key = (source, stat_type)
+        with self._tables_lock:
+            table = self._tables.get(key)
+            if table is None:
+                key_lock = self._table_key_locks.setdefault(key, threading.Lock())
+
+        if table is None:
+            with key_lock:
+                table = self._tables.get(key)
+                if table is None:
+                    df = reader()
+                    table = {'df': df, 'rows': self._index_by_team(df, team_key)}
+                    with self._tables_lock:
+                        self._tables[key] = table
+
+        return table
+
+    @staticmethod
+    def _index_by_team(df: pd.DataFrame, team_key) -> Dict[str, List[int]]:
+        """Team name -> row positions (in table order)."""
+        if team_key == ComprehensiveStatsScraper.MATCH_TABLE:
+            rows: Dict[str, List[int]] = {}
+            for column in team_key:
+                for team, positions in df.groupby(column, sort=False).indices.items():
+                    rows.setdefault(team, []).extend(positions.tolist())
+            return {team: sorted(positions) for team, positions in rows.items()}
+        if team_key in df.columns:
+            groups = df.groupby(team_key, sort=False).indices
+        else:
+            groups = df.groupby(level=team_key, sort=False).indices
+        return {team: positions.tolist() for team, positions in groups.items()}
+
+    def _team_rows(self, source: str, stat_type: str, reader, team_name: str, team_key='team') -> pd.DataFrame:
+        """Rows of one team from an indexed table (empty frame if the team isn't in it)."""
+        table = self._load_table(source, stat_type, reader, team_key)
+        return table['df'].iloc[table['rows'].get(team_name, [])]
+
+    @staticmethod
+    def _team_sides(matches: pd.DataFrame, home_col: str, away_col: str) -> pd.DataFrame:
+        """
+        One row per team per match (team, for, against), home and away sides
+        interleaved in match-table order.
+        """
+        order = np.arange(len(matches))
+        home_team = matches['home_team'].to_numpy()
+        away_team = matches['away_team'].to_numpy()
+        home = pd.DataFrame({'team': home_team, 'for': matches[home_col].to_numpy(),
+                             'against': matches[away_col].to_numpy(), 'order': order})
+        away = pd.DataFrame({'team': away_team, 'for': matches[away_col].to_numpy(),
+                             'against': matches[home_col].to_numpy(), 'order': order})
+        away = away[away_team != home_team]
+        return pd.concat([home, away], ignore_index=True).sort_values('order', kind='stable')
+
+    @classmethod
+    def aggregate_team_xg(cls, match_stats: pd.DataFrame) -> pd.DataFrame:
+        """
+        xG for/against totals and averages of every team in one groupby pass
+        over a match table (home_team, away_team, home_xg, away_xg).
+
+        Returns:
+            DataFrame indexed by team: xG_total, xG_avg, xGA_total, xGA_avg, matches
+        """
+        grouped = cls._team_sides(match_stats, 'home_xg', 'away_xg').groupby('team', sort=False)
+        table = pd.DataFrame({
+            'xG_total': grouped['for'].sum(),
+            'xGA_total': grouped['against'].sum(),
+            'matches': grouped.size(),
+        })
+        table['xG_avg'] = table['xG_total'] / table['matches']
+        table['xGA_avg'] = table['xGA_total'] / table['matches']
+        table.index.name = 'team'
+        return table[['xG_total', 'xG_avg', 'xGA_total', 'xGA_avg', 'matches']]
+
+    @classmethod
+    def aggregate_team_form(cls, schedule: pd.DataFrame, last_n: int = 5) -> pd.DataFrame:
+        """
+        Last-N results string ("WDLWW", oldest first) of every team in one pass
+        over a schedule (home_team, away_team, home_score, away_score).
+        Unplayed/missing scores count as D, as in the per-team loop it replaces.
+
+        Returns:
+            DataFrame indexed by team with a 'form' column
+        """
+        sides = cls._team_sides(schedule, 'home_score', 'away_score')
+        last = sides.groupby('team', sort=False).tail(last_n)
+        results = np.select(
+            [last['for'].to_numpy() > last['against'].to_numpy(),
+             last['for'].to_numpy() < last['against'].to_numpy()],
+            ['W', 'L'], 'D'
+        )
+        form = pd.Series(results, index=last['team'].to_numpy()).groupby(level=0, sort=False).agg(''.join)
+        table = form.to_frame('form')
+        table.index.name = 'team'
+        return table
+
+    def get_league_xg_table(self) -> pd.DataFrame:
+        """Understat xG aggregates for the whole league (computed once per instance)."""
+        return self._load_table('understat', 'team_xg', lambda: self.aggregate_team_xg(
+            self._load_table('understat', 'team_match', self.understat.read_team_match_stats,
+                             self.MATCH_TABLE)['df']
+        ))['df']
+
+    def get_league_form_table(self, last_n: int = 5) -> pd.DataFrame:
+        """SofaScore last-N form strings for the whole league (computed once per instance)."""
+        return self._load_table('sofascore', f'form_{last_n}', lambda: self.aggregate_team_form(
+            self._load_table('sofascore', 'schedule', self.sofascore.read_schedule,
+                             self.MATCH_TABLE)['df'], last_n
+        ))['df']
+
     def get_all_team_stats(self, team_name: str) -> Dict:
         """
         Get ALL available statistics for a team from all sources
@@ -227,8 +353,11 @@ class ComprehensiveStatsScraper:
 
         for stat_type in stat_types:
             try:
-                stats = self.fbref.read_team_season_stats(stat_type=stat_type)
-                team_data = stats[stats.index.get_level_values('team') == team_name]
+                team_data = self._team_rows(
+                    'fbref', stat_type,
+                    lambda stat_type=stat_type: self.fbref.read_team_season_stats(stat_type=stat_type),
+                    team_name
+                )
 
                 if not team_data.empty:
                     # Convert to dict, keeping only numeric values
@@ -250,8 +379,11 @@ class ComprehensiveStatsScraper:
 
         # Get player stats for Q14 (player form)
         try:
-            player_stats = self.fbref.read_player_season_stats(stat_type='standard')
-            team_players = player_stats[player_stats.index.get_level_values('team') == team_name]
+            team_players = self._team_rows(
+                'fbref', 'player_standard',
+                lambda: self.fbref.read_player_season_stats(stat_type='standard'),
+                team_name
+            )
 
             if not team_players.empty:
                 # Get top 5 players by minutes
@@ -284,8 +416,7 @@ class ComprehensiveStatsScraper:
 
         try:
             # League table
-            table = self.sofascore.read_league_table()
-            team_row = table[table.index.get_level_values('team') == team_name]
+            team_row = self._team_rows('sofascore', 'league_table', self.sofascore.read_league_table, team_name)
 
             if not team_row.empty:
                 sofascore_stats['league_table'] = {
@@ -303,31 +434,10 @@ class ComprehensiveStatsScraper:
             logger.debug(f"  ⚠️  League table not available: {e}")
 
         try:
-            # Schedule/results for recent form
-            schedule = self.sofascore.read_schedule()
-            # Filter team matches and get last 5
-            team_matches = schedule[
-                (schedule['home_team'] == team_name) |
-                (schedule['away_team'] == team_name)
-            ].tail(5)
-
-            if not team_matches.empty:
-                form = []
-                for idx, match in team_matches.iterrows():
-                    is_home = match['home_team'] == team_name
-                    team_score = match['home_score'] if is_home else match['away_score']
-                    opp_score = match['away_score'] if is_home else match['home_score']
-
-                    if team_score > opp_score:
-                        result = 'W'
-                    elif team_score < opp_score:
-                        result = 'L'
-                    else:
-                        result = 'D'
-
-                    form.append(result)
-
-                sofascore_stats['recent_form'] = ''.join(form)
+            # Schedule/results for recent form (last 5, from the league-wide form table)
+            forms = self.get_league_form_table(last_n=5)
+            if team_name in forms.index:
+                sofascore_stats['recent_form'] = forms.at[team_name, 'form']
                 logger.info(f"  ✅ recent_form: {sofascore_stats['recent_form']}")
 
         except Exception as e:
@@ -343,8 +453,7 @@ class ComprehensiveStatsScraper:
 
         try:
             # League table (FotMob also has this)
-            table = self.fotmob.read_league_table()
-            team_row = table[table.index.get_level_values('team') == team_name]
+            team_row = self._team_rows('fotmob', 'league_table', self.fotmob.read_league_table, team_name)
 
             if not team_row.empty:
                 fotmob_stats['league_position'] = int(team_row['idx'].values[0])
@@ -362,34 +471,18 @@ class ComprehensiveStatsScraper:
         understat_stats = {}
 
         try:
-            # Team match stats (xG per match)
-            match_stats = self.understat.read_team_match_stats()
-
-            # Filter for this team (can be home or away)
-            team_matches = match_stats[
-                (match_stats['home_team'] == team_name) |
-                (match_stats['away_team'] == team_name)
-            ]
-
-            if not team_matches.empty:
-                # Calculate team's xG (home_xg when home, away_xg when away)
-                xg_values = []
-                xga_values = []
-
-                for idx, match in team_matches.iterrows():
-                    if match['home_team'] == team_name:
-                        xg_values.append(match['home_xg'])
-                        xga_values.append(match['away_xg'])
-                    else:
-                        xg_values.append(match['away_xg'])
-                        xga_values.append(match['home_xg'])
+            # Team match stats (xG per match), aggregated for the whole league at once:
+            # home_xg when home, away_xg when away
+            xg_table = self.get_league_xg_table()
 
+            if team_name in xg_table.index:
+                row = xg_table.loc[team_name]
                 understat_stats['team_xg'] = {
-                    'xG_total': float(sum(xg_values)),
-                    'xG_avg': float(sum(xg_values) / len(xg_values)),
-                    'xGA_total': float(sum(xga_values)),
-                    'xGA_avg': float(sum(xga_values) / len(xga_values)),
-                    'matches': len(team_matches)
+                    'xG_total': float(row['xG_total']),
+                    'xG_avg': float(row['xG_avg']),
+                    'xGA_total': float(row['xGA_total']),
+                    'xGA_avg': float(row['xGA_avg']),
+                    'matches': int(row['matches'])
                 }
                 logger.info(f"  ✅ team_xg: xG avg {understat_stats['team_xg']['xG_avg']:.2f}")
 
@@ -398,10 +491,10 @@ class ComprehensiveStatsScraper:
 
         try:
             # Player stats (individual xG/xAG for Q14 player form)
-            player_stats = self.understat.read_player_season_stats()
-
-            # Filter for this team's players
-            team_players = player_stats[player_stats['team'] == team_name]
+            # This team's players
+            team_players = self._team_rows(
+                'understat', 'player_season', self.understat.read_player_season_stats, team_name
+            )
 
             if not team_players.empty:
                 # Get top 5 players by xG
@@ -471,13 +564,10 @@ class ComprehensiveStatsScraper:
 
         try:
             # Get full schedule (all games in season)
-            games = self.match_history.read_games()
-
-            # Filter for this team's matches
-            team_matches = games[
-                (games['home_team'] == team_name) |
-                (games['away_team'] == team_name)
-            ]
+            # This team's matches
+            team_matches = self._team_rows(
+                'match_history', 'games', self.match_history.read_games, team_name, self.MATCH_TABLE
+            )
 
             if not team_matches.empty:
                 # Calculate overall record
@@ -0,0 +1,112 @@
+import math
+import numpy as np
+from typing import Dict, Tuple
+
+# Yudor v5.3 Layer 1 (YUDOR_MASTER_PROMPT_v5.3, "Cálculo Linha AH"):
+# the favorite's moneyline (100 / favorite %) is its price at AH -0.5, and every
+# 0.25 step multiplies it by 1.15 (more negative line, harder to cover) or by
+# 0.85 (less negative / positive line, easier to cover).
+BASE_LINE = -0.5
+STEP = 0.25
+HARDER = 1.15
+EASIER = 0.85
+TARGET_ODDS = 2.0
+
+# Line range searched for the fair line (favorite's perspective)
+MIN_LINE = -3.0
+MAX_LINE = 3.0
+
+_LOG_HARDER = math.log(HARDER)
+_LOG_EASIER = math.log(EASIER)
+
+
+def moneyline(fav_prob_pct):
+    """Favorite's moneyline odds = its price at AH -0.5 (999 for a 0% favorite)."""
+    fav_prob_pct = np.asarray(fav_prob_pct, dtype=float)
+    with np.errstate(divide="ignore"):
+        return np.where(fav_prob_pct > 0, 100 / fav_prob_pct, 999.0)[()]
+
+
+def harder_steps(ah_line):
+    """Quarter steps from -0.5 to ah_line; positive = harder for the favorite."""
+    return ((BASE_LINE - np.asarray(ah_line, dtype=float)) / STEP)[()]
+
+
+def odds_from_moneyline(odd_ml, ah_line):
+    """Fair odds at ah_line given the moneyline. Broadcasts over both arguments."""
+    steps = harder_steps(ah_line)
+    factor = np.where(steps > 0, np.power(HARDER, steps), np.power(EASIER, np.abs(steps)))
+    return (np.asarray(odd_ml, dtype=float) * factor)[()]
+
+
+def fair_odds_at_line(fav_prob_pct, ah_line):
+    """
+    Unrounded fair odds of the favorite at ah_line.
+
+    Args:
+        fav_prob_pct: favorite probability as PERCENTAGE (36.2, not 0.362); scalar or array
+        ah_line: AH line(s) from the favorite's perspective; broadcasts against fav_prob_pct
+
+    Example:
+        fair_odds_at_line(36.2, -0.25) -> 100/36.2 x 0.85 = 2.348
+    """
+    return odds_from_moneyline(moneyline(fav_prob_pct), ah_line)
+
+
+def solve_optimal_line(fav_prob_pct, min_line: float = MIN_LINE, max_line: float = MAX_LINE) -> Dict:
+    """
+    AH line (favorite's perspective) whose fair odds are closest to 2.0, in O(1).
+
+    Odds grow geometrically with each harder step, so the exact step count hitting
+    2.0 is log(2.0 / moneyline) / log(1.15) on the harder side and
+    log(2.0 / moneyline) / log(0.85) (negated) on the easier side. Only the two
+    whole steps around it can be closest; ties go to the harder line. Works on
+    scalars and arrays alike.
+
+    Returns:
+        {
+            'moneyline', 'line', 'odds',
+            'easier_line', 'easier_odds',   # one step towards max_line (lower odds)
+            'harder_line', 'harder_odds'    # one step towards min_line (higher odds)
+        }
+        Unrounded; scalars for a scalar input, else arrays shaped like it.
+        A neighbour outside [min_line, max_line] is NaN.
+    """
+    odd_ml = np.asarray(moneyline(fav_prob_pct), dtype=float)
+    ratio = np.log(TARGET_ODDS / odd_ml)
+    exact = np.where(ratio > 0, ratio / _LOG_HARDER, -ratio / _LOG_EASIER)
+
+    # Harder steps are bounded by the most negative line and vice versa
+    lo = harder_steps(max_line)
+    hi = harder_steps(min_line)
+    below = np.clip(np.floor(exact), lo, hi)
+    above = np.clip(np.ceil(exact), lo, hi)
+
+    odds_below = odds_from_moneyline(odd_ml, BASE_LINE - below * STEP)
+    odds_above = odds_from_moneyline(odd_ml, BASE_LINE - above * STEP)
+    take_above = np.abs(odds_above - TARGET_ODDS) <= np.abs(odds_below - TARGET_ODDS)
+    steps = np.where(take_above, above, below)
+
+    easier = np.where(steps - 1 >= lo, steps - 1, np.nan)
+    harder = np.where(steps + 1 <= hi, steps + 1, np.nan)
+    solution = {
+        "moneyline": odd_ml,
+        "line": BASE_LINE - steps * STEP,
+        "odds": np.where(take_above, odds_above, odds_below),
+        "easier_line": BASE_LINE - easier * STEP,
+        "harder_line": BASE_LINE - harder * STEP
+    }
+    solution["easier_odds"] = odds_from_moneyline(odd_ml, solution["easier_line"])
+    solution["harder_odds"] = odds_from_moneyline(odd_ml, solution["harder_line"])
+    return {key: np.asarray(value)[()] for key, value in solution.items()}
+
+
+def optimal_line(fav_prob_pct, min_line: float = MIN_LINE, max_line: float = MAX_LINE) -> Tuple:
+    """
+    (line, odds) closest to 2.0 - the core of solve_optimal_line.
+
+    Returns:
+        (line, odds), unrounded; scalars for a scalar input, else arrays shaped like it
+    """
+    solution = solve_optimal_line(fav_prob_pct, min_line, max_line)
+    return solution["line"], solution["odds"]
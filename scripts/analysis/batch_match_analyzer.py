@@ -16,6 +16,7 @@ This ensures you can learn from ALL matches, not just perfect ones!
 
 Usage:
     python3 scripts/batch_match_analyzer.py matches.csv
+    python3 scripts/batch_match_analyzer.py matches.csv --workers 4   # one process per league group
 
 CSV Format:
     Date,League,Home,Away,Stadium
@@ -25,22 +26,98 @@ CSV Format:
 import sys
 sys.path.insert(0, '/tmp/soccerdata')
 
+import os
 import csv
 import json
 import time
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from complete_match_analyzer import CompleteMatchAnalyzer
+from team_urls_helper import TeamURLsHelper
+
+
+class AnalyzerRegistry:
+    """
+    Warm CompleteMatchAnalyzer instances keyed by (league, season)
+
+    Building an analyzer initialises every soccerdata reader (FBref, FotMob,
+    Understat, ClubElo, 5-season MatchHistory) and loads the team URL databases,
+    so all matches of a league share one analyzer and all leagues share one
+    TeamURLsHelper. A failed initialisation is not cached (the next match retries).
+    """
+
+    def __init__(self):
+        self._analyzers: Dict[Tuple[str, str], CompleteMatchAnalyzer] = {}
+        self._url_helper: Optional[TeamURLsHelper] = None
+        self._lock = threading.Lock()
+        self.init_seconds: Dict[Tuple[str, str], float] = {}  # (league, season) -> build time
+
+    def get(self, league: str, season: str = '2425') -> CompleteMatchAnalyzer:
+        """Analyzer for a league/season, built on first use"""
+        key = (league, season)
+        with self._lock:
+            analyzer = self._analyzers.get(key)
+            if analyzer is None:
+                if self._url_helper is None:
+                    self._url_helper = TeamURLsHelper()
+                started = time.time()
+                analyzer = CompleteMatchAnalyzer(league=league, season=season, url_helper=self._url_helper)
+                self.init_seconds[key] = time.time() - started
+                self._analyzers[key] = analyzer
+            return analyzer
+
+    def __len__(self) -> int:
+        return len(self._analyzers)
+
+
+_registry: Optional[AnalyzerRegistry] = None
+
+
+def get_registry() -> AnalyzerRegistry:
+    """Process-wide registry (each worker process keeps its own warm analyzers)"""
+    global _registry
+    if _registry is None:
+        _registry = AnalyzerRegistry()
+    return _registry
+
+
+def _process_league_group(league: str, matches: List[Tuple[int, Dict]], season: str) -> Dict:
+    """
+    Worker process entry point: analyze one league's matches with the worker's
+    own warm analyzer.
+
+    Returns:
+        {'results': [(input index, result), ...], 'timing': {...}}
+    """
+    started = time.time()
+    batch = BatchMatchAnalyzer(season=season)
+    results = [(idx, batch._run_match(idx, total, match)) for idx, total, match in matches]
+    return {
+        'results': results,
+        'timing': {
+            'pid': os.getpid(),
+            'league': league,
+            'matches': len(matches),
+            'init_time': round(batch.registry.init_seconds.get((league, season), 0.0), 1),
+            'elapsed': round(time.time() - started, 1)
+        }
+    }
 
 
 class BatchMatchAnalyzer:
     """Automated batch processing for multiple matches"""
 
-    def __init__(self):
+    def __init__(self, season: str = '2425', registry: Optional[AnalyzerRegistry] = None):
         self.results = []
         self.start_time = None
+        self.season = season
+        self.registry = registry or get_registry()
+        self.worker_timings: List[Dict] = []  # per league group in --workers mode
 
     def read_matches_from_csv(self, csv_file: str) -> List[Dict]:
         """Read matches from CSV file"""
@@ -72,9 +149,15 @@ class BatchMatchAnalyzer:
         cleaned = re.sub(r'[^\x00-\x7F]+', '', league).strip()
         return cleaned
 
-    def process_all_matches(self, matches: List[Dict]) -> Dict:
-        """Process all matches with complete automation"""
+    def process_all_matches(self, matches: List[Dict], workers: int = 1) -> Dict:
+        """
+        Process all matches with complete automation
+
+        workers > 1 groups the matches by league and runs each group in its own
+        process (soccerdata parsing is CPU-bound pandas work that holds the GIL).
+        """
         self.start_time = time.time()
+        self.worker_timings = []
 
         print("\n" + "="*80)
         print("YUDOR BETTING SYSTEM - AUTOMATED BATCH PROCESSING")
@@ -83,45 +166,87 @@ class BatchMatchAnalyzer:
         print(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         print("="*80 + "\n")
 
-        for idx, match in enumerate(matches, 1):
-            print(f"\n{'='*80}")
-            print(f"MATCH {idx}/{len(matches)}: {match['home']} vs {match['away']}")
-            print(f"League: {match['league']} | Date: {match['date']}")
-            print('='*80 + "\n")
-
-            try:
-                result = self._process_single_match(match)
-                self.results.append(result)
-
-                # Show quick summary
-                if result['success']:
-                    print(f"\n✅ SUCCESS: {result['sources']} sources | Quality: {result['quality']}/5.0")
-                    print(f"   H2H: {result['h2h_matches']} matches | File: {result['filename']}")
-                else:
-                    print(f"\n⚠️  LIMITED DATA: {result['sources']} sources | Quality: {result['quality']}/5.0")
-
-            except Exception as e:
-                print(f"\n❌ ERROR: {e}")
-                self.results.append({
-                    'match': f"{match['home']} vs {match['away']}",
-                    'league': match['league'],
-                    'success': False,
-                    'error': str(e),
-                    'sources': 0,
-                    'quality': 0.0
-                })
-
-            # Brief pause between matches to avoid overload
-            if idx < len(matches):
-                time.sleep(1)
+        leagues = {match['league'] for match in matches}
+        if workers > 1 and len(leagues) > 1:
+            self._process_league_groups(matches, workers)
+        else:
+            for idx, match in enumerate(matches, 1):
+                self.results.append(self._run_match(idx, len(matches), match))
 
         # Generate final summary
         return self._generate_summary_report()
 
+    def _process_league_groups(self, matches: List[Dict], workers: int):
+        """Dispatch one league per worker process; results stream in as groups finish"""
+        groups: Dict[str, List[Tuple[int, int, Dict]]] = {}
+        for idx, match in enumerate(matches, 1):
+            groups.setdefault(match['league'], []).append((idx, len(matches), match))
+
+        workers = min(workers, len(groups))
+        print(f"🧵 {len(groups)} leagues across {workers} worker processes\n")
+
+        by_index = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_process_league_group, league, group, self.season): league
+                for league, group in groups.items()
+            }
+            for future in as_completed(futures):
+                league = futures[future]
+                try:
+                    done = future.result()
+                except Exception as e:
+                    print(f"\n❌ WORKER ERROR ({league}): {e}")
+                    done = {'results': [(idx, self._error_result(match, e)) for idx, _, match in groups[league]],
+                            'timing': {'pid': None, 'league': league, 'matches': len(groups[league]),
+                                       'init_time': 0.0, 'elapsed': 0.0}}
+
+                for idx, result in done['results']:
+                    by_index[idx] = result
+                self.worker_timings.append(done['timing'])
+                print(f"📥 {league}: {done['timing']['matches']} matches in {done['timing']['elapsed']}s "
+                      f"(worker {done['timing']['pid']})")
+
+        # Summary lists matches in input order
+        self.results = [by_index[idx] for idx in sorted(by_index)]
+
+    def _run_match(self, idx: int, total: int, match: Dict) -> Dict:
+        """Analyze one match, printing progress; errors become a failed result"""
+        print(f"\n{'='*80}")
+        print(f"MATCH {idx}/{total}: {match['home']} vs {match['away']}")
+        print(f"League: {match['league']} | Date: {match['date']}")
+        print('='*80 + "\n")
+
+        try:
+            result = self._process_single_match(match)
+
+            # Show quick summary
+            if result['success']:
+                print(f"\n✅ SUCCESS: {result['sources']} sources | Quality: {result['quality']}/5.0")
+                print(f"   H2H: {result['h2h_matches']} matches | File: {result['filename']}")
+            else:
+                print(f"\n⚠️  LIMITED DATA: {result['sources']} sources | Quality: {result['quality']}/5.0")
+            return result
+
+        except Exception as e:
+            print(f"\n❌ ERROR: {e}")
+            return self._error_result(match, e)
+
+    @staticmethod
+    def _error_result(match: Dict, error: Exception) -> Dict:
+        return {
+            'match': f"{match['home']} vs {match['away']}",
+            'league': match['league'],
+            'success': False,
+            'error': str(error),
+            'sources': 0,
+            'quality': 0.0
+        }
+
     def _process_single_match(self, match: Dict) -> Dict:
         """Process a single match"""
-        # Initialize analyzer
-        analyzer = CompleteMatchAnalyzer(league=match['league'], season='2425')
+        # Warm analyzer for this league (built once per league/season)
+        analyzer = self.registry.get(match['league'], self.season)
 
         # Run analysis
         match_data = analyzer.analyze_match(match['home'], match['away'])
@@ -181,6 +306,8 @@ class BatchMatchAnalyzer:
             'processing_time': f"{elapsed_time:.1f}s",
             'matches': self.results
         }
+        if self.worker_timings:
+            summary['workers'] = self._summarize_workers(self.worker_timings)
 
         # Print summary
         self._print_summary(summary)
@@ -197,6 +324,20 @@ class BatchMatchAnalyzer:
 
         return summary
 
+    @staticmethod
+    def _summarize_workers(timings: List[Dict]) -> List[Dict]:
+        """Per-worker-process totals (a process may have handled several leagues)"""
+        workers: Dict = {}
+        for timing in timings:
+            worker = workers.setdefault(timing['pid'], {
+                'pid': timing['pid'], 'leagues': [], 'matches': 0, 'init_time': 0.0, 'elapsed': 0.0
+            })
+            worker['leagues'].append(timing['league'])
+            worker['matches'] += timing['matches']
+            worker['init_time'] = round(worker['init_time'] + timing['init_time'], 1)
+            worker['elapsed'] = round(worker['elapsed'] + timing['elapsed'], 1)
+        return list(workers.values())
+
     def _print_summary(self, summary: Dict):
         """Print formatted summary report"""
         print("\n\n" + "="*80)
@@ -211,6 +352,14 @@ class BatchMatchAnalyzer:
         print(f"🔢 Total Data Sources: {summary['total_sources']}")
         print(f"⏱️  Processing Time: {summary['processing_time']}")
 
+        if summary.get('workers'):
+            print("\n" + "-"*80)
+            print("WORKER PROCESSES:")
+            print("-"*80 + "\n")
+            for worker in summary['workers']:
+                print(f"🧵 Worker {worker['pid']}: {worker['matches']} matches | "
+                      f"{worker['elapsed']}s (init {worker['init_time']}s) | {', '.join(worker['leagues'])}")
+
         print("\n" + "-"*80)
         print("HIGH QUALITY MATCHES (saved to high_quality/):")
         print("-"*80 + "\n")
@@ -220,8 +369,8 @@ class BatchMatchAnalyzer:
         if high_quality_matches:
             for result in high_quality_matches:
                 print(f"✅ {result['match']} ({result['league']})")
-                print(f"   Sources: {result['sources']} | Quality: {result['quality']}/5.0 | H2H: {result['h2h_matches']} matches")
-                print(f"   File: {result['filename']}")
+                print(f"   Sources: {result['sources']} | Quality: {result['quality']}/5.0 | H2H: {result.get('h2h_matches', 0)} matches")
+                print(f"   File: {result.get('filename', result.get('error', 'N/A'))}")
                 print()
         else:
             print("   No high quality matches (5+ sources)\n")
@@ -234,8 +383,8 @@ class BatchMatchAnalyzer:
             print("-"*80 + "\n")
             for result in low_quality_matches:
                 print(f"⚠️  {result['match']} ({result['league']})")
-                print(f"   Sources: {result['sources']} | Quality: {result['quality']}/5.0 | H2H: {result['h2h_matches']} matches")
-                print(f"   File: {result['filename']}")
+                print(f"   Sources: {result['sources']} | Quality: {result['quality']}/5.0 | H2H: {result.get('h2h_matches', 0)} matches")
+                print(f"   File: {result.get('filename', result.get('error', 'N/A'))}")
                 print()
 
         print("="*80)
@@ -247,14 +396,16 @@ class BatchMatchAnalyzer:
 
 def main():
     """Main execution"""
-    if len(sys.argv) < 2:
-        print("Usage: python3 scripts/batch_match_analyzer.py <matches.csv>")
-        print("\nCSV Format:")
-        print("  Date,League,Home,Away,Stadium")
-        print("  24/11,Premier League,Manchester United,Everton,Old Trafford")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Analyze every match of a CSV (Date,League,Home,Away,Stadium)",
+        epilog="Example row: 24/11,Premier League,Manchester United,Everton,Old Trafford"
+    )
+    parser.add_argument("csv_file", help="Matches CSV")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes; >1 runs each league in its own process (default: 1)")
+    args = parser.parse_args()
 
-    csv_file = sys.argv[1]
+    csv_file = args.csv_file
 
     if not Path(csv_file).exists():
         print(f"❌ Error: File '{csv_file}' not found!")
@@ -263,7 +414,7 @@ def main():
     # Run batch processing
     analyzer = BatchMatchAnalyzer()
     matches = analyzer.read_matches_from_csv(csv_file)
-    summary = analyzer.process_all_matches(matches)
+    summary = analyzer.process_all_matches(matches, workers=args.workers)
 
     # Exit with appropriate code
     sys.exit(0 if summary['failed'] == 0 else 1)
@@ -16,6 +16,7 @@ from datetime import datetime
 
 from comprehensive_stats_scraper import ComprehensiveStatsScraper
 from team_urls_helper import TeamURLsHelper
+from h2h_index import H2HIndex
 from sportsmole_match_finder import get_sportsmole_match_url
 
 
@@ -158,8 +159,8 @@ class CompleteMatchAnalyzer:
     - Provides complete data package ready for Claude AI
     """
 
-    def __init__(self, league: str, season: str = '2425'):
-        """Initialize analyzer with league and season"""
+    def __init__(self, league: str, season: str = '2425', url_helper: Optional[TeamURLsHelper] = None):
+        """Initialize analyzer with league and season (url_helper can be shared between analyzers)"""
         self.league = league
         self.season = season
 
@@ -170,20 +171,42 @@ class CompleteMatchAnalyzer:
         print('='*80 + "\n")
 
         self.stats_scraper = ComprehensiveStatsScraper(league=league, season=season)
-        self.url_helper = TeamURLsHelper()
+        self.url_helper = url_helper or TeamURLsHelper()
 
         # Cache available team names from MatchHistory for automatic matching
         self._available_teams_cache = None
+        # H2H records of every pair in MatchHistory (built or loaded on first use)
+        self._h2h_index = None
 
         print(f"✅ All systems initialized\n")
 
+    def _h2h_index_path(self) -> Path:
+        league = self.league.replace(' ', '_')
+        return Path(__file__).parent.parent / 'scraped_data' / 'h2h_index' / f"{league}_{self.season}.json"
+
+    def _get_h2h_index(self) -> H2HIndex:
+        """H2H index for this league: loaded from disk if fresh, else built from MatchHistory and saved"""
+        if self._h2h_index is None:
+            path = self._h2h_index_path()
+            index = H2HIndex.load(path)
+            if index is None:
+                index = H2HIndex.build(self.stats_scraper.match_history.read_games())
+                try:
+                    index.save(path)
+                except OSError as e:
+                    print(f"⚠️  Could not save H2H index: {e}")
+            self._h2h_index = index
+        return self._h2h_index
+
     def _get_available_teams(self) -> list:
         """Get list of all available team names in MatchHistory database (cached)"""
         if self._available_teams_cache is not None:
             return self._available_teams_cache
 
         try:
-            if self.stats_scraper.match_history:
+            if self._h2h_index is not None:
+                self._available_teams_cache = list(self._h2h_index.teams)
+            elif self.stats_scraper.match_history:
                 games = self.stats_scraper.match_history.read_games()
                 home_teams = set(games['home_team'].unique())
                 away_teams = set(games['away_team'].unique())
@@ -302,23 +325,10 @@ class CompleteMatchAnalyzer:
         return match_data
 
     def _calculate_h2h(self, home_team: str, away_team: str) -> Dict:
-        """Calculate head-to-head record from match_history with automatic team name matching"""
-        import pandas as pd
-
-        h2h = {
-            'home_wins': 0,
-            'draws': 0,
-            'away_wins': 0,
-            'home_goals': 0,
-            'away_goals': 0,
-            'total_matches': 0,
-            'last_5_results': [],
-            'recent_meetings': []
-        }
-
+        """Head-to-head record from the MatchHistory H2H index with automatic team name matching"""
         try:
-            # Get all games from match_history
-            games = self.stats_scraper.match_history.read_games()
+            # Prebuilt once per league (every pair's meetings and totals)
+            index = self._get_h2h_index()
 
             # Get available team names from database
             available_teams = self._get_available_teams()
@@ -328,65 +338,12 @@ class CompleteMatchAnalyzer:
             home_team_normalized = _team_matcher.find_best_match(home_team, available_teams)
             away_team_normalized = _team_matcher.find_best_match(away_team, available_teams)
 
-            # Filter for matches between these two teams (using normalized names)
-            h2h_matches = games[
-                ((games['home_team'] == home_team_normalized) & (games['away_team'] == away_team_normalized)) |
-                ((games['home_team'] == away_team_normalized) & (games['away_team'] == home_team_normalized))
-            ]
-
-            if not h2h_matches.empty:
-                h2h['total_matches'] = len(h2h_matches)
-
-                # Calculate H2H record
-                for idx, match in h2h_matches.iterrows():
-                    home_score = match['FTHG']  # Full Time Home Goals
-                    away_score = match['FTAG']  # Full Time Away Goals
-
-                    if pd.notna(home_score) and pd.notna(away_score):
-                        # Determine result from home_team's perspective (using normalized names for comparison)
-                        if match['home_team'] == home_team_normalized:
-                            # home_team was playing at home
-                            h2h['home_goals'] += int(home_score)
-                            h2h['away_goals'] += int(away_score)
-                            if home_score > away_score:
-                                h2h['home_wins'] += 1
-                                result = 'W'
-                            elif home_score < away_score:
-                                h2h['away_wins'] += 1
-                                result = 'L'
-                            else:
-                                h2h['draws'] += 1
-                                result = 'D'
-                        else:
-                            # home_team was playing away
-                            h2h['home_goals'] += int(away_score)
-                            h2h['away_goals'] += int(home_score)
-                            if away_score > home_score:
-                                h2h['home_wins'] += 1
-                                result = 'W'
-                            elif away_score < home_score:
-                                h2h['away_wins'] += 1
-                                result = 'L'
-                            else:
-                                h2h['draws'] += 1
-                                result = 'D'
-
-                        # Add to recent meetings
-                        h2h['recent_meetings'].append({
-                            'date': str(match.get('date', 'Unknown')),
-                            'home': match['home_team'],
-                            'away': match['away_team'],
-                            'score': f"{int(home_score)}-{int(away_score)}",
-                            'result_for_home_team': result
-                        })
-
-                # Get last 5 results
-                h2h['last_5_results'] = [m['result_for_home_team'] for m in h2h['recent_meetings'][-5:]]
+            return index.head_to_head(home_team_normalized, away_team_normalized)
 
         except Exception as e:
             print(f"⚠️  H2H calculation error: {e}")
 
-        return h2h
+        return H2HIndex().head_to_head(home_team, away_team)
 
     def _generate_summary(self, match_data: Dict) -> Dict:
         """Generate analysis summary"""
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Head-to-Head Index - every H2H record of a league, prebuilt from MatchHistory
+
+One pass over the (multi-season) games frame groups all meetings by unordered
+team pair. Looking up any pair is then a dictionary access instead of a scan of
+the whole frame, and the index is saved to JSON so later runs skip the build.
+
+Record format (also accepted by Q17_H2HDominance in both Q-scorer modules):
+    {
+        'teams': [team_a, team_b],          # canonical (sorted) pair
+        'total_matches': 7,                 # all meetings, including ones without a score
+        'matches': [                        # scored meetings, oldest first
+            {'date', 'home_team', 'away_team', 'home_goals', 'away_goals', 'winner'}, ...
+        ],
+        'wins': {team_a: 3, team_b: 2},
+        'draws': 2,
+        'goals': {team_a: 9, team_b: 6}
+    }
+"""
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Rebuild a saved index after this long (MatchHistory gains new results weekly)
+DEFAULT_MAX_AGE_SECONDS = 24 * 3600
+
+
+class H2HIndex:
+    """H2H records keyed by unordered team pair"""
+
+    def __init__(self, records: Optional[Dict[Tuple[str, str], Dict]] = None):
+        self.records = records or {}
+        self.teams = sorted({team for pair in self.records for team in pair})
+
+    @staticmethod
+    def pair_key(team_a: str, team_b: str) -> Tuple[str, str]:
+        """Same key whichever team is at home"""
+        return (team_a, team_b) if team_a <= team_b else (team_b, team_a)
+
+    @classmethod
+    def build(cls, games: pd.DataFrame) -> 'H2HIndex':
+        """
+        Build the index from a MatchHistory games frame
+        (home_team, away_team, FTHG, FTAG and optionally date).
+        """
+        if 'date' in games.columns:
+            games = games.sort_values('date', kind='stable')
+
+        records: Dict[Tuple[str, str], Dict] = {}
+        dates = games['date'] if 'date' in games.columns else pd.Series('Unknown', index=games.index)
+
+        for home, away, home_goals, away_goals, date in zip(
+            games['home_team'], games['away_team'], games['FTHG'], games['FTAG'], dates
+        ):
+            key = cls.pair_key(home, away)
+            record = records.get(key)
+            if record is None:
+                record = records[key] = {
+                    'teams': list(key),
+                    'total_matches': 0,
+                    'matches': [],
+                    'wins': {key[0]: 0, key[1]: 0},
+                    'draws': 0,
+                    'goals': {key[0]: 0, key[1]: 0}
+                }
+            record['total_matches'] += 1
+
+            if pd.isna(home_goals) or pd.isna(away_goals):
+                continue
+            home_goals, away_goals = int(home_goals), int(away_goals)
+
+            record['goals'][home] += home_goals
+            record['goals'][away] += away_goals
+            if home_goals > away_goals:
+                record['wins'][home] += 1
+                winner = 'home'
+            elif home_goals < away_goals:
+                record['wins'][away] += 1
+                winner = 'away'
+            else:
+                record['draws'] += 1
+                winner = 'draw'
+
+            record['matches'].append({
+                'date': str(date),
+                'home_team': home,
+                'away_team': away,
+                'home_goals': home_goals,
+                'away_goals': away_goals,
+                'winner': winner
+            })
+
+        return cls(records)
+
+    def lookup(self, team_a: str, team_b: str) -> Optional[Dict]:
+        """H2H record for a pair (either order), or None if they never met"""
+        return self.records.get(self.pair_key(team_a, team_b))
+
+    def head_to_head(self, home_team: str, away_team: str) -> Dict:
+        """
+        H2H summary from home_team's perspective (the CompleteMatchAnalyzer
+        'head_to_head' format).
+        """
+        h2h = {
+            'home_wins': 0,
+            'draws': 0,
+            'away_wins': 0,
+            'home_goals': 0,
+            'away_goals': 0,
+            'total_matches': 0,
+            'last_5_results': [],
+            'recent_meetings': []
+        }
+        record = self.lookup(home_team, away_team)
+        if record is None:
+            return h2h
+
+        h2h['total_matches'] = record['total_matches']
+        h2h['home_wins'] = record['wins'].get(home_team, 0)
+        h2h['away_wins'] = record['wins'].get(away_team, 0)
+        h2h['draws'] = record['draws']
+        h2h['home_goals'] = record['goals'].get(home_team, 0)
+        h2h['away_goals'] = record['goals'].get(away_team, 0)
+
+        for match in record['matches']:
+            if match['winner'] == 'draw':
+                result = 'D'
+            else:
+                winner = match['home_team'] if match['winner'] == 'home' else match['away_team']
+                result = 'W' if winner == home_team else 'L'
+            h2h['recent_meetings'].append({
+                'date': match['date'],
+                'home': match['home_team'],
+                'away': match['away_team'],
+                'score': f"{match['home_goals']}-{match['away_goals']}",
+                'result_for_home_team': result
+            })
+
+        h2h['last_5_results'] = [m['result_for_home_team'] for m in h2h['recent_meetings'][-5:]]
+        return h2h
+
+    def save(self, path: Path):
+        """Write the index to JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {'built_at': time.time(), 'records': list(self.records.values())}
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS) -> Optional['H2HIndex']:
+        """Saved index, or None if missing, unreadable or older than max_age_seconds"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if time.time() - payload.get('built_at', 0) > max_age_seconds:
+                return None
+            records = {tuple(record['teams']): record for record in payload['records']}
+        except (json.JSONDecodeError, OSError, KeyError, TypeError):
+            return None
+        return cls(records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, pair) -> bool:
+        return self.pair_key(*pair) in self.records
@@ -60,14 +60,19 @@ class Q17_H2HDominance:
         if not h2h_data or h2h_data.get('matches') is None:
             return 0 # Default
 
-        wins = 0
-        total_games = 0
-        for match in h2h_data['matches']:
-            if match['home_team'] == team_name and match['winner'] == 'home':
-                wins += 1
-            if match['away_team'] == team_name and match['winner'] == 'away':
-                wins += 1
-            total_games +=1
+        if 'wins' in h2h_data:
+            # H2H index record (scripts/analysis/h2h_index.py): wins already counted per team
+            wins = h2h_data['wins'].get(team_name, 0)
+            total_games = len(h2h_data['matches'])
+        else:
+            wins = 0
+            total_games = 0
+            for match in h2h_data['matches']:
+                if match['home_team'] == team_name and match['winner'] == 'home':
+                    wins += 1
+                if match['away_team'] == team_name and match['winner'] == 'away':
+                    wins += 1
+                total_games +=1
         
         if total_games == 0:
             return 0
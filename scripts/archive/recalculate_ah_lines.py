@@ -23,6 +23,9 @@ from typing import Dict, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scripts.Phase2.yudor_fair_odds import optimal_line
 
 BASE_DIR = Path(__file__).parent.parent
 CONSOLIDATED_DIR = BASE_DIR / "consolidated_data"
@@ -73,13 +76,16 @@ def calculate_ah_fair_line(adjusted_casa: float, adjusted_vis: float, p_empate:
     1. Favorite = max(adjusted_casa, adjusted_vis)
     2. Odd_ML = 100 / Favorite → This is -0.5 AH for favorite
     3. Reference: +0.5 AH = 100 / (Favorite + P_Empate)
-    4. Iterate with 0.25 steps:
+    4. 0.25 steps:
        - Each -0.25: odds *= 1.15
        - Each +0.25: odds *= 0.85
     5. Target: odds ~2.0 [1.97, 2.03]
 
+    Steps 4-5 are solved in closed form by the shared Yudor kernel
+    (scripts/Phase2/yudor_fair_odds.py) instead of iterating.
+
     Returns:
-        Dict with ah_line, ah_odds, iterations, favorite_side
+        Dict with ah_line, ah_odds, steps_from_moneyline, favorite_side
     """
     favorite_pct = max(adjusted_casa, adjusted_vis)
     underdog_pct = min(adjusted_casa, adjusted_vis)
@@ -87,68 +93,11 @@ def calculate_ah_fair_line(adjusted_casa: float, adjusted_vis: float, p_empate:
     # Determine which side is favorite
     home_is_favorite = adjusted_casa > adjusted_vis
 
-    # Calculate Moneyline odds (anchor at -0.5 AH)
-    odd_ml = 100 / favorite_pct
-
-    # Start iteration from -0.5 AH
-    current_line = -0.5
-    current_odds = odd_ml
-
     target_min = 1.97
     target_max = 2.03
 
-    iterations = []
-
-    # Try going more negative (favorite needs bigger handicap)
-    test_line = current_line
-    test_odds = current_odds
-    closest_line = current_line
-    closest_odds = current_odds
-    closest_distance = abs(test_odds - 2.0)
-
-    # Go negative first (stronger favorite)
-    for i in range(20):
-        test_line -= 0.25
-        test_odds *= 1.15
-        distance = abs(test_odds - 2.0)
-
-        iterations.append({
-            "line": test_line,
-            "odds": round(test_odds, 3),
-            "distance": round(distance, 3)
-        })
-
-        if distance < closest_distance:
-            closest_distance = distance
-            closest_line = test_line
-            closest_odds = test_odds
-
-        if target_min <= test_odds <= target_max:
-            break
-
-    # If not found, try going positive (weaker favorite/stronger underdog)
-    if not (target_min <= closest_odds <= target_max):
-        test_line = current_line
-        test_odds = current_odds
-
-        for i in range(20):
-            test_line += 0.25
-            test_odds *= 0.85
-            distance = abs(test_odds - 2.0)
-
-            iterations.append({
-                "line": test_line,
-                "odds": round(test_odds, 3),
-                "distance": round(distance, 3)
-            })
-
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_line = test_line
-                closest_odds = test_odds
-
-            if target_min <= test_odds <= target_max:
-                break
+    closest_line, closest_odds = optimal_line(favorite_pct)
+    closest_line, closest_odds = float(closest_line), float(closest_odds)
 
     # Convert line to home team perspective
     if not home_is_favorite:
@@ -163,9 +112,8 @@ def calculate_ah_fair_line(adjusted_casa: float, adjusted_vis: float, p_empate:
         "favorite_side": "home" if home_is_favorite else "away",
         "favorite_pct": round(favorite_pct, 2),
         "underdog_pct": round(underdog_pct, 2),
-        "iterations_count": len(iterations),
-        "in_target_range": target_min <= closest_odds <= target_max,
-        "debug_iterations": iterations[:5]  # Keep first 5 for debugging
+        "steps_from_moneyline": int(round((-0.5 - closest_line) / 0.25)),
+        "in_target_range": target_min <= closest_odds <= target_max
     }
 
 
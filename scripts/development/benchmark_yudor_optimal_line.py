@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: closed-form Yudor optimal-line solver vs the per-line scan
+
+Generates synthetic (home, draw, away) probability triples, then finds the AH
+line whose fair odds are closest to 2.0 for each favorite two ways:
+1. The scan AsianHandicapModel.calculate_yudor_fair_odds used to run
+   (25 candidate lines per match, one Python loop iteration each)
+2. solve_optimal_line over the whole array at once (also returns the neighbours)
+
+Both must agree on every line and odds value.
+
+Usage:
+    python3 scripts/development/benchmark_yudor_optimal_line.py
+    python3 scripts/development/benchmark_yudor_optimal_line.py --matches 100000 --seed 7
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.Phase2.yudor_fair_odds import solve_optimal_line
+
+
+def synthetic_triples(n: int, seed: int) -> np.ndarray:
+    """n probability triples (home, draw, away) in %, each summing to 100"""
+    rng = np.random.default_rng(seed)
+    draw = rng.uniform(18.0, 32.0, n)
+    home_share = rng.beta(2.5, 2.0, n)  # slight home advantage
+    home = (100.0 - draw) * home_share
+    return np.column_stack([home, draw, 100.0 - draw - home])
+
+
+def scan_optimal_line(fav_prob: float):
+    """Per-line scan (pre-solver AsianHandicapModel.calculate_yudor_fair_odds)"""
+    moneyline = 100 / fav_prob if fav_prob > 0 else 999
+    base_line = -0.5
+    best_line = None
+    best_odds = None
+    min_diff = float('inf')
+
+    for line in np.arange(-3.0, 3.25, 0.25):
+        step_diff = (base_line - line) / 0.25
+        if step_diff > 0:
+            odds = moneyline * (1.15 ** step_diff)
+        else:
+            odds = moneyline * (0.85 ** abs(step_diff))
+
+        diff = abs(odds - 2.0)
+        if diff < min_diff:
+            min_diff = diff
+            best_line = line
+            best_odds = odds
+
+    return best_line, best_odds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Yudor optimal-line solver")
+    parser.add_argument('--matches', type=int, default=100_000, help="Synthetic probability triples")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    triples = synthetic_triples(args.matches, args.seed)
+    fav_pcts = np.maximum(triples[:, 0], triples[:, 2])
+
+    print("=" * 80)
+    print(f"⏱️  YUDOR OPTIMAL LINE: {args.matches:,} matches")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    scanned = [scan_optimal_line(fav) for fav in fav_pcts]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    solution = solve_optimal_line(fav_pcts)
+    solver_seconds = time.perf_counter() - start
+
+    scan_lines = np.array([line for line, _ in scanned])
+    scan_odds = np.array([odds for _, odds in scanned])
+    line_mismatches = int(np.sum(scan_lines != solution['line']))
+    max_odds_diff = float(np.max(np.abs(scan_odds - solution['odds'])))
+
+    print(f"   Per-line scan:  {scan_seconds:8.3f}s ({scan_seconds / args.matches * 1e6:.2f} µs/match)")
+    print(f"   Closed form:    {solver_seconds:8.3f}s ({solver_seconds / args.matches * 1e6:.2f} µs/match)")
+    print(f"   Speedup:        {scan_seconds / solver_seconds:8.1f}x")
+    print(f"   Line mismatches: {line_mismatches}")
+    print(f"   Max odds diff:   {max_odds_diff:.2e}")
+
+    lines, counts = np.unique(solution['line'], return_counts=True)
+    print("\n📊 Optimal line distribution:")
+    for line, count in zip(lines, counts):
+        print(f"   AH {line:+.2f}: {count:>7,}")
+
+    if line_mismatches:
+        print("\n❌ Solver disagrees with the scan")
+        sys.exit(1)
+    print("\n✅ Solver matches the scan on every match")
+
+
+if __name__ == "__main__":
+    main()
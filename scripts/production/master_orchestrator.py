@@ -14,7 +14,9 @@ import os
 import sys
 import json
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from anthropic import Anthropic, APIError, RateLimitError
@@ -22,6 +24,17 @@ from pyairtable import Api
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+# Add project root to path so shared Phase2 components can be imported
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from scripts.Phase2.footystats_cache import FootyStatsCache
+from scripts.Phase2.http_client import get_http_client
+from scripts.Phase2.llm_cache import LLMResponseCache, fingerprint_prompts
+from scripts.Phase2.claude_batch import run_message_batch
+from scripts.Phase2.prompt_payload import PromptPayloadBuilder, compact_json, dedupe_news, estimate_tokens
+from scripts.Phase2.yudor_fair_odds import fair_odds_at_line as yudor_fair_odds_at_line
+
 # Load environment variables
 load_dotenv()
 
@@ -47,6 +60,8 @@ class Config:
     PRE_FILTER_DIR = BASE_DIR / "pre_filter_history"
     LOSS_LEDGER_DIR = BASE_DIR / "loss_ledger"
     SCRAPED_DIR = BASE_DIR / "scraped_data"
+    FOOTYSTATS_CACHE_DIR = BASE_DIR / "footystats_cache"
+    LLM_CACHE_DIR = BASE_DIR / "llm_cache"
 
     # Files
     MATCHES_ALL_FILE = BASE_DIR / "matches_all.txt"
@@ -58,9 +73,49 @@ class Config:
     MAX_TOKENS = 8000
     DATA_QUALITY_THRESHOLD = 70  # Minimum quality score to analyze
 
+    # Claude response cache (disable with --no-llm-cache or YUDOR_LLM_CACHE=0)
+    LLM_CACHE_ENABLED = os.getenv("YUDOR_LLM_CACHE", "1") != "0"
+    LLM_CACHE_MAX_MB = 200
+
+    # Prompt payloads (estimated tokens). Sources are kept in priority order
+    # FootyStats > SportsMole > other stats pages > Transfermarkt > news, and the
+    # lowest-priority ones are cut first when the total budget is exceeded.
+    PROMPT_PAYLOAD_BUDGET = 12000
+    PROMPT_SOURCE_BUDGETS = {
+        # source key: (priority, token budget per section)
+        "footystats": (0, 1500),
+        "sportsmole": (1, 3000),
+        "sofascore": (2, 1500),
+        "whoscored": (2, 1500),
+        "flashscore": (2, 1500),
+        "tm_home": (3, 1000),
+        "tm_away": (3, 1000),
+        "news_headlines": (4, 1000),
+        "news_home": (4, 1000),
+        "news_away": (4, 1000),
+    }
+
+    # Message Batches API (--batch-api)
+    BATCH_API_POLL_SECONDS = 30
+    BATCH_API_MAX_WAIT = 24 * 3600  # Batches expire after 24h anyway
+
+    # FootyStats
+    FOOTYSTATS_BASE_URL = "https://api.football-data-api.com"
+    FOOTYSTATS_CACHE_TTL = 6 * 3600  # Seconds a cached season payload stays valid
+
+    # Concurrency (analyze-batch --workers N)
+    BATCH_WORKERS = 1  # Matches in flight at once (1 = sequential)
+    PRE_FILTER_WORKERS = 4  # Games scraped/scored concurrently in pre-filter
+    PROVIDER_CONCURRENCY = {
+        "anthropic": 3,   # Simultaneous Claude requests
+        "footystats": 2,  # Simultaneous FootyStats API requests
+        "web": 6,         # Simultaneous plain page fetches (SportsMole, Transfermarkt, news)
+    }
+
     # Ensure directories exist
     for directory in [ANALYSIS_DIR, PROMPTS_DIR, ANEXOS_DIR, CONSOLIDATED_DIR,
-                      PRE_FILTER_DIR, LOSS_LEDGER_DIR, SCRAPED_DIR]:
+                      PRE_FILTER_DIR, LOSS_LEDGER_DIR, SCRAPED_DIR, FOOTYSTATS_CACHE_DIR,
+                      LLM_CACHE_DIR]:
         directory.mkdir(exist_ok=True)
 
 
@@ -114,6 +169,162 @@ class AirtableSchema:
     }
 
 
+# =========================
+# PROMPT FRAGMENTS
+# =========================
+
+# Fixed pre-filter instructions, sent as a cached system block after the
+# consolidation prompt instead of being repeated in every user message
+DATA_QUALITY_INSTRUCTIONS = """
+INSTRUCTIONS (data quality pre-filter):
+1. Check which data sources are available (URLs found vs NOT_FOUND)
+2. Calculate data quality score (0-100) based on:
+   - Q1-Q19 data availability
+   - Critical missing data (tactical preview, squad values, xG stats)
+3. Output JSON with:
+   - data_quality.score (0-100)
+   - data_quality.assessment (Excellent/Good/Fair/Poor)
+   - data_quality.missing_critical (list)
+   - data_quality.proceed (true/false)
+
+Focus ONLY on data quality calculation. Do NOT run full analysis.
+"""
+
+# Fixed consolidation instructions (Stage 1); the user message carries only the
+# match info and payload
+CONSOLIDATION_INSTRUCTIONS = """
+INSTRUCTIONS:
+1. EXTRACT REAL DATA from the MATCH DATA sources in the user message:
+   - xG data from FootyStats (home_xg_avg, away_xg_avg, home_goals_scored_avg, etc.)
+   - Form from FootyStats (home_ppg, away_ppg, wins/draws/losses, position)
+   - Team news/injuries from SportsMole
+   - Squad values from Transfermarkt
+   - Tactical info from news headlines
+2. Fill Q1-Q19 scores deterministically using ANEXO I criteria
+3. Calculate data quality score based on ACTUAL data found
+4. Document sources for each Q-score
+5. Output complete JSON with:
+   - q_scores (Q1-Q19 with home_score, away_score, reasoning, sources)
+   - category_totals (Technique, Tactics, Motivation, Form, Performance, Injuries, Home/Away)
+   - raw_scores (raw_casa, raw_vis)
+   - data_quality
+   - notes
+
+DATA PRIORITY:
+1. FootyStats API → xG, goals/game, form, table position (MOST RELIABLE)
+2. SportsMole → Team news, injuries, preview context
+3. Transfermarkt → Squad values
+4. News Headlines → Derby context, motivation
+
+IMPORTANT:
+- Use ACTUAL DATA from the fetched content and FootyStats API
+- Do NOT include Betfair odds - we use BLIND PRICING
+- Be deterministic and reference ANEXO I for scoring rules
+"""
+
+# Fixed Yudor v5.3 layer spec and output schema (Stage 2 and re-analysis)
+YUDOR_ANALYSIS_INSTRUCTIONS = """
+EXECUTE THESE LAYERS IN ORDER:
+
+LAYER 1: BLIND PRICING (CORRECT YUDOR METHODOLOGY)
+- Sum Raw_Casa from all home Q-scores
+- Sum Raw_Vis from all away Q-scores
+- Get P(Empate) from consolidated data (derived from odds, NOT modified)
+
+STEP 1: Normalize if sum > 100
+  * Soma = Raw_Casa + Raw_Vis + P(Empate)
+  * IF Soma > 100:
+    - Surplus = (Soma - 100) / 2
+    - Adjusted_Casa = Raw_Casa - Surplus
+    - Adjusted_Vis = Raw_Vis - Surplus
+    - P(Empate) STAYS UNCHANGED
+  * ELSE:
+    - Adjusted_Casa = Raw_Casa
+    - Adjusted_Vis = Raw_Vis
+
+STEP 2: Identify favorite and calculate Moneyline odds
+  * Favorite_Pct = max(Adjusted_Casa, Adjusted_Vis)
+  * Underdog_Pct = min(Adjusted_Casa, Adjusted_Vis)
+  * Odd_ML = 100 / Favorite_Pct
+  * This Odd_ML = -0.5 AH for the favorite
+
+STEP 3: Calculate +0.5 AH reference point
+  * Odds_Plus05 = 100 / (Favorite_Pct + P_Empate)
+
+STEP 4: Find the AH line with odds closest to 2.0 (target [1.97, 2.03])
+  * -0.5 AH is priced at Odd_ML
+  * For each -0.25 step (more negative): odds *= 1.15
+  * For each +0.25 step (more positive): odds *= 0.85
+  * No iteration needed - the step count is:
+    - n = log(2.0 / Odd_ML) / log(1.15)    if Odd_ML < 2.0 (lines below -0.5)
+    - n = log(2.0 / Odd_ML) / log(0.85)    if Odd_ML > 2.0 (lines above -0.5)
+  * Compare the two whole steps around n and keep the one closer to 2.0
+  * Only lines from -3.0 to +3.0 (favorite's perspective); document if outside the target
+
+STEP 5: Return Fair AH Line
+  * If home is favorite: line is negative (e.g., -1.25)
+  * If away is favorite: line is positive for home (e.g., +0.75)
+  * Include Delta = Raw_Casa - Raw_Vis for reference
+
+LAYER 2: CONFIDENCE (CS_final)
+- BSD = |Delta| / max(Raw_Casa, Raw_Vis) * 100
+- CCS = consistency of category scores
+- CS_final = (BSD * 0.6 + CCS * 0.4)
+- Tier: 1 if CS≥70, 2 if CS≥50, 3 otherwise
+
+LAYER 3: RG GUARD
+- Calculate R-Score from risk signals
+- Decision: VETO/FLIP/EXP/CORE based on R-Score and Tier
+
+OUTPUT ONLY VALID JSON (no markdown, no explanation text):
+```json
+{
+  "match_id": "<MATCH ID from the user message>",
+  "raw_casa": <number>,
+  "raw_vis": <number>,
+  "delta": <number>,
+  "yudor_ah_fair": <number like -0.5 or +1.0>,
+  "pr_casa": <decimal>,
+  "pr_vis": <decimal>,
+  "pr_empate": 0.25,
+  "cs_final": <0-100>,
+  "tier": <1, 2, or 3>,
+  "r_home": <0.0-1.0>,
+  "r_away": <0.0-1.0>,
+  "r_fav": <0.0-1.0>,
+  "r_dog": <0.0-1.0>,
+  "rbr": <-1.0 to +1.0>,
+  "r_score": <0.0-1.0>,
+  "edge_synthetic": <calculated as (|AH_Line| / 0.25) × 8, used for FLIP evaluation>,
+  "decision": "CORE" or "EXP" or "FLIP" or "VETO",
+  "reasoning": "<brief explanation>"
+}
+```
+
+CRITICAL: Return ONLY the JSON object, no other text.
+"""
+
+# Fixed root cause analysis instructions for the loss ledger
+LOSS_ANALYSIS_INSTRUCTIONS = """
+INSTRUCTIONS:
+1. Retrieve original Q1-Q19 scores and predictions
+2. Compare predictions vs actual match outcome
+3. Identify which Q-IDs failed (where prediction was wrong)
+4. Classify error type:
+   - Model Error: Q-ID weight/criteria is wrong
+   - Data Error: Scraped data was incorrect/incomplete
+   - Variance: Correct prediction, unlucky outcome (e.g., high xG but lost)
+5. Provide recommendations for improvement
+
+Output complete JSON with:
+- failed_q_ids: List of Q-IDs that failed with explanations
+- error_type: "Model Error" | "Data Error" | "Variance"
+- error_category: Brief description (e.g., "Q6: Tactics - Formation matchup failed")
+- recommendations: Specific suggestions for system improvement
+- root_cause_summary: Concise explanation of why bet lost
+"""
+
+
 # =========================
 # CORE SYSTEM CLASS
 # =========================
@@ -124,6 +335,27 @@ class YudorOrchestrator:
     def __init__(self):
         self.config = Config()
         self.claude = Anthropic(api_key=self.config.ANTHROPIC_API_KEY)
+        self.footystats_cache = FootyStatsCache(
+            self.config.FOOTYSTATS_CACHE_DIR,
+            ttl_seconds=self.config.FOOTYSTATS_CACHE_TTL
+        )
+        self._team_xg_index: Dict[int, Dict[int, Dict]] = {}  # season_id -> team_id -> xG averages
+        self.llm_cache = LLMResponseCache(
+            self.config.LLM_CACHE_DIR,
+            prompts_fingerprint=fingerprint_prompts(self.config.PROMPTS_DIR),
+            max_bytes=self.config.LLM_CACHE_MAX_MB * 1024 * 1024,
+            enabled=self.config.LLM_CACHE_ENABLED
+        )
+
+        # Token usage per Claude call (incl. prompt-cache reads/writes)
+        self.claude_usage_log: List[Dict] = []
+        self._usage_lock = threading.Lock()
+
+        # Per-provider concurrency caps shared by all batch workers
+        self.provider_slots = {
+            provider: threading.BoundedSemaphore(limit)
+            for provider, limit in self.config.PROVIDER_CONCURRENCY.items()
+        }
 
         # Initialize Airtable if configured
         if self.config.AIRTABLE_API_KEY and self.config.AIRTABLE_BASE_ID:
@@ -156,16 +388,24 @@ class YudorOrchestrator:
         Returns:
             Response text from Claude
         """
+        cached = self._cached_response(model, "", prompt, max_tokens)
+        if cached is not None:
+            return cached
+
         retry_delay = 5  # Initial delay in seconds
 
         for attempt in range(max_retries):
             try:
-                response = self.claude.messages.create(
-                    model=model,
-                    max_tokens=max_tokens,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return response.content[0].text
+                with self.provider_slots["anthropic"]:
+                    response = self.claude.messages.create(
+                        model=model,
+                        max_tokens=max_tokens,
+                        messages=[{"role": "user", "content": prompt}]
+                    )
+                self._record_usage(response, model)
+                text = response.content[0].text
+                self._cache_response(model, "", prompt, max_tokens, text, response.stop_reason)
+                return text
 
             except RateLimitError as e:
                 if attempt < max_retries - 1:
@@ -199,25 +439,200 @@ class YudorOrchestrator:
         with open(prompt_path, encoding="utf-8") as f:
             return f.read()
 
-    def call_claude(self, system_prompt: str, user_message: str, max_tokens: Optional[int] = None) -> str:
-        """Helper to call Claude API"""
+    def _system_blocks(self, system_prompt: str, static_context: Optional[str] = None):
+        """
+        Build the system parameter with Anthropic prompt caching.
+
+        The static prompt (master/consolidation prompt incl. anexos) goes first and
+        the last static block carries cache_control, so every call that shares the
+        prefix reads it from the prompt cache instead of paying full input price.
+        """
+        if not system_prompt and not static_context:
+            return system_prompt
+
+        blocks = [{"type": "text", "text": text} for text in (system_prompt, static_context) if text]
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        return blocks
+
+    def _cache_system(self, system_prompt: str, static_context: Optional[str] = None) -> str:
+        """System text used in the response-cache key (prompt + fixed instructions)"""
+        return system_prompt if not static_context else f"{system_prompt}\n\n{static_context}"
+
+    def _record_usage(self, message, label: str = ""):
+        """Store input/output and prompt-cache token counts for one Claude call"""
+        usage = getattr(message, "usage", None)
+        if usage is None:
+            return
+
+        entry = {
+            "label": label,
+            "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+            "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        }
+        with self._usage_lock:
+            self.claude_usage_log.append(entry)
+
+    def claude_usage_summary(self) -> Dict:
+        """Token totals over all recorded Claude calls"""
+        with self._usage_lock:
+            log = list(self.claude_usage_log)
+
+        summary = {"calls": len(log)}
+        for field in ["input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens"]:
+            summary[field] = sum(entry[field] for entry in log)
+        return summary
+
+    def _print_token_usage(self):
+        """Print Claude token totals, including prompt-cache reads and writes"""
+        usage = self.claude_usage_summary()
+        if not usage["calls"]:
+            return
+        print(f"🔢 Claude tokens ({usage['calls']} calls): {usage['input_tokens']:,} input, "
+              f"{usage['cache_read_input_tokens']:,} cache read, "
+              f"{usage['cache_creation_input_tokens']:,} cache write, {usage['output_tokens']:,} output")
+
+    def call_claude(self, system_prompt: str, user_message: str, max_tokens: Optional[int] = None,
+                    static_context: Optional[str] = None, label: str = "") -> str:
+        """
+        Helper to call Claude API
+
+        static_context holds fixed instructions that would otherwise be repeated in
+        every user message; it is sent right after the system prompt so it falls
+        inside the cached prefix. Only per-match data goes in user_message.
+        """
         if max_tokens is None:
             max_tokens = self.config.MAX_TOKENS
 
+        cache_system = self._cache_system(system_prompt, static_context)
+        cached = self._cached_response(self.config.CLAUDE_MODEL, cache_system, user_message, max_tokens)
+        if cached is not None:
+            return cached
+
         try:
-            message = self.claude.messages.create(
-                model=self.config.CLAUDE_MODEL,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=[{
-                    "role": "user",
-                    "content": user_message
-                }]
-            )
-            return message.content[0].text
+            with self.provider_slots["anthropic"]:
+                message = self.claude.messages.create(
+                    model=self.config.CLAUDE_MODEL,
+                    max_tokens=max_tokens,
+                    system=self._system_blocks(system_prompt, static_context),
+                    messages=[{
+                        "role": "user",
+                        "content": user_message
+                    }]
+                )
+            self._record_usage(message, label)
+            text = message.content[0].text
+            self._cache_response(self.config.CLAUDE_MODEL, cache_system, user_message, max_tokens,
+                                 text, message.stop_reason)
+            return text
         except Exception as e:
             raise Exception(f"Claude API call failed: {e}")
 
+    def call_claude_batch(self, jobs: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Run many call_claude-style requests as one Message Batch (--batch-api).
+
+        Args:
+            jobs: key -> {"system_prompt", "user_message", "max_tokens",
+                          optional "static_context", optional "label"}
+
+        Returns:
+            key -> {"text": response} or {"error": message}.
+            Cached responses are served without being submitted.
+        """
+        results: Dict[str, Dict] = {}
+        requests_by_id: Dict[str, str] = {}
+        batch_requests = []
+
+        for key, job in jobs.items():
+            max_tokens = job.get("max_tokens") or self.config.MAX_TOKENS
+            static_context = job.get("static_context")
+            system_prompt = job["system_prompt"]
+            cache_system = self._cache_system(system_prompt, static_context)
+
+            cached = self._cached_response(self.config.CLAUDE_MODEL, cache_system, job["user_message"], max_tokens)
+            if cached is not None:
+                results[key] = {"text": cached}
+                continue
+
+            # custom_id must match ^[a-zA-Z0-9_-]{1,64}$, so match ids are mapped back afterwards
+            custom_id = f"req-{len(batch_requests)}"
+            requests_by_id[custom_id] = key
+            batch_requests.append({
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.config.CLAUDE_MODEL,
+                    "max_tokens": max_tokens,
+                    "system": self._system_blocks(system_prompt, static_context),
+                    "messages": [{"role": "user", "content": job["user_message"]}]
+                }
+            })
+
+        if not batch_requests:
+            return results
+
+        print(f"📦 Submitting {len(batch_requests)} requests as one Message Batch "
+              f"({len(results)} served from cache)")
+
+        def on_poll(batch):
+            counts = batch.request_counts
+            print(f"   ⏳ Batch {batch.id}: {batch.processing_status} "
+                  f"({counts.succeeded + counts.errored} done, {counts.processing} processing)")
+
+        batch_results = run_message_batch(
+            self.claude,
+            batch_requests,
+            poll_seconds=self.config.BATCH_API_POLL_SECONDS,
+            max_wait=self.config.BATCH_API_MAX_WAIT,
+            on_poll=on_poll
+        )
+
+        for custom_id, outcome in batch_results.items():
+            key = requests_by_id.get(custom_id)
+            if key is None:
+                continue
+            if "error" in outcome:
+                results[key] = {"error": outcome["error"]}
+                continue
+
+            job = jobs[key]
+            message = outcome["message"]
+            self._record_usage(message, job.get("label", key))
+            text = message.content[0].text
+            max_tokens = job.get("max_tokens") or self.config.MAX_TOKENS
+            cache_system = self._cache_system(job["system_prompt"], job.get("static_context"))
+            self._cache_response(self.config.CLAUDE_MODEL, cache_system, job["user_message"], max_tokens,
+                                 text, message.stop_reason)
+            results[key] = {"text": text}
+
+        return results
+
+    def _usable_response(self, text: str) -> bool:
+        """Whether callers can use a response: every Claude step here parses it as JSON"""
+        try:
+            self.extract_json_from_response(text)
+            return True
+        except (ValueError, TypeError):
+            return False
+
+    def _cached_response(self, model: str, system: str, user: str, max_tokens: int) -> Optional[str]:
+        """Cached response, or None; an entry callers can't parse is dropped and asked again"""
+        cached = self.llm_cache.get(model, system, user, max_tokens)
+        if cached is not None and not self._usable_response(cached):
+            self.llm_cache.delete(model, system, user, max_tokens)
+            return None
+        return cached
+
+    def _cache_response(self, model: str, system: str, user: str, max_tokens: int,
+                        text: str, stop_reason: Optional[str]):
+        """
+        Store a response only if it finished normally and parses, so a truncated
+        (max_tokens) or non-JSON answer is not replayed on every rerun
+        """
+        if stop_reason in ("end_turn", "stop_sequence") and self._usable_response(text):
+            self.llm_cache.set(model, system, user, max_tokens, text)
+
     def extract_json_from_response(self, response_text: str) -> Dict:
         """Extract JSON from Claude's response (handles markdown code blocks)"""
         # Try to extract JSON from markdown code blocks
@@ -238,14 +653,14 @@ class YudorOrchestrator:
             return ""
 
         try:
-            import requests
             from bs4 import BeautifulSoup
 
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36"
             }
 
-            response = requests.get(url, headers=headers, timeout=15)
+            with self.provider_slots["web"]:
+                response = get_http_client().get(url, headers=headers, timeout=15)
             if response.status_code != 200:
                 return f"[Error: HTTP {response.status_code}]"
 
@@ -309,20 +724,81 @@ class YudorOrchestrator:
 
         return fetched_content
 
+    def _build_match_payload(self, match_info: Dict, match_data: Dict, fetched_content: Dict,
+                             footystats_data: Dict):
+        """
+        Build the token-budgeted data block of the consolidation prompt.
+
+        Returns:
+            (payload text, report with estimated tokens / truncated / dropped sections)
+        """
+        budgets = self.config.PROMPT_SOURCE_BUDGETS
+        builder = PromptPayloadBuilder(total_budget=self.config.PROMPT_PAYLOAD_BUDGET)
+
+        priority, budget = budgets["footystats"]
+        footystats_sections = [
+            ("FootyStats Match Data", footystats_data.get("match_data")),
+            (f"FootyStats Home Team ({match_info.get('home')})", footystats_data.get("home_team_data")),
+            (f"FootyStats Away Team ({match_info.get('away')})", footystats_data.get("away_team_data")),
+        ]
+        if any(data for _, data in footystats_sections):
+            for title, data in footystats_sections:
+                builder.add_section(title, data, priority=priority, budget=budget)
+        else:
+            builder.add_section("FootyStats", "[FootyStats data not available for this match]", priority=priority)
+
+        for source_key, source_data in fetched_content.items():
+            priority, budget = budgets.get(source_key, (max(p for p, _ in budgets.values()), 1000))
+            builder.add_section(
+                f"{source_data['description']} | {source_data['url']}",
+                source_data["content"],
+                priority=priority,
+                budget=budget
+            )
+        if not fetched_content:
+            builder.add_section("Fetched pages", "[No content fetched from URLs]", priority=1)
+
+        priority, budget = budgets["news_headlines"]
+        builder.add_section("News Headlines", dedupe_news(match_data.get("news", {})),
+                            priority=priority, budget=budget)
+
+        return builder.build()
+
     # =========================
     # FOOTYSTATS API INTEGRATION
     # =========================
 
+    def fetch_footystats_endpoint(self, endpoint: str, params: Dict, timeout: int = 30) -> Dict:
+        """
+        GET a FootyStats endpoint through the season-scoped cache.
+
+        Each (endpoint, params) pair is downloaded at most once per run (and reused
+        from disk within the TTL), so league-matches/league-tables are shared by
+        every match and team lookup of the same season.
+
+        Returns:
+            Parsed JSON payload, or {"error": "HTTP <code>", "status_code": <code>}
+            for non-200 responses (errors are not cached). Network exceptions
+            propagate to the caller.
+        """
+        def fetch() -> Dict:
+            url = f"{self.config.FOOTYSTATS_BASE_URL}/{endpoint}"
+            with self.provider_slots["footystats"]:
+                response = get_http_client().get(
+                    url,
+                    params={"key": self.config.FOOTYSTATS_API_KEY, **params},
+                    timeout=timeout
+                )
+            if response.status_code != 200:
+                return {"error": f"HTTP {response.status_code}", "status_code": response.status_code}
+            return response.json()
+
+        return self.footystats_cache.get_or_fetch(endpoint, params, fetch)
+
     def fetch_footystats_seasons(self) -> Dict:
         """Fetch available seasons/leagues from FootyStats API"""
-        import requests
-
-        url = f"https://api.football-data-api.com/league-list?key={self.config.FOOTYSTATS_API_KEY}&chosen_leagues_only=true"
         try:
-            response = requests.get(url, timeout=15)
-            if response.status_code == 200:
-                return response.json()
-            return {"error": f"HTTP {response.status_code}"}
+            return self.fetch_footystats_endpoint("league-list", {"chosen_leagues_only": "true"}, timeout=15)
         except Exception as e:
             return {"error": str(e)}
 
@@ -365,24 +841,20 @@ class YudorOrchestrator:
         Returns:
             Dict with match stats, xG, form, H2H
         """
-        import requests
         from datetime import datetime as dt
 
         season_id = self.get_footystats_season_id(league)
         if not season_id:
             return {"error": f"League not mapped: {league}"}
 
-        # Fetch league matches
-        url = f"https://api.football-data-api.com/league-matches?key={self.config.FOOTYSTATS_API_KEY}&season_id={season_id}"
-
         try:
+            # Fetch league matches (shared season cache)
             print(f"      • FootyStats: fetching matches for season {season_id}...")
-            response = requests.get(url, timeout=30)
+            data = self.fetch_footystats_endpoint("league-matches", {"season_id": season_id}, timeout=30)
 
-            if response.status_code != 200:
-                return {"error": f"HTTP {response.status_code}"}
+            if "error" in data:
+                return {"error": data["error"]}
 
-            data = response.json()
             matches = data.get("data", [])
 
             # Parse target date
@@ -500,89 +972,68 @@ class YudorOrchestrator:
         Calculates xG averages from match history.
 
         Error-proof implementation with:
-        - Retry logic for transient failures
+        - Retries for transient failures (shared HTTP client)
         - Data validation
         - Graceful degradation
         """
         import requests
-        import time
 
         season_id = self.get_footystats_season_id(league)
         if not season_id:
             return {"error": f"League not mapped: {league}", "partial": False}
 
-        # Fetch from league-tables with retry logic
-        url = f"https://api.football-data-api.com/league-tables?key={self.config.FOOTYSTATS_API_KEY}&season_id={season_id}"
-
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, timeout=20)
-
-                if response.status_code == 429:  # Rate limited
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-
-                if response.status_code != 200:
-                    if attempt < max_retries - 1:
-                        time.sleep(1)
-                        continue
-                    return {"error": f"HTTP {response.status_code}", "partial": False}
-
-                data = response.json()
+        # Fetch from league-tables (shared season cache); 429 / 5xx and connection
+        # errors are already retried with backoff by the shared HTTP client
+        try:
+            data = self.fetch_footystats_endpoint("league-tables", {"season_id": season_id}, timeout=20)
 
-                # Validate API response structure
-                if not data.get("success", True) == True:
-                    return {"error": f"API error: {data.get('message', 'Unknown')}", "partial": False}
+            if "status_code" in data:
+                return {"error": data["error"], "partial": False}
 
-                teams = data.get("data", {}).get("league_table", [])
+            # Validate API response structure
+            if not data.get("success", True) == True:
+                return {"error": f"API error: {data.get('message', 'Unknown')}", "partial": False}
 
-                if not teams:
-                    return {"error": "No teams in league table", "partial": False}
+            teams = data.get("data", {}).get("league_table", [])
 
-                # Find team with flexible matching
-                team_data = self._find_team_in_list(team_name, teams)
+            if not teams:
+                return {"error": "No teams in league table", "partial": False}
 
-                if not team_data:
-                    return {"error": f"Team not found: {team_name}", "partial": False}
+            # Find team with flexible matching
+            team_data = self._find_team_in_list(team_name, teams)
 
-                # Extract and validate data with safe defaults
-                result = self._extract_team_stats(team_data)
+            if not team_data:
+                return {"error": f"Team not found: {team_name}", "partial": False}
 
-                # Validate critical data points
-                result["data_quality"] = self._validate_team_data(result)
+            # Extract and validate data with safe defaults
+            result = self._extract_team_stats(team_data)
 
-                # Fetch xG data from matches (separate try/catch for graceful degradation)
-                try:
-                    xg_data = self._calculate_team_xg(team_data.get("id"), season_id)
-                    if xg_data and "error_xg" not in xg_data:
-                        result.update(xg_data)
-                    else:
-                        result["xg_note"] = "xG data unavailable"
-                except Exception as xg_error:
-                    result["xg_note"] = f"xG fetch failed: {str(xg_error)[:50]}"
+            # Validate critical data points
+            result["data_quality"] = self._validate_team_data(result)
 
-                return result
+            # Fetch xG data from matches (separate try/catch for graceful degradation)
+            try:
+                xg_data = self._calculate_team_xg(team_data.get("id"), season_id)
+                if xg_data and "error_xg" not in xg_data:
+                    result.update(xg_data)
+                else:
+                    result["xg_note"] = "xG data unavailable"
+            except Exception as xg_error:
+                result["xg_note"] = f"xG fetch failed: {str(xg_error)[:50]}"
 
-            except requests.exceptions.Timeout:
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                    continue
-                return {"error": "Request timeout after retries", "partial": False}
+            return result
 
-            except requests.exceptions.ConnectionError:
-                if attempt < max_retries - 1:
-                    time.sleep(2)
-                    continue
-                return {"error": "Connection error", "partial": False}
+        except requests.exceptions.Timeout:
+            return {"error": "Request timeout after retries", "partial": False}
 
-            except json.JSONDecodeError:
-                return {"error": "Invalid JSON response", "partial": False}
+        except requests.exceptions.ConnectionError:
+            return {"error": "Connection error", "partial": False}
 
-            except Exception as e:
-                return {"error": f"Unexpected error: {str(e)[:100]}", "partial": False}
+        except json.JSONDecodeError:
+            return {"error": "Invalid JSON response", "partial": False}
 
-        return {"error": "Max retries exceeded", "partial": False}
+        except Exception as e:
+            return {"error": f"Unexpected error: {str(e)[:100]}", "partial": False}
 
     def _find_team_in_list(self, team_name: str, teams: List[Dict]) -> Optional[Dict]:
         """Find team with flexible name matching"""
@@ -791,66 +1242,90 @@ class YudorOrchestrator:
             "issues": issues if issues else ["All checks passed"]
         }
 
-    def _calculate_team_xg(self, team_id: int, season_id: int) -> Dict:
-        """Calculate team's xG averages from completed matches"""
-        import requests
-
-        if not team_id:
-            return {}
-
-        url = f"https://api.football-data-api.com/league-matches?key={self.config.FOOTYSTATS_API_KEY}&season_id={season_id}"
-
-        try:
-            response = requests.get(url, timeout=30)
-            if response.status_code != 200:
-                return {}
-
-            data = response.json()
-            matches = data.get("data", [])
-
-            xg_for_home = []
-            xg_for_away = []
-            xg_against_home = []
-            xg_against_away = []
+    def _build_team_xg_index(self, matches: List[Dict]) -> Dict[int, Dict]:
+        """
+        Aggregate xG for/against of every team in a season in one vectorized pass.
 
-            for match in matches:
-                if match.get("status") != "complete":
-                    continue
+        Args:
+            matches: FootyStats league-matches "data" list
 
-                home_id = match.get("homeID")
-                away_id = match.get("awayID")
-                home_xg = match.get("team_a_xg")
-                away_xg = match.get("team_b_xg")
+        Returns:
+            Dict mapping FootyStats team id -> xG averages (same keys as
+            _calculate_team_xg: overall/home/away for/against and xg_diff_overall)
+        """
+        import numpy as np
+
+        rows = [
+            (m.get("homeID"), m.get("awayID"), m.get("team_a_xg"), m.get("team_b_xg"))
+            for m in matches
+            if m.get("status") == "complete"
+            and m.get("homeID") is not None and m.get("awayID") is not None
+            and m.get("team_a_xg") is not None and m.get("team_b_xg") is not None
+        ]
+        if not rows:
+            return {}
 
-                if home_xg is None or away_xg is None:
-                    continue
+        home_ids, away_ids, home_xg, away_xg = zip(*rows)
+        home_xg = np.asarray(home_xg, dtype=float)
+        away_xg = np.asarray(away_xg, dtype=float)
+
+        # Compact team ids to 0..k-1 so bincount can sum per team
+        team_ids, inverse = np.unique(np.asarray(home_ids + away_ids, dtype=np.int64), return_inverse=True)
+        home_idx = inverse[:len(rows)]
+        away_idx = inverse[len(rows):]
+        k = len(team_ids)
+
+        n_home = np.bincount(home_idx, minlength=k)
+        n_away = np.bincount(away_idx, minlength=k)
+        for_home = np.bincount(home_idx, weights=home_xg, minlength=k)
+        against_home = np.bincount(home_idx, weights=away_xg, minlength=k)
+        for_away = np.bincount(away_idx, weights=away_xg, minlength=k)
+        against_away = np.bincount(away_idx, weights=home_xg, minlength=k)
+        # Overall sums accumulate home appearances then away ones (same order as the old per-team loop)
+        for_overall = np.bincount(inverse, weights=np.concatenate([home_xg, away_xg]), minlength=k)
+        against_overall = np.bincount(inverse, weights=np.concatenate([away_xg, home_xg]), minlength=k)
+
+        def avg(total: float, count: int) -> Optional[float]:
+            return round(float(total) / int(count), 2) if count else None
+
+        index = {}
+        for i, team_id in enumerate(team_ids.tolist()):
+            n_total = n_home[i] + n_away[i]
+            result = {
+                "xg_for_avg_overall": avg(for_overall[i], n_total),
+                "xg_against_avg_overall": avg(against_overall[i], n_total),
+                "xg_for_avg_home": avg(for_home[i], n_home[i]),
+                "xg_for_avg_away": avg(for_away[i], n_away[i]),
+                "xg_against_avg_home": avg(against_home[i], n_home[i]),
+                "xg_against_avg_away": avg(against_away[i], n_away[i]),
+            }
 
-                if home_id == team_id:
-                    xg_for_home.append(float(home_xg))
-                    xg_against_home.append(float(away_xg))
-                elif away_id == team_id:
-                    xg_for_away.append(float(away_xg))
-                    xg_against_away.append(float(home_xg))
+            # xG difference (positive = creates more than concedes)
+            if result["xg_for_avg_overall"] and result["xg_against_avg_overall"]:
+                result["xg_diff_overall"] = round(result["xg_for_avg_overall"] - result["xg_against_avg_overall"], 2)
 
-            result = {}
+            index[team_id] = result
 
-            if xg_for_home or xg_for_away:
-                all_xg_for = xg_for_home + xg_for_away
-                all_xg_against = xg_against_home + xg_against_away
+        return index
 
-                result["xg_for_avg_overall"] = round(sum(all_xg_for) / len(all_xg_for), 2) if all_xg_for else None
-                result["xg_against_avg_overall"] = round(sum(all_xg_against) / len(all_xg_against), 2) if all_xg_against else None
-                result["xg_for_avg_home"] = round(sum(xg_for_home) / len(xg_for_home), 2) if xg_for_home else None
-                result["xg_for_avg_away"] = round(sum(xg_for_away) / len(xg_for_away), 2) if xg_for_away else None
-                result["xg_against_avg_home"] = round(sum(xg_against_home) / len(xg_against_home), 2) if xg_against_home else None
-                result["xg_against_avg_away"] = round(sum(xg_against_away) / len(xg_against_away), 2) if xg_against_away else None
+    def _get_team_xg_index(self, season_id: int) -> Dict[int, Dict]:
+        """Per-season team xG table, built once from the cached league-matches payload"""
+        if season_id not in self._team_xg_index:
+            data = self.fetch_footystats_endpoint("league-matches", {"season_id": season_id}, timeout=30)
+            if "error" in data:
+                # Don't memoize failures - a later call may succeed
+                return {}
+            self._team_xg_index[season_id] = self._build_team_xg_index(data.get("data", []))
 
-                # xG difference (positive = creates more than concedes)
-                if result.get("xg_for_avg_overall") and result.get("xg_against_avg_overall"):
-                    result["xg_diff_overall"] = round(result["xg_for_avg_overall"] - result["xg_against_avg_overall"], 2)
+        return self._team_xg_index[season_id]
 
-            return result
+    def _calculate_team_xg(self, team_id: int, season_id: int) -> Dict:
+        """Look up team's xG averages from the season xG index"""
+        if not team_id:
+            return {}
 
+        try:
+            return dict(self._get_team_xg_index(season_id).get(int(team_id), {}))
         except Exception as e:
             return {"error_xg": str(e)}
 
@@ -906,22 +1381,32 @@ class YudorOrchestrator:
     # COMMAND 1: PRE-FILTER
     # =========================
 
-    def pre_filter(self, input_file: Optional[str] = None):
+    def pre_filter(self, input_file: Optional[str] = None, workers: Optional[int] = None,
+                   batch_api: bool = False):
         """
         Pre-filter strategy: Analyze all games for data quality
 
-        Process:
+        Process (streaming - each game moves on as soon as its own step finishes):
         1. Read matches_all.txt (30-40 games)
-        2. Run scraper for all games
-        3. Run DATA_CONSOLIDATION_PROMPT (light mode) for each
+        2. Scrape URLs per game (scraper.scrape_match, several games in flight)
+        3. As soon as a game is scraped, run DATA_CONSOLIDATION_PROMPT (light mode)
+           for it - Claude calls run concurrently under the Anthropic cap
         4. Calculate data quality scores
         5. Filter by threshold (default ≥70)
-        6. Create matches_priority.txt with top 15-20 games
-        7. Save pre-filter history
+        6. Rewrite matches_priority.txt and the pre-filter history after every
+           scored game, so partial results survive an interrupted run
+
+        With batch_api=True all games are scraped first and the quality requests
+        go out as one Message Batch (cheaper, no interactive latency needed).
 
         Args:
             input_file: Path to input file (default: matches_all.txt)
+            workers: Games scraped/scored concurrently (default: Config.PRE_FILTER_WORKERS)
+            batch_api: Score via the Message Batches API instead of live calls
         """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from scripts.scrapers import scraper as url_scraper
+
         print("\n" + "="*80)
         print("🎯 COMMAND: PRE-FILTER")
         print("="*80)
@@ -938,171 +1423,236 @@ class YudorOrchestrator:
             sys.exit(1)
 
         # Read all matches
-        with open(input_file, encoding="utf-8") as f:
-            matches = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        matches = url_scraper.load_matches(str(input_file))
 
         print(f"📋 Loaded {len(matches)} matches from {input_file}")
 
-        # Step 1: Run scraper for all matches
+        # Load DATA_CONSOLIDATION_PROMPT
+        data_consolidation_prompt = self.load_prompt("DATA_CONSOLIDATION_PROMPT_v1.0.md")
+
         print("\n" + "-"*80)
-        print("🔍 STEP 1: SCRAPING URLs for all matches")
+        print("🔍 STEP 1+2: SCRAPING URLs → CALCULATING DATA QUALITY (streaming)")
         print("-"*80)
 
-        # Create temporary matches file for scraper
-        temp_matches_file = self.config.BASE_DIR / "temp_matches_for_scraper.txt"
-        with open(temp_matches_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(matches))
+        workers = max(1, workers or self.config.PRE_FILTER_WORKERS)
+        scraped_data_file = self.config.BASE_DIR / "match_data_v29.json"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        history_file = self.config.PRE_FILTER_DIR / f"pre_filter_{timestamp}.json"
 
-        # Run scraper with explicit input file
-        result = subprocess.run(
-            [sys.executable, str(self.config.SCRAPER_SCRIPT), "--input", str(temp_matches_file)],
-            capture_output=True,
-            text=True,
-            cwd=str(self.config.BASE_DIR)
-        )
+        scraped_data = {}
+        quality_results = []
+        scrape_errors = 0
 
-        if result.returncode != 0:
-            print(f"❌ Scraper failed: {result.stderr}")
-            sys.exit(1)
+        with ThreadPoolExecutor(max_workers=workers) as scrape_pool, \
+                ThreadPoolExecutor(max_workers=workers) as score_pool:
+            pending = {scrape_pool.submit(url_scraper.scrape_match, m): ("scrape", m) for m in matches}
 
-        # Load scraped data
-        scraped_data_file = self.config.BASE_DIR / "match_data_v29.json"
-        if not scraped_data_file.exists():
-            print(f"❌ Scraper output not found: {scraped_data_file}")
-            sys.exit(1)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
 
-        with open(scraped_data_file, encoding="utf-8") as f:
-            scraped_data = json.load(f)
+                for future in done:
+                    kind, m = pending.pop(future)
+
+                    if kind == "scrape":
+                        try:
+                            entry = future.result()
+                        except Exception as e:
+                            scrape_errors += 1
+                            print(f"   ⚠️  Scraping failed for {m['home']} vs {m['away']}: {e}")
+                            continue
+
+                        scraped_data[m["id"]] = entry
+                        self._write_json_atomic(scraped_data_file, scraped_data)
+                        if batch_api:
+                            print(f"   ✅ Scraped [{len(scraped_data)}/{len(matches)}]: {m['id']}")
+                            continue
+
+                        print(f"   ✅ Scraped [{len(scraped_data)}/{len(matches)}]: {m['id']} → scoring")
+
+                        score_future = score_pool.submit(
+                            self._score_match_quality, m["id"], entry, data_consolidation_prompt
+                        )
+                        pending[score_future] = ("score", m)
 
-        print(f"✅ Scraped {len(scraped_data)} games successfully")
+                    else:
+                        result = future.result()
+                        quality_results.append(result)
+                        print(f"   [{len(quality_results)}/{len(matches)}] {result['match_id']}: "
+                              f"{result['quality_score']}/100 ({result['assessment']}) "
+                              f"{'✅' if result['proceed'] else '❌'}")
+
+                        self._write_pre_filter_outputs(
+                            history_file, input_file, len(matches), len(scraped_data),
+                            quality_results, complete=False
+                        )
+
+        print(f"\n✅ Scraped {len(scraped_data)} games successfully"
+              + (f" ({scrape_errors} failed)" if scrape_errors else ""))
+
+        if batch_api:
+            jobs = {
+                match_id: {
+                    "system_prompt": data_consolidation_prompt,
+                    "user_message": self._quality_user_message(entry),
+                    "max_tokens": 2000,
+                    "static_context": DATA_QUALITY_INSTRUCTIONS,
+                    "label": f"{match_id}:quality"
+                }
+                for match_id, entry in scraped_data.items()
+            }
+            batch_results = self.call_claude_batch(jobs)
+
+            for match_id, entry in scraped_data.items():
+                outcome = batch_results.get(match_id, {"error": "no batch result"})
+                result = self._quality_result(match_id, entry, outcome.get("text"), outcome.get("error"))
+                quality_results.append(result)
+                print(f"   [{len(quality_results)}/{len(matches)}] {result['match_id']}: "
+                      f"{result['quality_score']}/100 ({result['assessment']}) "
+                      f"{'✅' if result['proceed'] else '❌'}")
 
-        # Step 2: Calculate data quality for each game
+        # Step 3: Filter by threshold
         print("\n" + "-"*80)
-        print("📊 STEP 2: CALCULATING DATA QUALITY SCORES")
+        print(f"📈 STEP 3: FILTERING BY THRESHOLD (≥{self.config.DATA_QUALITY_THRESHOLD})")
         print("-"*80)
 
-        # Load DATA_CONSOLIDATION_PROMPT
-        data_consolidation_prompt = self.load_prompt("DATA_CONSOLIDATION_PROMPT_v1.0.md")
+        priority_games = self._write_pre_filter_outputs(
+            history_file, input_file, len(matches), len(scraped_data),
+            quality_results, complete=True
+        )
 
-        quality_results = []
+        print(f"\n✅ {len(priority_games)} games pass quality threshold")
+        print(f"❌ {len(quality_results) - len(priority_games)} games filtered out")
 
-        for idx, (match_id, match_data) in enumerate(scraped_data.items(), 1):
-            print(f"\n[{idx}/{len(scraped_data)}] Analyzing: {match_id}")
+        priority_file = self.config.MATCHES_PRIORITY_FILE
+        print(f"\n📝 Priority games saved to: {priority_file}")
+        print(f"💾 History saved to: {history_file}")
 
-            try:
-                # Call Claude for data quality calculation
-                user_message = f"""
-Calculate data quality score for this match.
+        # Summary
+        print("\n" + "="*80)
+        print("✅ PRE-FILTER COMPLETE")
+        print("="*80)
+        print(f"\n📊 SUMMARY:")
+        print(f"   Total games analyzed: {len(quality_results)}")
+        print(f"   Games passing threshold: {len(priority_games)}")
+        avg_quality = (sum(g['quality_score'] for g in quality_results) / len(quality_results)) if quality_results else 0
+        print(f"   Average quality score: {avg_quality:.1f}/100")
+        self._print_token_usage()
+        print(f"\n📝 Next step: Run analyze-batch with {priority_file}")
+        print(f"   python scripts/master_orchestrator.py analyze-batch --input {priority_file}")
 
-MATCH DATA:
-{json.dumps(match_data, indent=2)}
+    def _score_match_quality(self, match_id: str, match_data: Dict, data_consolidation_prompt: str) -> Dict:
+        """Ask Claude for the data quality score of one scraped match (never raises)"""
+        try:
+            response = self.call_claude(
+                data_consolidation_prompt,
+                self._quality_user_message(match_data),
+                max_tokens=2000,
+                static_context=DATA_QUALITY_INSTRUCTIONS,
+                label=f"{match_id}:quality"
+            )
+            return self._quality_result(match_id, match_data, response)
 
-INSTRUCTIONS:
-1. Check which data sources are available (URLs found vs NOT_FOUND)
-2. Calculate data quality score (0-100) based on:
-   - Q1-Q19 data availability
-   - Critical missing data (tactical preview, squad values, xG stats)
-3. Output JSON with:
-   - data_quality.score (0-100)
-   - data_quality.assessment (Excellent/Good/Fair/Poor)
-   - data_quality.missing_critical (list)
-   - data_quality.proceed (true/false)
+        except Exception as e:
+            return self._quality_result(match_id, match_data, error=str(e))
 
-Focus ONLY on data quality calculation. Do NOT run full analysis.
+    def _quality_user_message(self, match_data: Dict) -> str:
+        """Per-match part of the data quality request (fixed instructions sit in the cached prefix)"""
+        return f"""
+Calculate data quality score for this match.
+
+MATCH DATA:
+{compact_json(dict(match_data, news=dedupe_news(match_data.get("news", {}))))}
 """
 
-                response = self.call_claude(data_consolidation_prompt, user_message, max_tokens=2000)
+    def _quality_result(self, match_id: str, match_data: Dict, response: Optional[str] = None,
+                        error: Optional[str] = None) -> Dict:
+        """Turn Claude's data quality response (or a failure) into a pre-filter result"""
+        if error is None:
+            try:
                 data_quality_json = self.extract_json_from_response(response)
 
                 quality_score = data_quality_json.get("data_quality", {}).get("score", 0)
                 assessment = data_quality_json.get("data_quality", {}).get("assessment", "Unknown")
                 proceed = data_quality_json.get("data_quality", {}).get("proceed", False)
 
-                quality_results.append({
+                return {
                     "match_id": match_id,
                     "match_info": match_data.get("match_info", {}),
                     "quality_score": quality_score,
                     "assessment": assessment,
                     "proceed": proceed,
                     "urls": match_data.get("urls", {})
-                })
-
-                print(f"   Quality Score: {quality_score}/100 ({assessment}) {'✅' if proceed else '❌'}")
-
+                }
             except Exception as e:
-                print(f"   ⚠️  Failed to calculate quality: {e}")
-                quality_results.append({
-                    "match_id": match_id,
-                    "match_info": match_data.get("match_info", {}),
-                    "quality_score": 0,
-                    "assessment": "Error",
-                    "proceed": False,
-                    "error": str(e)
-                })
+                error = str(e)
 
-        # Step 3: Filter by threshold
-        print("\n" + "-"*80)
-        print(f"📈 STEP 3: FILTERING BY THRESHOLD (≥{self.config.DATA_QUALITY_THRESHOLD})")
-        print("-"*80)
+        print(f"   ⚠️  Failed to calculate quality for {match_id}: {error}")
+        return {
+            "match_id": match_id,
+            "match_info": match_data.get("match_info", {}),
+            "quality_score": 0,
+            "assessment": "Error",
+            "proceed": False,
+            "error": error
+        }
+
+    def _write_pre_filter_outputs(self, history_file: Path, input_file, total_games: int,
+                                  scraped_games: int, quality_results: List[Dict],
+                                  complete: bool) -> List[Dict]:
+        """
+        (Re)write matches_priority.txt and the pre-filter history JSON from the
+        results scored so far.
 
+        Returns:
+            Priority games (quality ≥ threshold), best first
+        """
         # Sort by quality score (descending)
-        quality_results.sort(key=lambda x: x["quality_score"], reverse=True)
+        ranked = sorted(quality_results, key=lambda x: x["quality_score"], reverse=True)
 
         # Filter by threshold
-        priority_games = [g for g in quality_results if g["quality_score"] >= self.config.DATA_QUALITY_THRESHOLD]
+        priority_games = [g for g in ranked if g["quality_score"] >= self.config.DATA_QUALITY_THRESHOLD]
 
-        print(f"\n✅ {len(priority_games)} games pass quality threshold")
-        print(f"❌ {len(quality_results) - len(priority_games)} games filtered out")
+        lines = [
+            "# PRIORITY GAMES (Pre-filtered by data quality)\n",
+            f"# Generated: {datetime.now().isoformat()}\n",
+            f"# Threshold: ≥{self.config.DATA_QUALITY_THRESHOLD}/100\n",
+        ]
+        if not complete:
+            lines.append(f"# IN PROGRESS: {len(quality_results)}/{total_games} games scored\n")
+        lines.append("\n")
 
-        # Step 4: Create matches_priority.txt
-        print("\n" + "-"*80)
-        print("📝 STEP 4: CREATING matches_priority.txt")
-        print("-"*80)
+        for game in priority_games:
+            match_info = game["match_info"]
+            lines.append(f"{match_info.get('home', 'Unknown')} vs {match_info.get('away', 'Unknown')}, "
+                         f"{match_info.get('league', 'Unknown')}, {match_info.get('date', 'Unknown')}  "
+                         f"# Quality: {game['quality_score']}/100\n")
 
         priority_file = self.config.MATCHES_PRIORITY_FILE
-
-        with open(priority_file, "w", encoding="utf-8") as f:
-            f.write("# PRIORITY GAMES (Pre-filtered by data quality)\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
-            f.write(f"# Threshold: ≥{self.config.DATA_QUALITY_THRESHOLD}/100\n\n")
-
-            for game in priority_games:
-                match_info = game["match_info"]
-                f.write(f"{match_info.get('home', 'Unknown')} vs {match_info.get('away', 'Unknown')}, "
-                       f"{match_info.get('league', 'Unknown')}, {match_info.get('date', 'Unknown')}  "
-                       f"# Quality: {game['quality_score']}/100\n")
-
-        print(f"✅ Saved to: {priority_file}")
-
-        # Step 5: Save pre-filter history
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        history_file = self.config.PRE_FILTER_DIR / f"pre_filter_{timestamp}.json"
-
-        with open(history_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "timestamp": datetime.now().isoformat(),
-                "input_file": str(input_file),
-                "total_games": len(matches),
-                "scraped_games": len(scraped_data),
-                "threshold": self.config.DATA_QUALITY_THRESHOLD,
-                "priority_games": len(priority_games),
-                "filtered_out": len(quality_results) - len(priority_games),
-                "results": quality_results
-            }, f, indent=2, ensure_ascii=False)
-
-        print(f"💾 History saved to: {history_file}")
-
-        # Summary
-        print("\n" + "="*80)
-        print("✅ PRE-FILTER COMPLETE")
-        print("="*80)
-        print(f"\n📊 SUMMARY:")
-        print(f"   Total games analyzed: {len(quality_results)}")
-        print(f"   Games passing threshold: {len(priority_games)}")
-        avg_quality = (sum(g['quality_score'] for g in quality_results) / len(quality_results)) if quality_results else 0
-        print(f"   Average quality score: {avg_quality:.1f}/100")
-        print(f"\n📝 Next step: Run analyze-batch with {priority_file}")
-        print(f"   python scripts/master_orchestrator.py analyze-batch --input {priority_file}")
+        tmp_file = Path(str(priority_file) + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_file, priority_file)
+
+        self._write_json_atomic(history_file, {
+            "timestamp": datetime.now().isoformat(),
+            "input_file": str(input_file),
+            "complete": complete,
+            "total_games": total_games,
+            "scraped_games": scraped_games,
+            "threshold": self.config.DATA_QUALITY_THRESHOLD,
+            "priority_games": len(priority_games),
+            "filtered_out": len(ranked) - len(priority_games),
+            "results": ranked
+        })
+
+        return priority_games
+
+    def _write_json_atomic(self, path: Path, data) -> None:
+        """Write JSON via a temp file so readers never see a half-written file"""
+        tmp_path = Path(str(path) + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
 
     # =========================
     # STAGE 1: SCRAPING (OLD CODE)
@@ -1275,12 +1825,13 @@ Focus ONLY on data quality calculation. Do NOT run full analysis.
             message = self.claude.messages.create(
                 model=self.config.CLAUDE_MODEL,
                 max_tokens=self.config.MAX_TOKENS,
-                system=extraction_prompt,
+                system=self._system_blocks(extraction_prompt),
                 messages=[{
                     "role": "user",
                     "content": f"Extract data from these match URLs:\n\n{json.dumps(urls_data, indent=2)}"
                 }]
             )
+            self._record_usage(message, "extraction")
             
             # Parse Claude's response (should be JSON)
             response_text = message.content[0].text
@@ -1418,12 +1969,13 @@ The user will compare YOUR line to market and calculate edge themselves.
             message = self.claude.messages.create(
                 model=self.config.CLAUDE_MODEL,
                 max_tokens=self.config.MAX_TOKENS,
-                system=yudor_prompt if not use_integrated or not claude_analysis_prompt.exists() else "",
+                system=self._system_blocks(yudor_prompt) if not use_integrated or not claude_analysis_prompt.exists() else "",
                 messages=[{
                     "role": "user",
                     "content": full_prompt
                 }]
             )
+            self._record_usage(message, "analysis")
             
             response_text = message.content[0].text
             
@@ -1492,28 +2044,12 @@ The user will compare YOUR line to market and calculate edge themselves.
             → Moneyline: 100/36.2 = 2.76 (at line -0.5)
             → Steps from -0.5 to -0.25: +1 step
             → Odds: 2.76 × 0.85 = 2.35
-        """
-        # Determine favorite
-        fav_prob_pct = max(pr_casa_pct, pr_vis_pct)
-
-        # Moneyline odds (at line -0.5 for favorite)
-        odd_ml = 100 / fav_prob_pct
-
-        # Calculate steps from -0.5 to ah_line
-        steps = (ah_line + 0.5) / 0.25
-
-        # Apply multipliers
-        if steps > 0:
-            # Positive steps: easier to cover → lower odds
-            odds = odd_ml * (0.85 ** steps)
-        elif steps < 0:
-            # Negative steps: harder to cover → higher odds
-            odds = odd_ml * (1.15 ** abs(steps))
-        else:
-            # Exactly at -0.5
-            odds = odd_ml
+        """
+        # Determine favorite
+        fav_prob_pct = max(pr_casa_pct, pr_vis_pct)
 
-        return round(odds, 2)
+        # Moneyline at -0.5 scaled ×0.85 / ×1.15 per step (shared Yudor kernel)
+        return round(float(yudor_fair_odds_at_line(fav_prob_pct, ah_line)), 2)
 
     # =========================
     # STAGE 4: AIRTABLE SYNC
@@ -1677,7 +2213,7 @@ The user will compare YOUR line to market and calculate edge themselves.
     # COMMAND 2: ANALYZE-BATCH
     # =========================
 
-    def analyze_batch(self, input_file: Optional[str] = None):
+    def analyze_batch(self, input_file: Optional[str] = None, workers: Optional[int] = None):
         """
         Batch analysis with v5.3 prompts
 
@@ -1691,8 +2227,13 @@ The user will compare YOUR line to market and calculate edge themselves.
            e. Save analysis to analysis_history/
            f. Save to Airtable
 
+        With workers > 1, several matches run concurrently. Calls are still capped
+        per provider (Config.PROVIDER_CONCURRENCY), a failing match only marks its
+        own entry as FAILED, and results_summary keeps the input order.
+
         Args:
             input_file: Path to priority matches file (default: matches_priority.txt)
+            workers: Matches in flight at once (default: Config.BATCH_WORKERS)
         """
         print("\n" + "="*80)
         print("🎯 COMMAND: ANALYZE-BATCH (v5.3)")
@@ -1729,350 +2270,355 @@ The user will compare YOUR line to market and calculate edge themselves.
         data_consolidation_prompt = self.load_prompt("DATA_CONSOLIDATION_PROMPT_v1.0.md")
         yudor_master_prompt = self.load_prompt("YUDOR_MASTER_PROMPT_v5.3.md")
 
-        # Process each match
-        results_summary = []
+        # Process matches (sequentially, or several in flight with --workers N)
+        workers = max(1, min(workers or self.config.BATCH_WORKERS, len(matches) or 1))
+        results_by_idx: Dict[int, Optional[Dict]] = {}
 
-        for idx, match in enumerate(matches, 1):
-            print("\n" + "="*80)
-            print(f"[{idx}/{len(matches)}] ANALYZING: {match}")
-            print("="*80)
+        def run_one(idx: int, match: str) -> Optional[Dict]:
+            try:
+                return self._analyze_batch_match(idx, len(matches), match, scraped_data,
+                                                 data_consolidation_prompt, yudor_master_prompt)
+            except Exception as e:
+                # Failure isolation: one broken match never takes the batch down
+                print(f"\n❌ Analysis failed for {match}: {e}")
+                return {"match": match, "match_id": match, "status": "FAILED", "error": str(e)}
 
-            # Parse match string
-            parts = match.split("#")[0].strip().split(",")
-            if len(parts) < 3:
-                print(f"⚠️  Invalid format, skipping: {match}")
-                continue
+        if workers == 1:
+            for idx, match in enumerate(matches, 1):
+                results_by_idx[idx] = run_one(idx, match)
+        else:
+            print(f"⚡ Running with {workers} concurrent workers")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(run_one, idx, match): idx
+                    for idx, match in enumerate(matches, 1)
+                }
+                for future in as_completed(futures):
+                    results_by_idx[futures[future]] = future.result()
 
-            teams = parts[0].strip()
-            league = parts[1].strip()
-            date_str = parts[2].strip()
-
-            # Generate match_id
-            home_away = teams.replace(" vs ", "vs").replace(" ", "")
-            date_clean = date_str.replace("/", "")
-            match_id = f"{home_away}_{date_clean}"
-
-            # Find match in scraped data
-            match_data = None
-            for scraped_id, scraped_match in scraped_data.items():
-                if scraped_id.lower().startswith(home_away.lower()[:10]):
-                    match_data = scraped_match
-                    match_id = scraped_id
-                    break
+        # Keep input order regardless of completion order
+        results_summary = [results_by_idx[idx] for idx in sorted(results_by_idx) if results_by_idx[idx]]
 
-            if not match_data:
-                print(f"⚠️  Match not found in scraped data: {match_id}")
-                continue
+        # Final Summary
+        print("\n" + "="*80)
+        print("✅ BATCH ANALYSIS COMPLETE")
+        print("="*80)
 
-            match_info = match_data.get("match_info", {})
+        successful = [r for r in results_summary if r["status"] == "SUCCESS"]
+        failed = [r for r in results_summary if r["status"] == "FAILED"]
 
-            try:
-                # STAGE 0: Fetch URL Content + FootyStats Data
-                print("\n" + "-"*80)
-                print("🌐 STAGE 0: FETCHING DATA (URLs + FootyStats API)")
-                print("-"*80)
-
-                # Fetch URL content (SportsMole, Transfermarkt, etc.)
-                fetched_content = self.fetch_all_match_content(match_data)
-
-                # Build content summary for prompt
-                content_sections = []
-                for source_key, source_data in fetched_content.items():
-                    content_sections.append(f"""
-=== {source_data['description']} ===
-URL: {source_data['url']}
-CONTENT:
-{source_data['content']}
-""")
-
-                fetched_text = "\n".join(content_sections) if content_sections else "[No content fetched from URLs]"
-
-                print(f"   ✅ Fetched content from {len(fetched_content)} URL sources")
-
-                # Fetch FootyStats API data
-                footystats_data = self.fetch_all_footystats_data(match_info)
-
-                # Format FootyStats data for prompt
-                footystats_text = ""
-                if footystats_data.get("match_data"):
-                    footystats_text += f"""
-=== FootyStats Match Data ===
-{json.dumps(footystats_data['match_data'], indent=2)}
-"""
-                if footystats_data.get("home_team_data"):
-                    footystats_text += f"""
-=== FootyStats Home Team ({match_info.get('home')}) ===
-{json.dumps(footystats_data['home_team_data'], indent=2)}
-"""
-                if footystats_data.get("away_team_data"):
-                    footystats_text += f"""
-=== FootyStats Away Team ({match_info.get('away')}) ===
-{json.dumps(footystats_data['away_team_data'], indent=2)}
-"""
+        print(f"\n📊 SUMMARY:")
+        print(f"   Total matches: {len(matches)}")
+        print(f"   Successful: {len(successful)}")
+        print(f"   Failed: {len(failed)}")
 
-                if not footystats_text:
-                    footystats_text = "[FootyStats data not available for this match]"
-                else:
-                    print(f"   ✅ FootyStats API data fetched")
+        if successful:
+            print(f"\n✅ SUCCESSFUL ANALYSES:")
+            for result in successful:
+                print(f"   - {result['match']}")
+                print(f"     Decision: {result['decision']}, Fair Line: {result['fair_line']}, "
+                      f"CS: {result['cs_final']}, R: {result['r_score']:.2f}")
 
-                # STAGE 1: Data Consolidation
-                print("\n" + "-"*80)
-                print("📊 STAGE 1: DATA CONSOLIDATION")
-                print("-"*80)
+        if failed:
+            print(f"\n❌ FAILED ANALYSES:")
+            for result in failed:
+                print(f"   - {result['match']}: {result.get('error', 'Unknown error')}")
 
-                user_message_consolidation = f"""
-Extract and consolidate data for this match using the full v5.3 rubric.
+        cache_stats = self.footystats_cache.stats()
+        print(f"\n📦 FootyStats cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+              f"({cache_stats['hit_rate']:.0%} hit rate)")
+        llm_stats = self.llm_cache.stats()
+        print(f"📦 Claude response cache: {llm_stats['hits']} hits / {llm_stats['misses']} misses "
+              f"({llm_stats['hit_rate']:.0%} hit rate)")
+        self._print_token_usage()
 
-MATCH INFO:
-{json.dumps(match_info, indent=2)}
+        print(f"\n📁 All analyses saved in:")
+        print(f"   - Consolidated data: {self.config.CONSOLIDATED_DIR}")
+        print(f"   - Analyses: {self.config.ANALYSIS_DIR}")
+        print(f"   - Airtable: Match Analyses table")
 
-NEWS HEADLINES:
-{json.dumps(match_data.get('news', {}), indent=2)}
+        print(f"\n📝 Next steps:")
+        print(f"   1. Check Betfair for market odds")
+        print(f"   2. Calculate edge% for each match")
+        print(f"   3. Enter bets with ≥8% edge")
 
-FETCHED PAGE CONTENT (SportsMole, Transfermarkt, etc.):
-{fetched_text}
+    def _analyze_batch_match(self, idx: int, total: int, match: str, scraped_data: Dict,
+                             data_consolidation_prompt: str, yudor_master_prompt: str) -> Optional[Dict]:
+        """
+        Run the full v5.3 pipeline (fetch → consolidate → analyze → Airtable) for one
+        priority match. Safe to call from worker threads.
 
-FOOTYSTATS API DATA (xG, form, goals, positions):
-{footystats_text}
+        Returns:
+            Summary entry for results_summary, or None if the match was skipped
+        """
+        print("\n" + "="*80)
+        print(f"[{idx}/{total}] ANALYZING: {match}")
+        print("="*80)
 
-INSTRUCTIONS:
-1. EXTRACT REAL DATA from the sources above:
-   - xG data from FootyStats (home_xg_avg, away_xg_avg, home_goals_scored_avg, etc.)
-   - Form from FootyStats (home_ppg, away_ppg, wins/draws/losses, position)
-   - Team news/injuries from SportsMole
-   - Squad values from Transfermarkt
-   - Tactical info from news headlines
-2. Fill Q1-Q19 scores deterministically using ANEXO I criteria
-3. Calculate data quality score based on ACTUAL data found
-4. Document sources for each Q-score
-5. Output complete JSON with:
-   - q_scores (Q1-Q19 with home_score, away_score, reasoning, sources)
-   - category_totals (Technique, Tactics, Motivation, Form, Performance, Injuries, Home/Away)
-   - raw_scores (raw_casa, raw_vis)
-   - data_quality
-   - notes
+        # Parse match string
+        parts = match.split("#")[0].strip().split(",")
+        if len(parts) < 3:
+            print(f"⚠️  Invalid format, skipping: {match}")
+            return None
 
-DATA PRIORITY:
-1. FootyStats API → xG, goals/game, form, table position (MOST RELIABLE)
-2. SportsMole → Team news, injuries, preview context
-3. Transfermarkt → Squad values
-4. News Headlines → Derby context, motivation
+        teams = parts[0].strip()
+        league = parts[1].strip()
+        date_str = parts[2].strip()
+
+        # Generate match_id
+        home_away = teams.replace(" vs ", "vs").replace(" ", "")
+        date_clean = date_str.replace("/", "")
+        match_id = f"{home_away}_{date_clean}"
+
+        # Find match in scraped data
+        match_data = None
+        for scraped_id, scraped_match in scraped_data.items():
+            if scraped_id.lower().startswith(home_away.lower()[:10]):
+                match_data = scraped_match
+                match_id = scraped_id
+                break
+
+        if not match_data:
+            print(f"⚠️  Match not found in scraped data: {match_id}")
+            return None
 
-IMPORTANT:
-- Use ACTUAL DATA from the fetched content and FootyStats API
-- Do NOT include Betfair odds - we use BLIND PRICING
-- Be deterministic and reference ANEXO I for scoring rules
-"""
+        match_info = match_data.get("match_info", {})
 
-                print("🤖 Calling Claude for data consolidation...")
-                consolidation_response = self.call_claude(
-                    data_consolidation_prompt,
-                    user_message_consolidation,
-                    max_tokens=8000
-                )
+        try:
+            # STAGE 0: Fetch URL Content + FootyStats Data
+            print("\n" + "-"*80)
+            print("🌐 STAGE 0: FETCHING DATA (URLs + FootyStats API)")
+            print("-"*80)
 
-                consolidated_data = self.extract_json_from_response(consolidation_response)
+            # Fetch URL content (SportsMole, Transfermarkt, etc.)
+            fetched_content = self.fetch_all_match_content(match_data)
 
-                # Save consolidated data
-                consolidated_file = self.config.CONSOLIDATED_DIR / f"{match_id}_consolidated.json"
-                with open(consolidated_file, "w", encoding="utf-8") as f:
-                    json.dump(consolidated_data, f, indent=2, ensure_ascii=False)
+            print(f"   ✅ Fetched content from {len(fetched_content)} URL sources")
 
-                print(f"✅ Data consolidated and saved to: {consolidated_file}")
+            # Fetch FootyStats API data
+            footystats_data = self.fetch_all_footystats_data(match_info)
+            if any(footystats_data.get(k) for k in ["match_data", "home_team_data", "away_team_data"]):
+                print(f"   ✅ FootyStats API data fetched")
 
-                # STAGE 2: Yudor v5.3 Analysis
-                print("\n" + "-"*80)
-                print("🎯 STAGE 2: YUDOR v5.3 ANALYSIS (3 Layers)")
-                print("-"*80)
+            payload_text, payload_report = self._build_match_payload(
+                match_info, match_data, fetched_content, footystats_data
+            )
+            print(f"   📏 Prompt payload: ~{payload_report['estimated_tokens']:,} tokens"
+                  + (f" (truncated: {', '.join(payload_report['truncated'])})" if payload_report["truncated"] else "")
+                  + (f" (dropped: {', '.join(payload_report['dropped'])})" if payload_report["dropped"] else ""))
 
-                user_message_yudor = f"""
-Run complete Yudor v5.3 analysis on this consolidated data.
+            # STAGE 1: Data Consolidation
+            print("\n" + "-"*80)
+            print("📊 STAGE 1: DATA CONSOLIDATION")
+            print("-"*80)
 
-CONSOLIDATED DATA:
-{json.dumps(consolidated_data, indent=2)}
+            user_message_consolidation = f"""
+Extract and consolidate data for this match using the full v5.3 rubric.
 
-EXECUTE THESE LAYERS IN ORDER:
+MATCH INFO:
+{compact_json(match_info)}
 
-LAYER 1: BLIND PRICING (CORRECT YUDOR METHODOLOGY)
-- Sum Raw_Casa from all home Q-scores
-- Sum Raw_Vis from all away Q-scores
-- Get P(Empate) from consolidated data (derived from odds, NOT modified)
+MATCH DATA (most reliable first: FootyStats API, SportsMole, stats pages, Transfermarkt, news):
+{payload_text}
+"""
 
-STEP 1: Normalize if sum > 100
-  * Soma = Raw_Casa + Raw_Vis + P(Empate)
-  * IF Soma > 100:
-    - Surplus = (Soma - 100) / 2
-    - Adjusted_Casa = Raw_Casa - Surplus
-    - Adjusted_Vis = Raw_Vis - Surplus
-    - P(Empate) STAYS UNCHANGED
-  * ELSE:
-    - Adjusted_Casa = Raw_Casa
-    - Adjusted_Vis = Raw_Vis
+            print("🤖 Calling Claude for data consolidation...")
+            consolidation_response = self.call_claude(
+                data_consolidation_prompt,
+                user_message_consolidation,
+                max_tokens=8000,
+                static_context=CONSOLIDATION_INSTRUCTIONS,
+                label=f"{match_id}:consolidation"
+            )
 
-STEP 2: Identify favorite and calculate Moneyline odds
-  * Favorite_Pct = max(Adjusted_Casa, Adjusted_Vis)
-  * Underdog_Pct = min(Adjusted_Casa, Adjusted_Vis)
-  * Odd_ML = 100 / Favorite_Pct
-  * This Odd_ML = -0.5 AH for the favorite
+            consolidated_data = self.extract_json_from_response(consolidation_response)
 
-STEP 3: Calculate +0.5 AH reference point
-  * Odds_Plus05 = 100 / (Favorite_Pct + P_Empate)
+            # Save consolidated data
+            consolidated_file = self.config.CONSOLIDATED_DIR / f"{match_id}_consolidated.json"
+            with open(consolidated_file, "w", encoding="utf-8") as f:
+                json.dump(consolidated_data, f, indent=2, ensure_ascii=False)
 
-STEP 4: Iterate to find AH line with odds ~2.0 [1.97, 2.03]
-  * Start at -0.5 AH with Odd_ML
-  * For each -0.25 step (more negative): odds *= 1.15
-  * For each +0.25 step (more positive): odds *= 0.85
-  * Stop when odds reach [1.97, 2.03] range
-  * Max 20 iterations
+            print(f"✅ Data consolidated and saved to: {consolidated_file}")
 
-STEP 5: Return Fair AH Line
-  * If home is favorite: line is negative (e.g., -1.25)
-  * If away is favorite: line is positive for home (e.g., +0.75)
-  * Include Delta = Raw_Casa - Raw_Vis for reference
+            # STAGE 2: Yudor v5.3 Analysis
+            print("\n" + "-"*80)
+            print("🎯 STAGE 2: YUDOR v5.3 ANALYSIS (3 Layers)")
+            print("-"*80)
 
-LAYER 2: CONFIDENCE (CS_final)
-- BSD = |Delta| / max(Raw_Casa, Raw_Vis) * 100
-- CCS = consistency of category scores
-- CS_final = (BSD * 0.6 + CCS * 0.4)
-- Tier: 1 if CS≥70, 2 if CS≥50, 3 otherwise
+            user_message_yudor = self._yudor_user_message(consolidated_data)
+            print(f"   📏 Prompt payload: ~{estimate_tokens(user_message_yudor):,} tokens")
 
-LAYER 3: RG GUARD
-- Calculate R-Score from risk signals
-- Decision: VETO/FLIP/EXP/CORE based on R-Score and Tier
+            print("🤖 Calling Claude for v5.3 analysis...")
+            yudor_response = self.call_claude(
+                yudor_master_prompt,
+                user_message_yudor,
+                max_tokens=8000,
+                static_context=YUDOR_ANALYSIS_INSTRUCTIONS,
+                label=f"{match_id}:yudor"
+            )
 
-OUTPUT ONLY VALID JSON (no markdown, no explanation text):
-```json
-{{
-  "match_id": "{consolidated_data.get('game_id', 'unknown')}",
-  "raw_casa": <number>,
-  "raw_vis": <number>,
-  "delta": <number>,
-  "yudor_ah_fair": <number like -0.5 or +1.0>,
-  "pr_casa": <decimal>,
-  "pr_vis": <decimal>,
-  "pr_empate": 0.25,
-  "cs_final": <0-100>,
-  "tier": <1, 2, or 3>,
-  "r_home": <0.0-1.0>,
-  "r_away": <0.0-1.0>,
-  "r_fav": <0.0-1.0>,
-  "r_dog": <0.0-1.0>,
-  "rbr": <-1.0 to +1.0>,
-  "r_score": <0.0-1.0>,
-  "edge_synthetic": <calculated as (|AH_Line| / 0.25) × 8, used for FLIP evaluation>,
-  "decision": "CORE" or "EXP" or "FLIP" or "VETO",
-  "reasoning": "<brief explanation>"
-}}
-```
+            # Debug: save raw response if parsing fails
+            try:
+                yudor_analysis = self.extract_json_from_response(yudor_response)
+            except json.JSONDecodeError as e:
+                # Save raw response for debugging
+                debug_file = self.config.ANALYSIS_DIR / f"{match_id}_yudor_raw.txt"
+                with open(debug_file, "w", encoding="utf-8") as f:
+                    f.write(yudor_response)
+                print(f"⚠️  JSON parse error. Raw response saved to: {debug_file}")
+                print(f"   Response length: {len(yudor_response)} chars")
+                print(f"   Response preview: {yudor_response[:500]}...")
+                raise e
+
+            # Combine results
+            full_analysis = {
+                "match_id": match_id,
+                "match_info": match_info,
+                "timestamp": datetime.now().isoformat(),
+                "consolidated_data": consolidated_data,
+                "yudor_analysis": yudor_analysis
+            }
 
-CRITICAL: Return ONLY the JSON object, no other text.
-"""
+            # Save analysis
+            analysis_file = self.config.ANALYSIS_DIR / f"{match_id}_analysis.json"
+            with open(analysis_file, "w", encoding="utf-8") as f:
+                json.dump(full_analysis, f, indent=2, ensure_ascii=False)
 
-                print("🤖 Calling Claude for v5.3 analysis...")
-                yudor_response = self.call_claude(
-                    yudor_master_prompt,
-                    user_message_yudor,
-                    max_tokens=8000
-                )
+            print(f"✅ Analysis complete and saved to: {analysis_file}")
 
-                # Debug: save raw response if parsing fails
-                try:
-                    yudor_analysis = self.extract_json_from_response(yudor_response)
-                except json.JSONDecodeError as e:
-                    # Save raw response for debugging
-                    debug_file = self.config.ANALYSIS_DIR / f"{match_id}_yudor_raw.txt"
-                    with open(debug_file, "w", encoding="utf-8") as f:
-                        f.write(yudor_response)
-                    print(f"⚠️  JSON parse error. Raw response saved to: {debug_file}")
-                    print(f"   Response length: {len(yudor_response)} chars")
-                    print(f"   Response preview: {yudor_response[:500]}...")
-                    raise e
-
-                # Combine results
-                full_analysis = {
-                    "match_id": match_id,
-                    "match_info": match_info,
-                    "timestamp": datetime.now().isoformat(),
-                    "consolidated_data": consolidated_data,
-                    "yudor_analysis": yudor_analysis
-                }
+            # Display results
+            print(f"\n📊 RESULTS:")
+            print(f"   Fair AH Line: {yudor_analysis.get('yudor_ah_fair', 'N/A')}")
+            print(f"   Fair Odds: {yudor_analysis.get('yudor_ah_odds', 'N/A')}")
+            print(f"   Decision: {yudor_analysis.get('decision', 'N/A')}")
+            print(f"   CS_final: {yudor_analysis.get('cs_final', 0)}")
+            print(f"   R-Score: {yudor_analysis.get('r_score', 0)}")
+            print(f"   Tier: {yudor_analysis.get('tier', 0)}")
 
-                # Save analysis
-                analysis_file = self.config.ANALYSIS_DIR / f"{match_id}_analysis.json"
-                with open(analysis_file, "w", encoding="utf-8") as f:
-                    json.dump(full_analysis, f, indent=2, ensure_ascii=False)
+            # STAGE 3: Save to Airtable
+            print("\n" + "-"*80)
+            print("💾 STAGE 3: SAVING TO AIRTABLE")
+            print("-"*80)
 
-                print(f"✅ Analysis complete and saved to: {analysis_file}")
+            self.save_to_airtable(match_id, match_info, yudor_analysis)
 
-                # Display results
-                print(f"\n📊 RESULTS:")
-                print(f"   Fair AH Line: {yudor_analysis.get('yudor_ah_fair', 'N/A')}")
-                print(f"   Fair Odds: {yudor_analysis.get('yudor_ah_odds', 'N/A')}")
-                print(f"   Decision: {yudor_analysis.get('decision', 'N/A')}")
-                print(f"   CS_final: {yudor_analysis.get('cs_final', 0)}")
-                print(f"   R-Score: {yudor_analysis.get('r_score', 0)}")
-                print(f"   Tier: {yudor_analysis.get('tier', 0)}")
-
-                # STAGE 3: Save to Airtable
-                print("\n" + "-"*80)
-                print("💾 STAGE 3: SAVING TO AIRTABLE")
-                print("-"*80)
-
-                self.save_to_airtable(match_id, match_info, yudor_analysis)
-
-                results_summary.append({
-                    "match": match,
-                    "match_id": match_id,
-                    "status": "SUCCESS",
-                    "decision": yudor_analysis.get('decision', 'N/A'),
-                    "fair_line": yudor_analysis.get('yudor_ah_fair', 'N/A'),
-                    "cs_final": yudor_analysis.get('cs_final', 0),
-                    "r_score": yudor_analysis.get('r_score', 0)
-                })
+            return {
+                "match": match,
+                "match_id": match_id,
+                "status": "SUCCESS",
+                "decision": yudor_analysis.get('decision', 'N/A'),
+                "fair_line": yudor_analysis.get('yudor_ah_fair', 'N/A'),
+                "cs_final": yudor_analysis.get('cs_final', 0),
+                "r_score": yudor_analysis.get('r_score', 0)
+            }
 
-            except Exception as e:
-                print(f"\n❌ Analysis failed: {e}")
-                results_summary.append({
-                    "match": match,
-                    "match_id": match_id,
-                    "status": "FAILED",
-                    "error": str(e)
-                })
+        except Exception as e:
+            print(f"\n❌ Analysis failed: {e}")
+            return {
+                "match": match,
+                "match_id": match_id,
+                "status": "FAILED",
+                "error": str(e)
+            }
 
-        # Final Summary
+    def _yudor_user_message(self, consolidated_data: Dict) -> str:
+        """User message for the Yudor v5.3 analysis step (3 layers) of one match"""
+        return f"""
+Run complete Yudor v5.3 analysis on this consolidated data.
+
+MATCH ID: {consolidated_data.get('game_id', 'unknown')}
+
+CONSOLIDATED DATA:
+{compact_json(consolidated_data)}
+"""
+
+    def reanalyze_history(self, batch_api: bool = False, match_id: Optional[str] = None):
+        """
+        Re-run the Yudor v5.3 step on saved analyses (analysis_history/*_analysis.json)
+
+        Reuses each file's consolidated data, so nothing is scraped or consolidated
+        again. With batch_api=True all matches go out as one Message Batch.
+        Updated analyses are saved back and synced to Airtable.
+
+        Args:
+            batch_api: Use the Message Batches API instead of live calls
+            match_id: Only re-analyze this match
+        """
         print("\n" + "="*80)
-        print("✅ BATCH ANALYSIS COMPLETE")
+        print("🔁 COMMAND: RE-ANALYZE HISTORY" + (" (Message Batches API)" if batch_api else ""))
         print("="*80)
 
-        successful = [r for r in results_summary if r["status"] == "SUCCESS"]
-        failed = [r for r in results_summary if r["status"] == "FAILED"]
+        analyses = {}
+        for analysis_file in sorted(self.config.ANALYSIS_DIR.glob("*_analysis.json")):
+            try:
+                with open(analysis_file, encoding="utf-8") as f:
+                    analysis = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"⚠️  Skipping unreadable {analysis_file.name}: {e}")
+                continue
 
-        print(f"\n📊 SUMMARY:")
-        print(f"   Total matches: {len(matches)}")
-        print(f"   Successful: {len(successful)}")
-        print(f"   Failed: {len(failed)}")
+            file_match_id = analysis.get("match_id") or analysis_file.name[:-len("_analysis.json")]
+            if match_id and file_match_id != match_id:
+                continue
+            if not analysis.get("consolidated_data"):
+                print(f"⚠️  Skipping {file_match_id}: no consolidated data saved")
+                continue
+            analyses[file_match_id] = (analysis_file, analysis)
 
-        if successful:
-            print(f"\n✅ SUCCESSFUL ANALYSES:")
-            for result in successful:
-                print(f"   - {result['match']}")
-                print(f"     Decision: {result['decision']}, Fair Line: {result['fair_line']}, "
-                      f"CS: {result['cs_final']}, R: {result['r_score']:.2f}")
+        if not analyses:
+            print("❌ No saved analyses to re-run")
+            return
 
-        if failed:
-            print(f"\n❌ FAILED ANALYSES:")
-            for result in failed:
-                print(f"   - {result['match']}: {result.get('error', 'Unknown error')}")
+        print(f"📋 Re-analyzing {len(analyses)} matches")
 
-        print(f"\n📁 All analyses saved in:")
-        print(f"   - Consolidated data: {self.config.CONSOLIDATED_DIR}")
-        print(f"   - Analyses: {self.config.ANALYSIS_DIR}")
-        print(f"   - Airtable: Match Analyses table")
+        yudor_master_prompt = self.load_prompt("YUDOR_MASTER_PROMPT_v5.3.md")
+        jobs = {
+            mid: {
+                "system_prompt": yudor_master_prompt,
+                "user_message": self._yudor_user_message(analysis["consolidated_data"]),
+                "max_tokens": 8000,
+                "static_context": YUDOR_ANALYSIS_INSTRUCTIONS,
+                "label": f"{mid}:yudor"
+            }
+            for mid, (_, analysis) in analyses.items()
+        }
 
-        print(f"\n📝 Next steps:")
-        print(f"   1. Check Betfair for market odds")
-        print(f"   2. Calculate edge% for each match")
-        print(f"   3. Enter bets with ≥8% edge")
+        if batch_api:
+            responses = self.call_claude_batch(jobs)
+        else:
+            responses = {}
+            for mid, job in jobs.items():
+                try:
+                    responses[mid] = {"text": self.call_claude(
+                        job["system_prompt"], job["user_message"],
+                        max_tokens=job["max_tokens"], static_context=job["static_context"],
+                        label=job["label"]
+                    )}
+                except Exception as e:
+                    responses[mid] = {"error": str(e)}
+
+        updated, failed = 0, 0
+        for mid, (analysis_file, analysis) in analyses.items():
+            outcome = responses.get(mid, {"error": "no response"})
+            try:
+                if "error" in outcome:
+                    raise Exception(outcome["error"])
+                yudor_analysis = self.extract_json_from_response(outcome["text"])
+            except Exception as e:
+                failed += 1
+                print(f"   ❌ {mid}: {e}")
+                continue
+
+            analysis["yudor_analysis"] = yudor_analysis
+            analysis["timestamp"] = datetime.now().isoformat()
+            self._write_json_atomic(analysis_file, analysis)
+            self.save_to_airtable(mid, analysis.get("match_info", {}), yudor_analysis)
+            updated += 1
+            print(f"   ✅ {mid}: {yudor_analysis.get('decision', 'N/A')} "
+                  f"(Fair AH {yudor_analysis.get('yudor_ah_fair', 'N/A')})")
+
+        print(f"\n📊 Re-analyzed {updated} matches ({failed} failed)")
+        self._print_token_usage()
 
     # =========================
     # INTERACTIVE EDGE CALCULATION (OLD CODE)
@@ -2425,37 +2971,22 @@ CRITICAL: Return ONLY the JSON object, no other text.
 Perform root cause analysis for this losing bet.
 
 ORIGINAL ANALYSIS:
-{json.dumps(original_analysis, indent=2)}
+{compact_json(original_analysis)}
 
 ACTUAL RESULT:
 - Final Score: {loss.get('final_score', 'Unknown')}
 - Outcome: LOSS
 - Notes: {loss.get('notes', 'None')}
-
-INSTRUCTIONS:
-1. Retrieve original Q1-Q19 scores and predictions
-2. Compare predictions vs actual match outcome
-3. Identify which Q-IDs failed (where prediction was wrong)
-4. Classify error type:
-   - Model Error: Q-ID weight/criteria is wrong
-   - Data Error: Scraped data was incorrect/incomplete
-   - Variance: Correct prediction, unlucky outcome (e.g., high xG but lost)
-5. Provide recommendations for improvement
-
-Output complete JSON with:
-- failed_q_ids: List of Q-IDs that failed with explanations
-- error_type: "Model Error" | "Data Error" | "Variance"
-- error_category: Brief description (e.g., "Q6: Tactics - Formation matchup failed")
-- recommendations: Specific suggestions for system improvement
-- root_cause_summary: Concise explanation of why bet lost
 """
 
             try:
-                print("🤖 Calling Claude for loss analysis...")
+                print(f"🤖 Calling Claude for loss analysis (~{estimate_tokens(user_message):,} tokens)...")
                 loss_response = self.call_claude(
                     loss_ledger_prompt,
                     user_message,
-                    max_tokens=8000
+                    max_tokens=8000,
+                    static_context=LOSS_ANALYSIS_INSTRUCTIONS,
+                    label=f"{match_id}:loss"
                 )
 
                 loss_analysis_result = self.extract_json_from_response(loss_response)
@@ -2528,8 +3059,9 @@ def main():
 Usage:
   python master_orchestrator.py analyze-fbref "Barcelona vs Athletic Club, La Liga, 22/11/2025"
   python master_orchestrator.py analyze "Flamengo vs Bragantino, Brasileirão, 25/11/2025"
-  python master_orchestrator.py pre-filter [--input matches_all.txt]
-  python master_orchestrator.py analyze-batch [--input matches_priority.txt]
+  python master_orchestrator.py pre-filter [--input matches_all.txt] [--workers 4] [--batch-api]
+  python master_orchestrator.py analyze-batch [--input matches_priority.txt] [--workers 4]
+  python master_orchestrator.py reanalyze [--batch-api] [--match-id MATCH_ID]
   python master_orchestrator.py loss-analysis --auto
   python master_orchestrator.py loss-analysis --match-id MATCH_ID
 
@@ -2538,11 +3070,16 @@ Commands:
   analyze "match"         - Analyze single match (old workflow)
   pre-filter              - Filter 30-40 games by data quality (creates matches_priority.txt)
   analyze-batch           - Run v5.3 analysis on priority games (full automation)
+  reanalyze               - Re-run v5.3 analysis on saved analysis_history (reuses consolidated data)
   loss-analysis --auto    - Analyze all unanalyzed losses from Airtable
   loss-analysis --match-id - Analyze specific loss manually
 
 Options:
   --input FILE            - Specify input file (default: matches_all.txt or matches_priority.txt)
+  --workers N             - Games in flight at once (analyze-batch default: 1, pre-filter default: 4)
+  --batch-api             - Send Claude requests as one Message Batch (pre-filter, reanalyze)
+  --no-llm-cache          - Always call Claude (ignore cached responses)
+  --clear-llm-cache       - Delete cached Claude responses before running
   --auto                  - Auto-detect losses from Airtable
   --match-id MATCH_ID     - Specify match ID for manual loss analysis
 
@@ -2568,6 +3105,8 @@ Examples:
     input_file = None
     auto = False
     match_id = None
+    workers = None
+    batch_api = False
 
     for i, arg in enumerate(sys.argv[2:], start=2):
         if arg == "--input" and i + 1 < len(sys.argv):
@@ -2576,6 +3115,14 @@ Examples:
             auto = True
         elif arg == "--match-id" and i + 1 < len(sys.argv):
             match_id = sys.argv[i + 1]
+        elif arg == "--workers" and i + 1 < len(sys.argv):
+            workers = int(sys.argv[i + 1])
+        elif arg == "--batch-api":
+            batch_api = True
+        elif arg == "--no-llm-cache":
+            orchestrator.llm_cache.enabled = False
+        elif arg == "--clear-llm-cache":
+            orchestrator.llm_cache.clear()
 
     # Execute commands
     if command == "analyze-fbref":
@@ -2589,10 +3136,13 @@ Examples:
         orchestrator.analyze_complete_integrated(match_string)
 
     elif command == "pre-filter":
-        orchestrator.pre_filter(input_file=input_file)
+        orchestrator.pre_filter(input_file=input_file, workers=workers, batch_api=batch_api)
 
     elif command == "analyze-batch":
-        orchestrator.analyze_batch(input_file=input_file)
+        orchestrator.analyze_batch(input_file=input_file, workers=workers)
+
+    elif command == "reanalyze":
+        orchestrator.reanalyze_history(batch_api=batch_api, match_id=match_id)
 
     elif command == "loss-analysis":
         orchestrator.loss_analysis(auto=auto, match_id=match_id)
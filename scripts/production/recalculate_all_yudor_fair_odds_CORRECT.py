@@ -11,6 +11,9 @@ Correct methodology:
 5. Find AH line closest to odds 2.0
 6. Calculate odds at that line using ±15% per 0.25 step
 
+Steps 4-6 use the shared Yudor kernel (scripts/Phase2/yudor_fair_odds.py) and run
+as one vectorized call over every record.
+
 Example (Real Betis):
 - raw_casa: 50, raw_vis: 17, pr_empate: 25
 - Sum: 50 + 17 + 25 = 92% (missing 8%)
@@ -22,8 +25,14 @@ import os
 import sys
 import json
 from pathlib import Path
+import numpy as np
 from pyairtable import Api
 
+# Add project root to path so the shared Yudor kernel can be imported
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from scripts.Phase2.yudor_fair_odds import fair_odds_at_line, optimal_line
+
 # Load env (navigate up to project root from scripts/production/)
 env_file = Path(__file__).parent.parent.parent / '.env'
 if env_file.exists():
@@ -83,80 +92,6 @@ def calculate_correct_probabilities(raw_casa: float, raw_vis: float, pr_empate:
     }
 
 
-def calculate_odds_at_line(fav_prob_pct: float, ah_line: float) -> float:
-    """
-    Calculate odds at specific AH line
-
-    Formula:
-    - Moneyline (at -0.5): 100 / favorite%
-    - Each +0.25 step: ×0.85 (easier for underdog)
-    - Each -0.25 step: ×1.15 (harder for favorite)
-    """
-    odd_ml = 100 / fav_prob_pct
-    steps = (ah_line + 0.5) / 0.25
-
-    if steps > 0:
-        odds = odd_ml * (0.85 ** steps)
-    elif steps < 0:
-        odds = odd_ml * (1.15 ** abs(steps))
-    else:
-        odds = odd_ml
-
-    return round(odds, 2)
-
-
-def find_ah_line_closest_to_2(fav_prob_pct: float) -> tuple:
-    """
-    Find AH line that gives odds closest to 2.0
-
-    IMPORTANT: We always bet on FAVORITE in normal scenarios.
-    - Negative AH: favorite gives goals (harder, higher odds)
-    - Zero AH: push on draw (easier, lower odds)
-
-    Returns:
-        (ah_line, odds_at_line)
-
-    Example:
-        54% favorite → Moneyline 1.85
-        - AH -0.5: 1.85 (baseline - favorite gives 0.5 goals)
-        - AH -0.25: 1.85 * 0.85 = 1.57 (easier - smaller handicap)
-        - AH 0.0: 1.85 * 0.85^2 = 1.34 (easiest - push on draw)
-        - AH -0.75: 1.85 * 1.15 = 2.13 (harder - gives 0.75 goals)
-    """
-    odd_ml = 100 / fav_prob_pct
-
-    best_line = None
-    best_odds = None
-    best_diff = float('inf')
-
-    # Start from -0.5 (moneyline) and check in both directions
-    # Direction 1: Harder handicaps (negative, favorite gives more goals)
-    current_line = -0.5
-    current_odds = odd_ml
-    while current_line >= -3.0:
-        diff = abs(current_odds - 2.0)
-        if diff < best_diff:
-            best_diff = diff
-            best_line = current_line
-            best_odds = current_odds
-        current_line -= 0.25
-        current_odds *= 1.15
-
-    # Direction 2: Easier handicaps (AH -0.25 and 0.0)
-    # AH -0.25 is 1 step from -0.5 (multiply by 0.85)
-    # AH 0.0 is 2 steps from -0.5 (multiply by 0.85^2)
-    for steps in [1, 2]:
-        current_line = -0.5 + (0.25 * steps)
-        current_odds = odd_ml * (0.85 ** steps)
-        diff = abs(current_odds - 2.0)
-        if diff < best_diff:
-            best_diff = diff
-            best_line = current_line
-            best_odds = current_odds
-
-    return (round(best_line, 2), round(best_odds, 2))
-
-
 def determine_yudor_ah_team(home_team: str, away_team: str,
                             pr_casa_pct: float, pr_vis_pct: float,
                             ah_line: float) -> str:
@@ -244,54 +179,70 @@ updated_count = 0
 skipped_count = 0
 error_count = 0
 
+# Pass 1: extract and normalize every record
+rows = []
 for idx, record in enumerate(all_records, 1):
-    record_id = record['id']
-    fields = record['fields']
-    match_id = fields.get('match_id', f'Record #{idx}')
-
-    print(f"[{idx}/{len(all_records)}] {match_id}")
+    match_id = record['fields'].get('match_id', f'Record #{idx}')
 
     try:
         # Extract data from archived file
         data = extract_data_from_archived(match_id)
 
         if not data:
+            print(f"[{idx}/{len(all_records)}] {match_id}")
             print(f"   ⚠️  Could not extract data from archived file")
             skipped_count += 1
             continue
 
-        raw_casa = data['raw_casa']
-        raw_vis = data['raw_vis']
-        pr_empate = data['pr_empate']
-        yudor_ah_fair_archived = data.get('yudor_ah_fair_archived')
-        decision = data.get('decision')
-        home_team = data['home_team']
-        away_team = data['away_team']
-
         # Calculate CORRECT probabilities
-        probs = calculate_correct_probabilities(raw_casa, raw_vis, pr_empate)
+        probs = calculate_correct_probabilities(data['raw_casa'], data['raw_vis'], data['pr_empate'])
+
+        # CRITICAL: For FLIP scenarios, preserve the archived AH line
+        # The FLIP logic is complex (R-Score, injuries, etc.) and should not be recalculated here
+        flip_line = None
+        if data.get('decision') == "FLIP" and data.get('yudor_ah_fair_archived') is not None:
+            flip_line = float(data['yudor_ah_fair_archived'])
+
+        rows.append((idx, record, match_id, data, probs, flip_line))
+
+    except Exception as e:
+        print(f"[{idx}/{len(all_records)}] {match_id}")
+        print(f"   ❌ Error: {str(e)[:100]}")
+        error_count += 1
+
+# Pass 2: AH line closest to 2.0 and fair odds at the final line, all records at once
+fav_pcts = np.array([max(row[4]['pr_casa_pct'], row[4]['pr_vis_pct']) for row in rows], dtype=float)
+optimal_lines, _ = optimal_line(fav_pcts)
+flip_lines = np.array([np.nan if row[5] is None else row[5] for row in rows], dtype=float)
+ah_lines = np.where(np.isnan(flip_lines), optimal_lines, flip_lines)
+fair_odds_all = np.round(fair_odds_at_line(fav_pcts, ah_lines), 2)
+
+# Pass 3: report and update Airtable
+for k, (idx, record, match_id, data, probs, flip_line) in enumerate(rows):
+    record_id = record['id']
+    fields = record['fields']
+
+    print(f"[{idx}/{len(all_records)}] {match_id}")
+
+    try:
         pr_casa_pct = probs['pr_casa_pct']
         pr_vis_pct = probs['pr_vis_pct']
         pr_empate_pct = probs['pr_empate_pct']
+        home_team = data['home_team']
+        away_team = data['away_team']
 
-        print(f"   Raw: {raw_casa} vs {raw_vis}, Draw: {pr_empate_pct}%")
+        print(f"   Raw: {data['raw_casa']} vs {data['raw_vis']}, Draw: {pr_empate_pct}%")
         print(f"   Normalized: {pr_casa_pct}% vs {pr_vis_pct}%, Draw: {pr_empate_pct}%")
 
-        # CRITICAL: For FLIP scenarios, preserve the archived AH line
-        # The FLIP logic is complex (R-Score, injuries, etc.) and should not be recalculated here
-        if decision == "FLIP" and yudor_ah_fair_archived is not None:
-            # Use archived AH line for FLIP scenarios
-            ah_fair = yudor_ah_fair_archived
+        if flip_line is not None:
+            ah_fair = flip_line
             print(f"   🔄 FLIP scenario detected - using archived AH line: {ah_fair}")
         else:
-            # For CORE, EXP, VETO: calculate AH line closest to 2.0 odds
-            fav_prob_pct = max(pr_casa_pct, pr_vis_pct)
-            ah_fair, _ = find_ah_line_closest_to_2(fav_prob_pct)
-            print(f"   Moneyline: {100/fav_prob_pct:.2f} (at -0.5)")
-
-        # Calculate fair odds at the AH line
-        fav_prob_pct = max(pr_casa_pct, pr_vis_pct)
-        fair_odds = calculate_odds_at_line(fav_prob_pct, ah_fair)
+            # For CORE, EXP, VETO: AH line closest to 2.0 odds
+            ah_fair = round(float(ah_lines[k]), 2)
+            print(f"   Moneyline: {100/fav_pcts[k]:.2f} (at -0.5)")
+
+        fair_odds = float(fair_odds_all[k])
 
         # Determine which team to bet on based on AH line sign
         ah_team = determine_yudor_ah_team(home_team, away_team, pr_casa_pct, pr_vis_pct, ah_fair)
@@ -16,15 +16,20 @@ import argparse
 import json
 import os
 import re
+import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List
 
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+# Project root on sys.path so the shared Phase2 modules import when run as a script
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+from scripts.Phase2.http_client import get_http_client
+
 load_dotenv()
 
 # =========================
@@ -341,7 +346,7 @@ def serper_search(query: str, count: int = 10) -> List[str]:
     }
 
     try:
-        resp = requests.post("https://google.serper.dev/search", headers=headers, json=payload, timeout=20)
+        resp = get_http_client().post("https://google.serper.dev/search", headers=headers, json=payload, timeout=20)
         if resp.status_code == 200:
             data = resp.json()
             results = data.get("organic", [])
@@ -363,7 +368,7 @@ def scrape_news_content(url: str, source: str) -> List[Dict]:
     print(f"   📰 Scraping ({source}): {url}")
     try:
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36"}
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = get_http_client().get(url, headers=headers, timeout=10)
         if resp.status_code != 200: return news_items
         soup = BeautifulSoup(resp.text, "html.parser")
         links_found = []
@@ -514,6 +519,33 @@ def load_matches(matches_file: str) -> List[Dict]:
         return []
     return matches
 
+def scrape_match(m: Dict) -> Dict:
+    """Find URLs and scrape news headlines for a single match (one entry of load_matches)."""
+    print(f"\n⚽ {m['home']} vs {m['away']} ({m['league']})")
+    news_source = determine_news_source(m["league"])
+
+    entry = {"match_info": m, "urls": {}, "news": {}}
+
+    # NOTE: SofaScore, WhoScored, FlashScore are DISABLED (blocked/403)
+    # FootyStats API now provides stats (xG, PPG, goals, form)
+    # Only SportsMole is needed for qualitative data (lineups, injuries, context)
+    for site in ["sportsmole"]:  # Disabled: "sofascore", "whoscored", "flashscore"
+        entry["urls"][site] = find_best_link(m, site, scope="match")
+        time.sleep(0.1)
+
+    entry["urls"]["tm_home"] = find_best_link(m, "transfermarkt", scope="home_team")
+    entry["urls"]["tm_away"] = find_best_link(m, "transfermarkt", scope="away_team")
+
+    url_h = find_best_link(m, news_source, scope="home_team")
+    entry["urls"]["news_home"] = url_h
+    entry["news"]["home"] = scrape_news_content(url_h, news_source)
+
+    url_a = find_best_link(m, news_source, scope="away_team")
+    entry["urls"]["news_away"] = url_a
+    entry["news"]["away"] = scrape_news_content(url_a, news_source)
+
+    return entry
+
 def run(matches_file: str = Config.MATCHES_INPUT_FILE, output_file: str = Config.OUTPUT_FILE):
     matches = load_matches(matches_file)
     if not matches:
@@ -523,30 +555,7 @@ def run(matches_file: str = Config.MATCHES_INPUT_FILE, output_file: str = Config
     print(f"🚀 Starting International Scraper (V29 - SerpApi Economy) for {len(matches)} matches...")
 
     for m in matches:
-        print(f"\n⚽ {m['home']} vs {m['away']} ({m['league']})")
-        news_source = determine_news_source(m["league"])
-
-        entry = {"match_info": m, "urls": {}, "news": {}}
-
-        # NOTE: SofaScore, WhoScored, FlashScore are DISABLED (blocked/403)
-        # FootyStats API now provides stats (xG, PPG, goals, form)
-        # Only SportsMole is needed for qualitative data (lineups, injuries, context)
-        for site in ["sportsmole"]:  # Disabled: "sofascore", "whoscored", "flashscore"
-            entry["urls"][site] = find_best_link(m, site, scope="match")
-            time.sleep(0.1)
-
-        entry["urls"]["tm_home"] = find_best_link(m, "transfermarkt", scope="home_team")
-        entry["urls"]["tm_away"] = find_best_link(m, "transfermarkt", scope="away_team")
-
-        url_h = find_best_link(m, news_source, scope="home_team")
-        entry["urls"]["news_home"] = url_h
-        entry["news"]["home"] = scrape_news_content(url_h, news_source)
-
-        url_a = find_best_link(m, news_source, scope="away_team")
-        entry["urls"]["news_away"] = url_a
-        entry["news"]["away"] = scrape_news_content(url_a, news_source)
-
-        all_data[m["id"]] = entry
+        all_data[m["id"]] = scrape_match(m)
 
     with open(output_file, "w", encoding="utf-8") as f:
         json.dump(all_data, f, indent=4, ensure_ascii=False)
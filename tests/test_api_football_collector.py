@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test API-Football Collector
+
+Matchday fixture resolution against a fake HTTP client
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.api_football_collector import APIFootballCollector
+from scripts.Phase2.quota_scheduler import QuotaScheduler, API_FOOTBALL_PRIORITIES
+from scripts.Phase2.squad_cache import SquadCache
+
+
+def _fixture(fid, home, away):
+    return {"fixture": {"id": fid},
+            "teams": {"home": {"id": fid * 10, "name": home}, "away": {"id": fid * 10 + 1, "name": away}}}
+
+
+FIXTURES = {
+    "2025-11-25": [_fixture(1, "Internacional", "Santos"), _fixture(2, "Atletico-MG", "Flamengo")],
+    "2025-11-26": [_fixture(3, "São Paulo", "Grêmio")],
+}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload, headers=None):
+        self.payload = payload
+        self.headers = headers or {}
+
+    def json(self):
+        return self.payload
+
+
+class FixturesHTTP:
+    cassette = None
+
+    def __init__(self):
+        self.dates = []
+
+    def get(self, url, headers=None, params=None):
+        self.dates.append(params["date"])
+        return FakeResponse({"errors": [], "response": FIXTURES.get(params["date"], [])})
+
+
+def _collector(http, daily_limit=100):
+    collector = APIFootballCollector(api_key="test")
+    collector.http = http
+    collector.quota = QuotaScheduler("api_football", daily_limit, API_FOOTBALL_PRIORITIES, state_dir=None)
+    return collector
+
+
+def test_matchday_resolved_from_one_list_per_date():
+    collector = _collector(FixturesHTTP())
+    matches = [
+        {"home": "Internacional", "away": "Santos", "date": "25/11/2025"},
+        {"home": "Atletico Mineiro", "away": "Flamengo", "date": "25/11/2025"},
+        {"home": "Sao Paulo", "away": "Gremio", "date": "25/11/2025"},    # kicks off next day (UTC)
+        {"home": "Santos", "away": "Internacional", "date": "2025-11-25"},  # swapped
+        {"home": "Bahia", "away": "Vitoria", "date": "25/11/2025"},        # not in the window
+    ]
+
+    resolved = collector.resolve_fixtures(matches, league_id=71, season=2025)
+
+    assert [r["id"] if r else None for r in resolved] == [1, 2, 3, 1, None]
+    assert resolved[0] == {"id": 1, "home_id": 10, "away_id": 11}
+    # Requested date, next day and previous day: one call each for the whole round
+    assert sorted(collector.http.dates) == ["2025-11-24", "2025-11-25", "2025-11-26"]
+
+
+class MeteredHTTP:
+    """Reports the daily quota in the headers like API-Football does"""
+    cassette = None
+
+    def __init__(self, remaining):
+        self.remaining = remaining
+        self.endpoints = []
+
+    def get(self, url, headers=None, params=None):
+        self.endpoints.append(url.split("api-sports.io")[1])
+        self.remaining -= 1
+        return FakeResponse({"response": []}, {"x-ratelimit-requests-limit": "100",
+                                               "x-ratelimit-requests-remaining": str(self.remaining)})
+
+
+def test_low_quota_skips_low_value_calls_first():
+    http = MeteredHTTP(remaining=12)
+    collector = _collector(http)
+
+    details = collector.get_fixture_details(1)
+    # Predictions and injuries go first; lineups no longer fit the 15% reserve
+    assert http.endpoints == ["/predictions", "/injuries"]
+    assert set(details) == {"predictions", "injuries"}
+    assert collector.quota.budget_left() == 10
+
+    assert collector.get_team_stats(10, 71, 2025) == {}
+    assert collector.quota.stats()["skipped"] == {"/fixtures/lineups": 1, "/teams/statistics": 1}
+
+    # Fixture lookups keep running until the quota is gone
+    collector.resolve_fixtures([{"home": "A", "away": "B", "date": "2025-11-25"}])
+    assert http.endpoints[2] == "/fixtures"
+
+
+def _player(name, rating, minutes):
+    return {"player": {"name": name, "lastname": name.split()[-1]},
+            "statistics": [{"games": {"rating": rating, "minutes": minutes, "position": "Attacker"},
+                            "goals": {"total": 1, "assists": 0}}]}
+
+
+class SquadHTTP:
+    cassette = None
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, headers=None, params=None):
+        self.calls += 1
+        squad = [_player(f"Player {n}", str(6 + n / 10), 90 * n) for n in range(8)]
+        return FakeResponse({"response": squad})
+
+
+def test_key_players_served_from_squad_cache(tmp_path):
+    http = SquadHTTP()
+    collector = _collector(http)
+    collector.squad_cache = SquadCache(tmp_path)
+
+    top = collector.get_key_players(127, season=2025)
+    assert [p["name"] for p in top] == ["Player 7", "Player 6", "Player 5", "Player 4", "Player 3"]
+    assert collector.get_key_players(127, season=2025, top_n=2) == top[:2]
+    assert http.calls == 1
+
+    # Next run: from disk; a forced refresh downloads again
+    collector.squad_cache = SquadCache(tmp_path)
+    assert collector.get_key_players(127, season=2025) == top
+    assert http.calls == 1
+    assert collector.refresh_squads([127], season=2025) == {127: 8}
+    assert http.calls == 2
+
+
+class ErrorHTTP:
+    """HTTP 200 with an errors payload, as API-Football answers rate-limit/auth/plan errors"""
+    cassette = None
+
+    def get(self, url, headers=None, params=None):
+        return FakeResponse({"errors": {"requests": "You have reached the request limit for the day"},
+                             "response": []})
+
+
+def test_squad_errors_payload_keeps_cached_squad(tmp_path):
+    collector = _collector(SquadHTTP())
+    collector.squad_cache = SquadCache(tmp_path)
+    top = collector.get_key_players(127, season=2025)
+
+    collector.http = ErrorHTTP()
+    assert collector.get_key_players(127, season=2025, refresh=True) == top
+    assert collector.squad_cache.get(127, 2025)[:5] == top
+
+    # Nothing cached yet: no players, and no empty squad stored for the week
+    assert collector.get_key_players(128, season=2025) == []
+    assert collector.squad_cache.get_entry(128, 2025) is None
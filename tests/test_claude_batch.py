@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test Message Batches mode
+
+Runs run_message_batch against a local stub of the Anthropic batches endpoints
+"""
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from anthropic import Anthropic
+from scripts.Phase2.claude_batch import run_message_batch
+
+
+class StubBatchServer(BaseHTTPRequestHandler):
+    """Accepts one batch, reports it in progress once, then serves JSONL results"""
+    state = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _batch(self, status: str) -> dict:
+        host = f"http://{self.server.server_address[0]}:{self.server.server_address[1]}"
+        return {
+            "id": "msgbatch_stub",
+            "type": "message_batch",
+            "processing_status": status,
+            "request_counts": {"processing": 0 if status == "ended" else 2, "succeeded": 0,
+                               "errored": 0, "canceled": 0, "expired": 0},
+            "created_at": "2025-11-22T10:00:00Z",
+            "expires_at": "2025-11-23T10:00:00Z",
+            "ended_at": None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{host}/v1/messages/batches/msgbatch_stub/results" if status == "ended" else None
+        }
+
+    def _send(self, body: str, content_type: str = "application/json"):
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self.state["requests"] = json.loads(self.rfile.read(length))["requests"]
+        self.state["polls"] = 0
+        self._send(json.dumps(self._batch("in_progress")))
+
+    def do_GET(self):
+        if self.path.endswith("/results"):
+            lines = []
+            for req in self.state["requests"]:
+                if req["custom_id"] == "bad":
+                    result = {"type": "errored", "error": {"type": "error",
+                              "error": {"type": "invalid_request_error", "message": "bad request"}}}
+                else:
+                    result = {"type": "succeeded", "message": {
+                        "id": "msg_stub", "type": "message", "role": "assistant", "model": req["params"]["model"],
+                        "content": [{"type": "text", "text": f"echo:{req['params']['messages'][0]['content']}"}],
+                        "stop_reason": "end_turn", "stop_sequence": None,
+                        "usage": {"input_tokens": 10, "output_tokens": 5,
+                                  "cache_read_input_tokens": 100, "cache_creation_input_tokens": 0}
+                    }}
+                lines.append(json.dumps({"custom_id": req["custom_id"], "result": result}))
+            self._send("\n".join(lines), "application/binary")
+            return
+
+        self.state["polls"] += 1
+        self._send(json.dumps(self._batch("ended" if self.state["polls"] > 1 else "in_progress")))
+
+
+def test_batch_against_stub_server():
+    """Submits, polls until ended, maps results back by custom_id"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBatchServer)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        client = Anthropic(api_key="test", base_url=f"http://127.0.0.1:{server.server_address[1]}")
+        requests = [
+            {"custom_id": custom_id, "params": {
+                "model": "claude-sonnet-4-20250514", "max_tokens": 100,
+                "messages": [{"role": "user", "content": custom_id}]
+            }}
+            for custom_id in ["req-0", "req-1", "bad"]
+        ]
+
+        polls = []
+        results = run_message_batch(client, requests, poll_seconds=0, on_poll=polls.append)
+
+        assert len(polls) == 2
+        assert results["req-0"]["message"].content[0].text == "echo:req-0"
+        assert results["req-1"]["message"].usage.cache_read_input_tokens == 100
+        assert "error" in results["bad"]
+        print("✅ Batch stub: 2 succeeded, 1 errored")
+    finally:
+        server.shutdown()
+
+
+def test_empty_batch_is_not_submitted():
+    """No requests -> no API call at all"""
+    assert run_message_batch(client=None, requests=[]) == {}
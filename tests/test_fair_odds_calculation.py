@@ -3,27 +3,22 @@
 Test Fair Odds Calculation
 
 Validates that the CORRECT Yudor Fair Odds formula is working properly
+(the shared kernel used by the orchestrator, Phase2 and the recalculation scripts)
 """
 import sys
 from pathlib import Path
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+import numpy as np
 
-def calculate_odds_at_line(pr_casa_pct: float, pr_vis_pct: float, ah_line: float) -> float:
-    """CORRECT formula (from fix_yudor_fair_odds_final.py)"""
-    fav_prob_pct = max(pr_casa_pct, pr_vis_pct)
-    odd_ml = 100 / fav_prob_pct
-    steps = (ah_line + 0.5) / 0.25
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.yudor_fair_odds import fair_odds_at_line, optimal_line, solve_optimal_line
 
-    if steps > 0:
-        odds = odd_ml * (0.85 ** steps)
-    elif steps < 0:
-        odds = odd_ml * (1.15 ** abs(steps))
-    else:
-        odds = odd_ml
 
-    return round(odds, 2)
+def calculate_odds_at_line(pr_casa_pct: float, pr_vis_pct: float, ah_line: float) -> float:
+    """Same call as YudorOrchestrator.calculate_fair_odds_at_line"""
+    return round(float(fair_odds_at_line(max(pr_casa_pct, pr_vis_pct), ah_line)), 2)
 
 
 def test_balanced_match():
@@ -85,6 +80,51 @@ def test_weak_favorite():
     print(f"✅ test_weak_favorite: {result}")
 
 
+def test_optimal_line():
+    """Line closest to 2.0 (Real Betis: 54% → 1.85 × 1.15 at AH -0.75)"""
+    line, odds = optimal_line(54.0)
+    assert line == -0.75
+    assert round(float(odds), 2) == 2.13
+
+    # Underdog-priced favorite moves to easier (positive) lines
+    line, odds = optimal_line(30.0)
+    assert line == 0.25
+    assert round(float(odds), 2) == 2.05
+
+    # Clamped to the searched range (default -3.0 .. +3.0)
+    assert optimal_line(95.0)[0] == -1.75
+    assert optimal_line(95.0, min_line=-1.0)[0] == -1.0
+    assert optimal_line(1.0)[0] == 3.0
+    print(f"✅ test_optimal_line")
+
+
+def test_optimal_line_matches_ladder_scan():
+    """Closed-form search = brute-force scan of every line, over an array"""
+    fav_pcts = np.linspace(10.0, 95.0, 2001)
+    lines = np.arange(-3.0, 3.25, 0.25)
+    ladder = fair_odds_at_line(fav_pcts[:, None], lines[None, :])
+    best = np.argmin(np.abs(ladder - 2.0), axis=1)
+
+    opt_lines, opt_odds = optimal_line(fav_pcts)
+    assert np.array_equal(opt_lines, lines[best])
+    assert np.array_equal(opt_odds, ladder[np.arange(len(best)), best])
+    print(f"✅ test_optimal_line_matches_ladder_scan")
+
+
+def test_optimal_line_neighbours():
+    """Solver also returns the lines one step either side, NaN past the range"""
+    solution = solve_optimal_line(54.0)
+    assert (solution['easier_line'], solution['line'], solution['harder_line']) == (-0.5, -0.75, -1.0)
+    assert solution['easier_odds'] < solution['odds'] < solution['harder_odds']
+    assert np.isclose(solution['harder_odds'], fair_odds_at_line(54.0, -1.0))
+
+    edge = solve_optimal_line(np.array([54.0, 1.0]))
+    assert edge['line'][1] == 3.0
+    assert np.isnan(edge['easier_line'][1]) and np.isnan(edge['easier_odds'][1])
+    assert edge['harder_line'][1] == 2.75
+    print(f"✅ test_optimal_line_neighbours")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("TESTING FAIR ODDS CALCULATION")
@@ -95,6 +135,9 @@ if __name__ == "__main__":
         test_strong_favorite()
         test_even_match()
         test_weak_favorite()
+        test_optimal_line()
+        test_optimal_line_matches_ladder_scan()
+        test_optimal_line_neighbours()
 
         print("\n" + "=" * 60)
         print("✅ ALL TESTS PASSED")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test FootyStats Cache
+
+Good payloads are fetched once; error payloads are returned but fetched again
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.footystats_cache import FootyStatsCache
+
+
+def _fetcher(payload):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return payload
+
+    return fetch, calls
+
+
+def test_good_payload_cached_once(tmp_path):
+    cache = FootyStatsCache(tmp_path)
+    fetch, calls = _fetcher({"success": True, "data": [{"id": 1}]})
+    for _ in range(3):
+        assert cache.get_or_fetch("league-teams", {"season_id": 14231, "key": "secret"}, fetch)["data"] == [{"id": 1}]
+    assert len(calls) == 1
+
+    # Served from disk by a new cache, without the API key in the file
+    again = FootyStatsCache(tmp_path)
+    assert again.get("league-teams", {"season_id": 14231})["data"] == [{"id": 1}]
+    assert "secret" not in "".join(p.read_text() for p in tmp_path.glob("*.json"))
+
+
+def test_error_payloads_not_cached(tmp_path):
+    cache = FootyStatsCache(tmp_path)
+    for payload in ({"error": "HTTP 429", "status_code": 429},
+                    {"success": False, "message": "Invalid season"}):
+        fetch, calls = _fetcher(payload)
+        for _ in range(2):
+            assert cache.get_or_fetch("league-matches", {"season_id": 1}, fetch) == payload
+        assert len(calls) == 2
+        assert cache.get("league-matches", {"season_id": 1}) is None
+    assert list(tmp_path.glob("*.json")) == []
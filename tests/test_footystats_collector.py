@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test FootyStats Collector Caching
+
+Season id / league teams / league matches are fetched once per season and
+teams are looked up through a normalized-name index
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.footystats_collector import FootyStatsCollector, normalize_team_name
+
+PAYLOADS = {
+    "league-list": {"success": True, "data": [
+        {"name": "Brazil Serie A", "season": [{"year": 2024, "id": 11321}, {"year": 2025, "id": 14231}]}
+    ]},
+    "league-teams": {"success": True, "data": [
+        {"id": 1, "name": "São Paulo", "stats": {"xg_for_avg_overall": 1.4}},
+        {"id": 2, "name": "Atlético Mineiro", "stats": {"xg_for_avg_overall": 1.2}},
+    ]},
+    "league-matches": {"success": True, "data": [
+        {"id": 901, "home_name": "São Paulo", "away_name": "Atlético Mineiro"},
+    ]},
+}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class CountingHTTP:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        endpoint = url.split("/")[-1].split("?")[0]
+        self.calls.append(endpoint)
+        return FakeResponse(PAYLOADS[endpoint])
+
+
+def _collector(cache_dir):
+    collector = FootyStatsCollector(api_key="test", cache_dir=cache_dir)
+    collector.http = CountingHTTP()
+    return collector
+
+
+def test_season_lookups_fetched_once(tmp_path):
+    collector = _collector(tmp_path)
+    for _ in range(3):
+        season_id = collector.get_season_id("Brasileirão", 2025)
+        assert season_id == 14231
+        assert collector.find_team_stats(season_id, "Sao Paulo")["id"] == 1
+        assert collector.find_team_stats(season_id, "Atletico")["id"] == 2
+        assert collector.find_match(season_id, "Sao Paulo", "Atlético Mineiro")["id"] == 901
+    assert sorted(collector.http.calls) == ["league-list", "league-matches", "league-teams"]
+
+    # A new collector (next run) is served from disk
+    again = _collector(tmp_path)
+    assert again.get_season_id("Brasileirão", 2025) == 14231
+    assert again.get_team_stats(14231)["São Paulo"]["xg_for"] == 1.4
+    assert again.http.calls == []
+
+
+def test_unknown_team_and_normalization(tmp_path):
+    collector = _collector(tmp_path)
+    assert collector.find_team_stats(14231, "Flamengo") is None
+    assert collector.find_team_stats(14231, "") is None
+    assert normalize_team_name("  Grêmio  FBPA ") == "gremio fbpa"
+
+
+def test_concurrent_fallback_lookups(tmp_path):
+    collector = _collector(tmp_path)
+    season_id = collector.get_season_id("Brasileirão", 2025)
+    collector.find_team_stats(season_id, "São Paulo")
+    published = dict(collector._team_index[season_id])
+
+    # Substring-only names, resolved from many threads at once
+    names = {"Atletico": 2, "Atletico Mineiro MG": 2, "Sao Paulo FC": 1, "Paulo": 1}
+    barrier = threading.Barrier(len(names) * 4)
+    errors = []
+
+    def resolve(name, expected):
+        barrier.wait()
+        try:
+            for _ in range(200):
+                assert collector.find_team_stats(season_id, name)["id"] == expected
+        except Exception as e:  # pragma: no cover - surfaced below
+            errors.append(e)
+
+    threads = [threading.Thread(target=resolve, args=item) for item in list(names.items()) * 4]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    # Fallback hits go to the alias map; the published index is never written to
+    assert collector._team_index[season_id] == published
+    assert set(collector._team_aliases[season_id]) == {normalize_team_name(n) for n in names}
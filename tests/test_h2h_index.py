@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test Head-to-Head Index
+
+Pair lookups, home-perspective summaries, persistence and Q17 scoring
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.analysis.h2h_index import H2HIndex
+from scripts.Phase2.q_scorers import Q17_H2HDominance as Phase2Q17
+from scripts.analysis_engine.q_scorers import Q17_H2HDominance as EngineQ17
+
+GAMES = pd.DataFrame([
+    {"date": pd.Timestamp("2024-03-01"), "home_team": "Everton", "away_team": "Man United", "FTHG": 0, "FTAG": 2},
+    {"date": pd.Timestamp("2023-09-01"), "home_team": "Man United", "away_team": "Everton", "FTHG": 3, "FTAG": 1},
+    {"date": pd.Timestamp("2024-10-01"), "home_team": "Man United", "away_team": "Everton", "FTHG": 1, "FTAG": 1},
+    {"date": pd.Timestamp("2025-01-01"), "home_team": "Everton", "away_team": "Man United", "FTHG": None, "FTAG": None},
+    {"date": pd.Timestamp("2024-01-01"), "home_team": "Chelsea", "away_team": "Everton", "FTHG": 2, "FTAG": 0},
+])
+
+
+def test_pair_lookup_is_order_independent():
+    index = H2HIndex.build(GAMES)
+
+    record = index.lookup("Everton", "Man United")
+    assert record is index.lookup("Man United", "Everton")
+    assert record["total_matches"] == 4
+    assert record["wins"] == {"Everton": 0, "Man United": 2}
+    assert record["draws"] == 1
+    assert record["goals"] == {"Everton": 2, "Man United": 6}
+    # Sorted by date, unscored meeting left out
+    assert [m["date"][:10] for m in record["matches"]] == ["2023-09-01", "2024-03-01", "2024-10-01"]
+    assert index.lookup("Chelsea", "Man United") is None
+
+
+def test_head_to_head_from_home_perspective(tmp_path):
+    index = H2HIndex.build(GAMES)
+    h2h = index.head_to_head("Everton", "Man United")
+
+    assert (h2h["home_wins"], h2h["draws"], h2h["away_wins"]) == (0, 1, 2)
+    assert (h2h["home_goals"], h2h["away_goals"]) == (2, 6)
+    assert h2h["last_5_results"] == ["L", "L", "D"]
+    assert h2h["recent_meetings"][0]["score"] == "3-1"
+
+    index.save(tmp_path / "h2h.json")
+    loaded = H2HIndex.load(tmp_path / "h2h.json")
+    assert loaded.head_to_head("Everton", "Man United") == h2h
+    assert H2HIndex.load(tmp_path / "h2h.json", max_age_seconds=-1) is None
+
+
+def test_q17_scores_index_records():
+    record = H2HIndex.build(GAMES).lookup("Man United", "Everton")
+
+    assert Phase2Q17.calculate(record, "Man United") == 7   # 2/3 wins
+    assert Phase2Q17.calculate(record, "Everton") == 3
+    assert EngineQ17.calculate(record, "Man United", "Everton") == 7
+    # Same score as the per-match loop over the same meetings
+    assert EngineQ17.calculate({"matches": record["matches"]}, "Man United", "Everton") == 7
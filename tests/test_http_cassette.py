@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test HTTP Cassette
+
+Records responses from a local server, then replays them with the server gone
+"""
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.http_client import HTTPClient
+from scripts.Phase2.http_cassette import CassetteMiss, HTTPCassette
+
+
+class EchoServer(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path.split("?")[0], "data": ["Flamengo", "Palmeiras"]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("x-ratelimit-requests-remaining", "99")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_record_then_replay_offline(tmp_path):
+    """Replay serves the recorded body/headers without any server"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/league-tables"
+
+    recorder = HTTPClient(host_rate_limits={})
+    recorder.use_cassette(tmp_path, mode="record")
+    live = recorder.get(url, params={"season_id": 14231, "key": "secret"})
+    server.shutdown()
+    server.server_close()
+
+    assert recorder.cassette.stats()["recorded"] == 1
+    assert "secret" not in next(tmp_path.rglob("*.json")).read_text()
+
+    player = HTTPClient(host_rate_limits={})
+    player.use_cassette(tmp_path, mode="replay")
+    # Same request with another key and param order -> same recording
+    replayed = player.get(f"{url}?key=other", params={"season_id": "14231"})
+
+    assert replayed.status_code == 200
+    assert replayed.json() == live.json()
+    assert replayed.headers["x-ratelimit-requests-remaining"] == "99"
+
+    with pytest.raises(CassetteMiss):
+        player.get(url, params={"season_id": 99999})
+
+
+def test_normalized_key_ignores_credentials_and_order():
+    a = HTTPCassette.normalize_request("get", "https://API.example.com/x?b=2&key=1", params={"a": 1})
+    b = HTTPCassette.normalize_request("GET", "https://api.example.com/x", params={"a": "1", "b": "2", "api_key": "z"})
+    assert a == b
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test Shared HTTP Client
+
+Retries, rate limiting and per-host sessions against a local stub server
+"""
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.http_client import HTTPClient
+
+
+class FlakyServer(BaseHTTPRequestHandler):
+    """Answers 503 for the first `failures` hits of /flaky (429 with an hour-long
+    Retry-After for /throttled), 200 otherwise"""
+    protocol_version = "HTTP/1.1"
+    hits = {"flaky": 0, "throttled": 0}
+    failures = 2
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        status = 200
+        headers = {}
+        if self.path == "/flaky":
+            self.hits["flaky"] += 1
+            if self.hits["flaky"] <= self.failures:
+                status = 503
+        elif self.path == "/throttled":
+            self.hits["throttled"] += 1
+            if self.hits["throttled"] == 1:
+                status = 429
+                headers["Retry-After"] = "3600"
+        body = b"ok" if status == 200 else b"busy"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_retries_5xx_then_succeeds():
+    """Two 503s are retried transparently"""
+    server, base = _serve()
+    try:
+        FlakyServer.hits["flaky"] = 0
+        client = HTTPClient(max_retries=3, backoff_factor=0, host_rate_limits={})
+        response = client.get(f"{base}/flaky")
+        assert response.status_code == 200
+        assert FlakyServer.hits["flaky"] == 3
+    finally:
+        server.shutdown()
+
+
+def test_gives_up_and_returns_last_response():
+    """After the retries run out the caller still gets a response to inspect"""
+    server, base = _serve()
+    try:
+        FlakyServer.hits["flaky"] = 0
+        client = HTTPClient(max_retries=1, backoff_factor=0, host_rate_limits={})
+        response = client.get(f"{base}/flaky")
+        assert response.status_code == 503
+    finally:
+        server.shutdown()
+
+
+def test_per_host_rate_limit_and_session_reuse():
+    """Requests to a throttled host are spaced out and share one session"""
+    server, base = _serve()
+    try:
+        client = HTTPClient(backoff_factor=0, host_rate_limits={"127.0.0.1": 20.0})
+        started = time.monotonic()
+        for _ in range(5):
+            assert client.get(f"{base}/ok").status_code == 200
+        assert time.monotonic() - started >= 4 / 20.0 - 0.01
+        assert list(client._sessions) == ["127.0.0.1"]
+    finally:
+        server.shutdown()
+
+
+def test_retry_after_is_capped():
+    """An hour-long Retry-After is clamped to max_retry_after"""
+    server, base = _serve()
+    try:
+        FlakyServer.hits["throttled"] = 0
+        client = HTTPClient(max_retries=2, backoff_factor=0, host_rate_limits={}, max_retry_after=0.2)
+        started = time.monotonic()
+        response = client.get(f"{base}/throttled")
+        elapsed = time.monotonic() - started
+        assert response.status_code == 200
+        assert FlakyServer.hits["throttled"] == 2
+        assert 0.2 - 0.01 <= elapsed < 5
+    finally:
+        server.shutdown()
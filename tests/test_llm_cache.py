@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test Claude response cache
+
+Only finished, parseable responses are stored; unusable ones are asked again
+"""
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.llm_cache import LLMResponseCache
+from scripts.production.master_orchestrator import YudorOrchestrator
+
+
+class FakeMessages:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        text, stop_reason = self.replies.pop(0)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)], stop_reason=stop_reason, usage=None)
+
+
+def _orchestrator(tmp_path, replies):
+    orchestrator = object.__new__(YudorOrchestrator)
+    orchestrator.config = SimpleNamespace(CLAUDE_MODEL="claude-test", MAX_TOKENS=1000)
+    orchestrator.claude = SimpleNamespace(messages=FakeMessages(replies))
+    orchestrator.llm_cache = LLMResponseCache(tmp_path)
+    orchestrator.provider_slots = {"anthropic": threading.BoundedSemaphore(1)}
+    orchestrator.claude_usage_log, orchestrator._usage_lock = [], threading.Lock()
+    return orchestrator
+
+
+def test_truncated_and_non_json_responses_are_not_cached(tmp_path):
+    orchestrator = _orchestrator(tmp_path, [
+        ('{"decision": "CO', "max_tokens"),
+        ("Sorry, I can't produce JSON for this match.", "end_turn"),
+        ('```json\n{"decision": "CORE"}\n```', "end_turn"),
+    ])
+    messages = orchestrator.claude.messages
+
+    assert orchestrator.call_claude("system", "match") == '{"decision": "CO'
+    assert orchestrator.call_claude("system", "match").startswith("Sorry")
+    good = orchestrator.call_claude("system", "match")
+    assert messages.calls == 3
+
+    # Only the complete JSON answer is replayed
+    assert orchestrator.call_claude("system", "match") == good
+    assert messages.calls == 3
+
+
+def test_unparseable_cached_entry_is_evicted(tmp_path):
+    orchestrator = _orchestrator(tmp_path, [('{"decision": "VETO"}', "end_turn")])
+    # Written by an older version that cached every answer
+    orchestrator.llm_cache.set("claude-test", "system", "match", 1000, '{"decision": ')
+
+    assert orchestrator.call_claude("system", "match") == '{"decision": "VETO"}'
+    assert orchestrator.claude.messages.calls == 1
+    assert orchestrator.llm_cache.get("claude-test", "system", "match", 1000) == '{"decision": "VETO"}'
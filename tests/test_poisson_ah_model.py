@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test Poisson AH Model
+
+Vectorized Dixon-Coles score matrix and AH / totals ladder against per-cell references
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.poisson_ah_model import PoissonAHModel
+
+
+def _loop_matrix(model, home_xg, away_xg, max_goals=10):
+    matrix = np.zeros((max_goals, max_goals))
+    for i in range(max_goals):
+        for j in range(max_goals):
+            matrix[i][j] = model._dixon_coles_adjustment(i, j, home_xg, away_xg)
+    return matrix / np.sum(matrix)
+
+
+def test_matrix_exact_against_cell_loop():
+    model = PoissonAHModel()
+    for home_xg, away_xg in [(1.62, 0.94), (0.3, 2.8), (1.0, 1.0)]:
+        assert np.array_equal(model.score_matrix(home_xg, away_xg), _loop_matrix(model, home_xg, away_xg))
+
+
+def test_slate_in_one_call():
+    model = PoissonAHModel()
+    home = np.array([1.8, 1.1, 0.7])
+    away = np.array([0.9, 1.1, 2.0])
+    slate = model.analyze_slate(home, away)
+
+    assert slate["matrices"].shape == (3, 10, 10)
+    for k in range(3):
+        assert np.array_equal(slate["matrices"][k], model.score_matrix(home[k], away[k]))
+    total = slate["probabilities"]["home"] + slate["probabilities"]["draw"] + slate["probabilities"]["away"]
+    assert np.allclose(total, 1.0)
+    assert slate["probabilities"]["home"][0] > slate["probabilities"]["away"][0]
+
+    # Scenario grid broadcasts too
+    grid = model.score_matrix(np.linspace(0.5, 2.5, 5)[:, None], np.linspace(0.5, 2.5, 4)[None, :])
+    assert grid.shape == (5, 4, 10, 10)
+
+
+def test_goal_cap():
+    model = PoissonAHModel(max_goals=15)
+    matrix = model.score_matrix(3.5, 3.0)
+    assert matrix.shape == (15, 15)
+    assert np.array_equal(matrix, _loop_matrix(model, 3.5, 3.0, max_goals=15))
+    assert model.score_matrix(3.5, 3.0, max_goals=6).shape == (6, 6)
+
+
+def _settle_home(matrix, line):
+    """Reference AH settlement cell by cell: expected profit per unit at even stakes"""
+    halves = [line - 0.25, line + 0.25] if abs(line * 4) % 2 == 1 else [line, line]
+    won = lost = 0.0
+    for i in range(matrix.shape[0]):
+        for j in range(matrix.shape[1]):
+            for half in halves:
+                margin = i - j + half
+                if margin > 0:
+                    won += matrix[i][j] / 2
+                elif margin < 0:
+                    lost += matrix[i][j] / 2
+    return won, lost
+
+
+def test_ah_ladder_against_cell_settlement():
+    model = PoissonAHModel()
+    matrix = model.score_matrix(1.8, 0.9)
+    ah = model.price_asian_handicap(matrix)
+
+    assert ah["lines"][0] == -3.5 and ah["lines"][-1] == 3.5 and len(ah["lines"]) == 29
+    for k, line in enumerate(ah["lines"]):
+        home = {name: ah["home"][name][k] for name in ("win", "half_win", "push", "half_loss", "loss")}
+        assert np.isclose(sum(home.values()), 1.0)
+        won, lost = _settle_home(matrix, line)
+        assert np.isclose(home["win"] + home["half_win"] / 2, won)
+        assert np.isclose(home["loss"] + home["half_loss"] / 2, lost)
+        if line % 1 == 0.5:
+            assert home["push"] == 0 and home["half_win"] == 0 and home["half_loss"] == 0
+        # Away is the same bet from the other side
+        assert np.isclose(ah["away"]["win"][k], home["loss"])
+
+    # Home favourite: fair line is negative and its odds are near evens on both sides
+    k = list(ah["lines"]).index(ah["fair_line"])
+    assert ah["fair_line"] < 0
+    assert 1.8 < ah["home"]["fair_odds"][k] < 2.2
+    assert 1.8 < ah["away"]["fair_odds"][k] < 2.2
+
+
+def test_totals_and_slate_ladder():
+    model = PoissonAHModel()
+    matrix = model.score_matrix(1.4, 1.1)
+    i, j = np.indices(matrix.shape)
+    totals = model.price_totals(matrix)
+    lines = list(totals["lines"])
+
+    assert np.isclose(totals["over"]["win"][lines.index(2.5)], matrix[i + j > 2.5].sum())
+    assert np.isclose(totals["over"]["push"][lines.index(2.0)], matrix[i + j == 2].sum())
+    assert np.isclose(totals["under"]["win"][lines.index(2.5)], matrix[i + j < 2.5].sum())
+
+    # Stack of matches prices in one pass
+    stack = model.score_matrix(np.array([1.8, 1.0, 0.6]), np.array([0.9, 1.0, 1.9]))
+    fair = model.price_asian_handicap(stack)["fair_line"]
+    assert fair.shape == (3,)
+    assert fair[0] < 0 < fair[2]
+    assert fair[1] == model.price_asian_handicap(stack[1])["fair_line"]
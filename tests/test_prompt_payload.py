@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test Prompt Payload Builder
+
+Validates compact serialization, news dedupe and priority-ordered token budgets
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.prompt_payload import PromptPayloadBuilder, compact_json, dedupe_news
+
+
+def test_compact_json_drops_empty_fields():
+    """None / "" / [] / {} are dropped, 0 and NOT_FOUND are kept"""
+    data = {"xg": 1.45, "goals": 0, "notes": None, "injuries": [], "urls": {"sportsmole": "NOT_FOUND", "bbc": ""}}
+    assert compact_json(data) == '{"xg":1.45,"goals":0,"urls":{"sportsmole":"NOT_FOUND"}}'
+
+
+def test_dedupe_news_across_home_and_away():
+    """A derby headline listed on both team pages is kept once"""
+    news = {
+        "home": [{"title": "Derby preview: Flamengo vs Fluminense", "url": "https://ge.globo.com/a"}],
+        "away": [{"title": "derby preview:  flamengo vs fluminense", "url": "https://ge.globo.com/b"},
+                 {"title": "Fluminense injury update", "url": "https://ge.globo.com/c"}],
+    }
+    deduped = dedupe_news(news)
+    assert len(deduped["home"]) == 1
+    assert [item["url"] for item in deduped["away"]] == ["https://ge.globo.com/c"]
+
+
+def test_budget_cuts_low_priority_sections_first():
+    """FootyStats survives intact, news is truncated/dropped when over budget"""
+    builder = PromptPayloadBuilder(total_budget=300)
+    builder.add_section("News", "headline text " * 500, priority=4, budget=1000)
+    builder.add_section("FootyStats", {"home_xg_avg": 1.8, "away_xg_avg": 0.9}, priority=0, budget=1000)
+    builder.add_section("SportsMole", "preview " * 400, priority=1, budget=250)
+
+    text, report = builder.build()
+
+    assert text.index("FootyStats") < text.index("SportsMole") < text.index("News")
+    assert '{"home_xg_avg":1.8,"away_xg_avg":0.9}' in text
+    assert "SportsMole" in report["truncated"]
+    assert "News" in report["truncated"] or "News" in report["dropped"]
+    assert report["estimated_tokens"] <= 320
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test Slate Pricer
+
+Whole-slate fair odds against the per-match, per-line implementations
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.Phase2.poisson_ah_model import PoissonAHModel
+from scripts.Phase2.slate_pricer import SlatePricer, price_slate
+
+
+def _yudor_loop(home_pct, away_pct):
+    """Per-line loop of AsianHandicapModel.calculate_yudor_fair_odds"""
+    fav_prob = max(home_pct, away_pct)
+    moneyline = 100 / fav_prob
+    best_line, best_odds, min_diff, all_odds = None, None, float('inf'), []
+    for line in np.arange(-3.0, 3.25, 0.25):
+        step_diff = (-0.5 - line) / 0.25
+        odds = moneyline * (1.15 ** step_diff) if step_diff > 0 else moneyline * (0.85 ** abs(step_diff))
+        all_odds.append(odds)
+        if abs(odds - 2.0) < min_diff:
+            min_diff, best_line, best_odds = abs(odds - 2.0), line, odds
+    return all_odds, best_line, best_odds
+
+
+def test_yudor_slate_matches_loop():
+    home = [54.0, 36.2, 20.0, 33.0, 71.5]
+    away = [21.0, 33.5, 60.8, 33.0, 9.0]
+    slate = price_slate("yudor", home, away)
+
+    assert slate["fair_odds"].shape == (5, 25)
+    assert list(slate["favorite"]) == ["home", "home", "away", "away", "home"]
+    for k in range(5):
+        odds, best_line, best_odds = _yudor_loop(home[k], away[k])
+        assert np.allclose(slate["fair_odds"][k], odds)
+        assert slate["optimal_line"][k] == best_line
+        assert np.isclose(slate["optimal_odds"][k], best_odds)
+
+    # Real Betis example: 54% favorite -> AH -0.75 at 1.85 x 1.15
+    assert slate["optimal_line"][0] == -0.75
+    assert round(slate["optimal_odds"][0], 2) == 2.13
+
+
+def test_poisson_slate_matches_single_match_ladder():
+    model = PoissonAHModel()
+    pricer = SlatePricer(poisson_model=model)
+    home_xg = np.array([1.8, 0.6, 1.2])
+    away_xg = np.array([0.9, 1.9, 1.1])
+    slate = pricer.price("poisson", home_xg, away_xg)
+
+    assert slate["fair_odds"].shape == (3, 25)
+    assert list(slate["favorite"]) == ["home", "away", "home"]
+
+    # Away favorite: its line L is the home line -L of the single-match ladder
+    single = model.price_asian_handicap(model.score_matrix(0.6, 1.9), -pricer.lines)
+    assert np.allclose(slate["fair_odds"][1], single["away"]["fair_odds"])
+
+    # Favorites give goals at their optimal line, priced near evens
+    assert slate["optimal_line"][0] < 0 and slate["optimal_line"][1] < 0
+    assert np.all(np.abs(slate["optimal_odds"] - 2.0) < 0.3)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        price_slate("elo", [50.0], [30.0])
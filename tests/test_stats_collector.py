@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test League-wide Stats Aggregation
+
+xG and form tables for every team from one pass over the match table
+"""
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+stats_collector = pytest.importorskip("scripts.Phase2.stats_collector")
+ComprehensiveStatsScraper = stats_collector.ComprehensiveStatsScraper
+
+MATCHES = pd.DataFrame([
+    {"home_team": "Barcelona", "away_team": "Girona", "home_xg": 2.0, "away_xg": 0.5, "home_score": 3, "away_score": 1},
+    {"home_team": "Girona", "away_team": "Sevilla", "home_xg": 1.0, "away_xg": 1.5, "home_score": 0, "away_score": 0},
+    {"home_team": "Sevilla", "away_team": "Barcelona", "home_xg": 0.8, "away_xg": 1.2, "home_score": 2, "away_score": 1},
+    {"home_team": "Barcelona", "away_team": "Sevilla", "home_xg": 1.6, "away_xg": 0.4, "home_score": None, "away_score": None},
+])
+
+
+def test_xg_table_splits_home_and_away():
+    table = ComprehensiveStatsScraper.aggregate_team_xg(MATCHES)
+
+    barca = table.loc["Barcelona"]
+    assert barca["matches"] == 3
+    assert barca["xG_total"] == pytest.approx(2.0 + 1.2 + 1.6)
+    assert barca["xGA_total"] == pytest.approx(0.5 + 0.8 + 0.4)
+    assert barca["xG_avg"] == pytest.approx(4.8 / 3)
+    assert table.loc["Girona", "xGA_total"] == pytest.approx(3.5)
+
+
+def test_form_table_last_n_in_match_order():
+    form = ComprehensiveStatsScraper.aggregate_team_form(MATCHES, last_n=2)["form"]
+
+    # Unplayed match counts as D, like the per-team loop it replaced
+    assert form.to_dict() == {"Barcelona": "LD", "Girona": "LD", "Sevilla": "WD"}
+    assert ComprehensiveStatsScraper.aggregate_team_form(MATCHES)["form"]["Barcelona"] == "WLD"
+
+
+def test_failed_table_read_is_retried():
+    scraper = object.__new__(ComprehensiveStatsScraper)
+    # Only the table cache state of __init__ (no soccerdata readers needed)
+    scraper._tables, scraper._tables_lock, scraper._table_key_locks = {}, threading.Lock(), {}
+    calls = []
+
+    def flaky_reader():
+        calls.append(1)
+        if len(calls) == 1:
+            raise TimeoutError("understat timed out")
+        return MATCHES
+
+    with pytest.raises(TimeoutError):
+        scraper._load_table('understat', 'team_match', flaky_reader, ComprehensiveStatsScraper.MATCH_TABLE)
+    assert ('understat', 'team_match') not in scraper._tables
+
+    # Next caller retries; once loaded the table is served from memory
+    table = scraper._load_table('understat', 'team_match', flaky_reader, ComprehensiveStatsScraper.MATCH_TABLE)
+    assert table['rows']['Girona'] == [0, 1]
+    scraper._load_table('understat', 'team_match', flaky_reader, ComprehensiveStatsScraper.MATCH_TABLE)
+    assert len(calls) == 2
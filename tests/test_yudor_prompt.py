@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test Yudor v5.3 prompt
+
+The Layer 1 pricing spec (a cached system block sent with every match) must keep
+its nesting and agree with the v5.3 system prompt and the Yudor kernel; the user
+message carries only the match's own data
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.production.master_orchestrator import YUDOR_ANALYSIS_INSTRUCTIONS, YudorOrchestrator
+
+LAYER_1 = """LAYER 1: BLIND PRICING (CORRECT YUDOR METHODOLOGY)
+- Sum Raw_Casa from all home Q-scores
+- Sum Raw_Vis from all away Q-scores
+- Get P(Empate) from consolidated data (derived from odds, NOT modified)
+
+STEP 1: Normalize if sum > 100
+  * Soma = Raw_Casa + Raw_Vis + P(Empate)
+  * IF Soma > 100:
+    - Surplus = (Soma - 100) / 2
+    - Adjusted_Casa = Raw_Casa - Surplus
+    - Adjusted_Vis = Raw_Vis - Surplus
+    - P(Empate) STAYS UNCHANGED
+  * ELSE:
+    - Adjusted_Casa = Raw_Casa
+    - Adjusted_Vis = Raw_Vis
+
+STEP 2: Identify favorite and calculate Moneyline odds
+  * Favorite_Pct = max(Adjusted_Casa, Adjusted_Vis)
+  * Underdog_Pct = min(Adjusted_Casa, Adjusted_Vis)
+  * Odd_ML = 100 / Favorite_Pct
+  * This Odd_ML = -0.5 AH for the favorite
+
+STEP 3: Calculate +0.5 AH reference point
+  * Odds_Plus05 = 100 / (Favorite_Pct + P_Empate)
+
+STEP 4: Find the AH line with odds closest to 2.0 (target [1.97, 2.03])
+  * -0.5 AH is priced at Odd_ML
+  * For each -0.25 step (more negative): odds *= 1.15
+  * For each +0.25 step (more positive): odds *= 0.85
+  * No iteration needed - the step count is:
+    - n = log(2.0 / Odd_ML) / log(1.15)    if Odd_ML < 2.0 (lines below -0.5)
+    - n = log(2.0 / Odd_ML) / log(0.85)    if Odd_ML > 2.0 (lines above -0.5)
+  * Compare the two whole steps around n and keep the one closer to 2.0
+  * Only lines from -3.0 to +3.0 (favorite's perspective); document if outside the target
+
+STEP 5: Return Fair AH Line
+  * If home is favorite: line is negative (e.g., -1.25)
+  * If away is favorite: line is positive for home (e.g., +0.75)
+  * Include Delta = Raw_Casa - Raw_Vis for reference
+
+"""
+
+
+def test_layer_1_text_and_nesting():
+    start = YUDOR_ANALYSIS_INSTRUCTIONS.index("LAYER 1:")
+    end = YUDOR_ANALYSIS_INSTRUCTIONS.index("LAYER 2:")
+    assert YUDOR_ANALYSIS_INSTRUCTIONS[start:end] == LAYER_1
+
+
+def test_user_message_holds_only_match_data():
+    # The message only depends on the consolidated data, not on orchestrator state
+    orchestrator = object.__new__(YudorOrchestrator)
+    message = orchestrator._yudor_user_message({"game_id": "flamengo_palmeiras_20251122"})
+
+    assert "MATCH ID: flamengo_palmeiras_20251122" in message
+    assert '"game_id":"flamengo_palmeiras_20251122"' in message.replace(" ", "")
+    assert "LAYER 1:" not in message and "OUTPUT ONLY VALID JSON" not in message